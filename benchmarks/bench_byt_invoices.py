@@ -0,0 +1,81 @@
+"""Benchmark: creating BytInvoice objects from monthly Invoice responses.
+
+Usage: python benchmarks/bench_byt_invoices.py [years] [repeats]
+"""
+
+import sys
+import timeit
+from datetime import date
+
+import attr
+
+from inter_rao_energosbyt.actions.sql.byt import Invoice
+from inter_rao_energosbyt.presets.byt import BYT_INVOICE_SECTION, BytInvoice
+
+
+def make_invoice_rows(years: int):
+    labels = [
+        field.metadata[BYT_INVOICE_SECTION]
+        for field in attr.fields(BytInvoice)
+        if BYT_INVOICE_SECTION in field.metadata
+    ]
+    detail = [
+        {"nm_value": "Электроэнергия", "vl_value": 1234.5, "nm_mu": "руб.", "nm_format": ""},
+        {"nm_value": "Объем", "vl_value": 250.0, "nm_mu": "кВт*ч", "nm_format": ""},
+        {"nm_value": "Тариф", "vl_value": 4.938, "nm_mu": "руб./кВт*ч", "nm_format": ""},
+    ]
+    start_year = date.today().year - years
+
+    return [
+        Invoice.from_response(
+            {
+                "id_korr": index,
+                "dt_period": date(start_year + index // 12, index % 12 + 1, 1).isoformat(),
+                "sm_total": 1234.5,
+                "data_common": [
+                    {
+                        "nm_value": label,
+                        "vl_value": 100.0 + index,
+                        "nm_mu": "руб.",
+                        "nm_format": "",
+                    }
+                    for label in labels + ["Неизвестный раздел"]
+                ],
+                "data_detail": [detail, detail],
+            }
+        )
+        for index in range(years * 12)
+    ]
+
+
+def legacy_from_response(data: Invoice) -> BytInvoice:
+    # Previous behaviour: section index rebuilt for every invoice
+    invoice_sections = {}
+    for field in attr.fields(BytInvoice):
+        invoice_section = field.metadata.get(BYT_INVOICE_SECTION)
+        if invoice_section:
+            invoice_sections[invoice_section] = field.name
+    return BytInvoice._from_response(None, data, invoice_sections)
+
+
+def main() -> None:
+    years = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    rows = make_invoice_rows(years)
+
+    assert [legacy_from_response(x) for x in rows] == BytInvoice.from_responses(None, rows)
+
+    for name, func in (
+        ("legacy per-row", lambda: [legacy_from_response(x) for x in rows]),
+        ("from_response", lambda: [BytInvoice.from_response(None, x) for x in rows]),
+        ("from_responses", lambda: BytInvoice.from_responses(None, rows)),
+    ):
+        elapsed = min(timeit.repeat(func, number=repeats, repeat=3))
+        print(
+            "%-16s %d invoices: %.3f ms per batch"
+            % (name, len(rows), elapsed * 1000 / repeats)
+        )
+
+
+if __name__ == "__main__":
+    main()
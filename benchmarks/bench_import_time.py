@@ -0,0 +1,47 @@
+"""Benchmark: interpreter startup cost of importing package entry points.
+
+Every statement runs in a fresh interpreter, so module caches do not interfere.
+
+Usage: python benchmarks/bench_import_time.py [repeats]
+"""
+
+import subprocess
+import sys
+import time
+
+STATEMENTS = (
+    ("baseline", "pass"),
+    ("package", "import inter_rao_energosbyt"),
+    ("api registry", "from inter_rao_energosbyt.api import API_CLASSES_BY_PROVIDER"),
+    ("interfaces", "import inter_rao_energosbyt.interfaces"),
+    ("single region", "from inter_rao_energosbyt.api import get_api_class; get_api_class(1)"),
+    (
+        "all regions",
+        "import importlib, inter_rao_energosbyt.api as api\n"
+        "for name in api.__all__[2:]: importlib.import_module('inter_rao_energosbyt.api.' + name)",
+    ),
+)
+
+
+def measure(statement: str, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        timings.append(time.perf_counter() - started_at)
+    return min(timings)
+
+
+def main() -> None:
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    baseline = None
+    for name, statement in STATEMENTS:
+        elapsed = measure(statement, repeats)
+        if baseline is None:
+            baseline = elapsed
+        print("%-14s %.1f ms (+%.1f ms)" % (name, elapsed * 1000, (elapsed - baseline) * 1000))
+
+
+if __name__ == "__main__":
+    main()
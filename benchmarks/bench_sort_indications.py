@@ -0,0 +1,62 @@
+"""Benchmark: sorting indications by comparison versus by precomputed keys.
+
+Usage: python benchmarks/bench_sort_indications.py [count] [repeats]
+"""
+
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta
+from operator import attrgetter
+
+from inter_rao_energosbyt.actions.sql.abonent import AbonentIndications
+from inter_rao_energosbyt.presets.smorodina import SmorodinaIndication
+
+
+def make_indications(count: int):
+    start = datetime(2000, 1, 1)
+    rng = random.Random(0)
+    indications = []
+
+    for index in range(count):
+        data = AbonentIndications.from_response(
+            {
+                "dt_indication": (start + timedelta(hours=rng.randrange(count))).isoformat(),
+                "id_counter": 1,
+                "id_counter_zn": index % 3 + 1,
+                "id_indication": index,
+                "id_service": 1,
+                "nm_counter_zn": "Т%d" % (index % 3 + 1),
+                "nm_factory": "123456",
+                "nm_indication_state": "Принято",
+                "nm_pu": "ПУ",
+                "nm_service": "Электроэнергия",
+                "nn_pu": 1,
+                "pr_sign_inclusion": 1,
+                "vl_indication": rng.random() * 10000,
+            }
+        )
+        indications.append(SmorodinaIndication(None, data))
+
+    return indications
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    indications = make_indications(count)
+
+    assert sorted(indications) == sorted(indications, key=attrgetter("sort_key"))
+
+    for name, func in (
+        ("sorted()", lambda: sorted(indications)),
+        ("sorted(key=)", lambda: sorted(indications, key=attrgetter("sort_key"))),
+        ("max()", lambda: max(indications)),
+        ("max(key=)", lambda: max(indications, key=attrgetter("sort_key"))),
+    ):
+        elapsed = min(timeit.repeat(func, number=repeats, repeat=3))
+        print("%-14s %d indications: %.2f ms" % (name, count, elapsed * 1000 / repeats))
+
+
+if __name__ == "__main__":
+    main()
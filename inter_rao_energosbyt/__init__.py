@@ -2,11 +2,21 @@ __all__ = (
     "actions",
     "api",
     "presets",
+    "submission",
+    "cache",
     "const",
     "converters",
     "enums",
     "exceptions",
+    "history",
     "interfaces",
+    "plugin_config",
     "util",
 )
 
+from inter_rao_energosbyt.util import lazy_submodules
+
+_SUBMODULES = frozenset(__all__)
+
+
+__getattr__, __dir__ = lazy_submodules(__name__, _SUBMODULES, globals())
@@ -13,6 +13,7 @@ from types import MappingProxyType
 from typing import (
     Any,
     ClassVar,
+    Dict,
     Generic,
     Iterable,
     List,
@@ -27,9 +28,12 @@ from typing import (
 
 import attr
 
+from inter_rao_energosbyt.util import lazy_submodules
+
 _TDataMapping = TypeVar("_TDataMapping", bound=Mapping[str, Any])
 _TDataMapping_co = TypeVar("_TDataMapping_co", bound="DataMapping", covariant=True)
 META_SOURCE_DATA_KEY = "meta_source_data_key"
+_SUBMODULES = frozenset(("sql", "auth", "invalidate"))
 
 
 # Type vars for requests
@@ -181,7 +185,30 @@ class DataMapping(Mapping[str, Any]):
 
         return cls(**init_args)  # type: ignore[call-arg]
 
+    def to_response(self) -> Dict[str, Any]:
+        """Convert mapping back into response data accepted by `from_response`."""
+        data = {}
+
+        for field in attr.fields(self.__class__):
+            data_field = field.metadata.get(META_SOURCE_DATA_KEY, field.name)
+            data[data_field] = _value_to_response(getattr(self, field.name))
+
+        return data
+
+
+def _value_to_response(value: Any) -> Any:
+    if isinstance(value, DataMapping):
+        return value.to_response()
+    if isinstance(value, Mapping):
+        return {key: _value_to_response(sub_value) for key, sub_value in value.items()}
+    if isinstance(value, (list, tuple)):
+        return list(map(_value_to_response, value))
+    return value
+
 
 @attr.s(kw_only=True, frozen=True, slots=True)
 class ActionRequest(DataMapping):
     pass
+
+
+__getattr__, __dir__ = lazy_submodules(__name__, _SUBMODULES, globals())
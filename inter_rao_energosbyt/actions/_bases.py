@@ -1,6 +1,6 @@
 import re
 from abc import ABC
-from typing import Dict, Generic, Optional, Type, TypeVar
+from typing import Dict, Generic, Iterator, List, Optional, Tuple, Type, TypeVar
 
 import attr
 
@@ -48,6 +48,31 @@ class HierarchicalItemsBase(DataMapping, Generic[_TChildrenTypeValue, _TChildren
                 tuple(map(child_cls.from_response, container)),
             )
 
+    def iter_tree(
+        self,
+    ) -> Iterator[Tuple[Tuple["HierarchicalItemsBase", ...], "HierarchicalItemsBase"]]:
+        """Iterate over the tree (this item included) depth-first, without recursion.
+
+        Yields `(path, node)` pairs, where `path` contains ancestors of the node
+        starting with this item. Nodes are produced in pre-order.
+        """
+        stack: List[Tuple[Tuple[HierarchicalItemsBase, ...], HierarchicalItemsBase]] = [
+            ((), self)
+        ]
+
+        while stack:
+            path, node = stack.pop()
+            yield path, node
+
+            container_key = getattr(node, "_children_container_key", NotImplemented)
+            if container_key is NotImplemented:
+                continue
+
+            children = getattr(node, container_key, None)
+            if children:
+                children_path = path + (node,)
+                stack.extend((children_path, child) for child in reversed(children))
+
     @classmethod
     def register_parse_type(
         cls, identifier: _TChildrenTypeValue, parse_type: Type[_TChildrenTypeClass]
@@ -27,4 +27,11 @@ __all__ = (
     "view",
 )
 
+from inter_rao_energosbyt.util import lazy_submodules
+
 ACTION_SQL = "sql"
+
+_SUBMODULES = frozenset(__all__[1:])
+
+
+__getattr__, __dir__ = lazy_submodules(__name__, _SUBMODULES, globals())
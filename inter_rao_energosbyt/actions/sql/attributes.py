@@ -1,5 +1,17 @@
 import re
-from typing import Any, ClassVar, Iterable, Mapping, Optional, TYPE_CHECKING, Tuple
+from functools import lru_cache
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Pattern,
+    TYPE_CHECKING,
+    Tuple,
+)
 
 import attr
 
@@ -31,6 +43,22 @@ def _conveter__attribute__vl_dict(
     return tuple(map(AttributeValue.from_response, value))
 
 
+@lru_cache(maxsize=256)
+def _compile_attribute_regexp(regexp_format: str) -> Pattern[str]:
+    return re.compile(regexp_format)
+
+
+@lru_cache(maxsize=256)
+def _get_attribute_enum_lookup(enum_values: Tuple[AttributeValue, ...]) -> Mapping[str, str]:
+    # Both codes and labels resolve to codes; earlier values take precedence
+    lookup: Dict[str, str] = {}
+    for enum_value in enum_values:
+        str_code = str(enum_value.nn_code)
+        lookup.setdefault(str_code, str_code)
+        lookup.setdefault(enum_value.nm_value, str_code)
+    return lookup
+
+
 @attr.s(kw_only=True, frozen=True, slots=True)
 class Attribute(DataMapping):
     kd_attr_group: Optional[int] = attr.ib(converter=conv_int_optional, default=None)
@@ -90,21 +118,14 @@ class Attribute(DataMapping):
             value = value.replace(",", ".").replace(" ", "").replace("₽", "")
 
         regexp_format = self.nm_regexp or self.nm_format_regexp
-        if regexp_format and not re.match(regexp_format, value):
+        if regexp_format and not _compile_attribute_regexp(regexp_format).match(value):
             raise ValueError(self.nm_regexp_error or "invalid regex match", self.nm_column)
 
         enum_values = self.vl_dict
         if enum_values:
-            enum_found = False
-            if value is not None:
-                for enum_value in enum_values:
-                    str_code = str(enum_value.nn_code)
-                    if str_code == value or enum_value.nm_value == value:
-                        enum_found = True
-                        value = str_code
-                        break
-
-            if not enum_found:
+            try:
+                value = _get_attribute_enum_lookup(enum_values)[value]
+            except KeyError:
                 raise ValueError(
                     "value must match enum: %s"
                     % (
@@ -122,6 +143,24 @@ class Attribute(DataMapping):
         return int(self.kd_attribute)
 
 
+def validate_many(
+    attributes: Iterable[Attribute], values: Mapping[str, Any]
+) -> List[Tuple[Attribute, str]]:
+    """Validate values against a whole attribute set.
+
+    :param attributes: Attributes to validate against
+    :param values: Values keyed by lower-case column names (missing values are
+                   validated as `None`, i.e. defaults and requirements apply)
+    :return: Attributes paired with validated values (attributes without values omitted)
+    """
+    validated = []
+    for attribute in attributes:
+        value = attribute.validate(values.get(attribute.nm_column.lower()))
+        if value is not None:
+            validated.append((attribute, value))
+    return validated
+
+
 # noinspection DuplicatedCode
 def _conveter__attribute_response__attributes(
     value: Optional[Iterable[Mapping[str, Any]]]
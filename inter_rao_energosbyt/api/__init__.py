@@ -1,4 +1,6 @@
 __all__ = (
+    "API_CLASSES_BY_PROVIDER",
+    "get_api_class",
     "altai",
     "bashkortostan",
     "moscow",
@@ -9,3 +11,47 @@ __all__ = (
     "tomsk",
     "volga",
 )
+
+import importlib
+from types import MappingProxyType
+from typing import Mapping, SupportsInt, TYPE_CHECKING, Tuple, Type
+
+from inter_rao_energosbyt.enums import ProviderType
+from inter_rao_energosbyt.util import lazy_submodules
+
+if TYPE_CHECKING:
+    from inter_rao_energosbyt.interfaces import BaseEnergosbytAPI
+
+_SUBMODULES = frozenset(__all__[2:])
+
+API_CLASSES_BY_PROVIDER: Mapping[int, Tuple[str, str]] = MappingProxyType(
+    {
+        ProviderType.MES: ("moscow", "MoscowEnergosbytAPI"),
+        ProviderType.MOE: ("moscow", "MoscowEnergosbytAPI"),
+        ProviderType.TKO: ("moscow", "MoscowEnergosbytAPI"),
+        ProviderType.KSG: ("moscow", "MoscowEnergosbytAPI"),
+        ProviderType.TMK_NRG: ("tomsk", "TomskEnergosbytAPI"),
+        ProviderType.TMK_RTS: ("tomsk", "TomskEnergosbytAPI"),
+        ProviderType.UFA: ("bashkortostan", "BashkortostanEnergosbytAPI"),
+        ProviderType.VLG: ("sevesk", "SeveskEnergosbytAPI"),
+        ProviderType.ORL: ("oryol", "OryolEnergosbytAPI"),
+        ProviderType.ORL_EPD: ("oryol", "OryolEnergosbytAPI"),
+        ProviderType.ALT: ("altai", "AltaiEnergosbytAPI"),
+        ProviderType.TMB: ("tambov", "TambovEnergosbytAPI"),
+        ProviderType.VLD: ("volga", "VolgaEnergosbytAPI"),
+        ProviderType.SAR: ("saratov", "SaratovEnergosbytAPI"),
+    }
+)
+"""Provider type -> (regional module name, API class name)"""
+
+
+def get_api_class(provider_type: SupportsInt) -> Type["BaseEnergosbytAPI"]:
+    """Import regional module serving given provider and return its API class."""
+    try:
+        module_name, class_name = API_CLASSES_BY_PROVIDER[int(provider_type)]
+    except KeyError:
+        raise LookupError("no API available for provider type %s" % (provider_type,))
+    return getattr(importlib.import_module("." + module_name, __name__), class_name)
+
+
+__getattr__, __dir__ = lazy_submodules(__name__, _SUBMODULES, globals())
@@ -8,7 +8,7 @@ __all__ = (
 import asyncio
 import logging
 from datetime import tzinfo
-from typing import ClassVar, List, Optional, Tuple, Union
+from typing import Any, ClassVar, Dict, List, Mapping, Optional, Tuple, Union
 
 import pytz
 
@@ -136,6 +136,21 @@ class TMKNRGAccount(
             self._byt_update_future = None
             return result
 
+    def _get_preset_flags(self, preset: str) -> Dict[str, Any]:
+        if preset == "byt":
+            return {"byt_only": self._byt_only}
+        return super()._get_preset_flags(preset)
+
+    def _restore_preset_parameters(
+        self, preset: str, parameters: Tuple[str, str], flags: Mapping[str, Any]
+    ) -> None:
+        if preset == "byt":
+            self._byt_plugin_provider = parameters[1]
+            byt_only = flags.get("byt_only")
+            if byt_only is not None:
+                self._byt_only = bool(byt_only)
+        super()._restore_preset_parameters(preset, parameters, flags)
+
     async def async_get_payments(
         self, start: AnyDateArg = None, end: AnyDateArg = None
     ) -> List[Union[ViewPayment, BytPayment]]:
@@ -0,0 +1,102 @@
+__all__ = ("AsyncTTLCache",)
+
+import asyncio
+import functools
+import time
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+_TKey = TypeVar("_TKey", bound=Hashable)
+_TValue = TypeVar("_TValue")
+
+
+class AsyncTTLCache(Generic[_TKey, _TValue]):
+    """Keyed cache for coroutine results with expiry and single-flight population.
+
+    Concurrent requests for a missing key share a single factory call, which
+    runs in its own task: cancelling a caller does not cancel the call for the
+    others. Failed calls are not cached.
+
+    :param ttl: Seconds a stored value remains valid (`None` for no expiry)
+    """
+
+    __slots__ = ("ttl", "_values", "_futures")
+
+    def __init__(self, ttl: Optional[float] = None) -> None:
+        self.ttl: Optional[float] = ttl
+        self._values: Dict[_TKey, Tuple[float, _TValue]] = {}
+        self._futures: Dict[_TKey, asyncio.Future] = {}
+
+    def __contains__(self, key: _TKey) -> bool:
+        return self._get_valid(key) is not None
+
+    def _get_valid(self, key: _TKey) -> Optional[Tuple[float, _TValue]]:
+        try:
+            entry = self._values[key]
+        except KeyError:
+            return None
+        if self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+            del self._values[key]
+            return None
+        return entry
+
+    def get(self, key: _TKey, default: Optional[_TValue] = None) -> Optional[_TValue]:
+        """Retrieve stored value without populating the cache."""
+        entry = self._get_valid(key)
+        return default if entry is None else entry[1]
+
+    def get_age(self, key: _TKey) -> Optional[float]:
+        """Seconds passed since stored value was set (`None` when missing or expired)."""
+        entry = self._get_valid(key)
+        return None if entry is None else time.monotonic() - entry[0]
+
+    def set(self, key: _TKey, value: _TValue) -> None:
+        self._values[key] = (time.monotonic(), value)
+
+    async def async_get(self, key: _TKey, factory: Callable[[], Awaitable[_TValue]]) -> _TValue:
+        """Retrieve value, awaiting `factory()` when it is missing or expired."""
+        entry = self._get_valid(key)
+        if entry is not None:
+            return entry[1]
+
+        return await asyncio.shield(self._get_flight(key, factory))
+
+    def _get_flight(self, key: _TKey, factory: Callable[[], Awaitable[_TValue]]) -> asyncio.Future:
+        # Factory runs in its own task, so cancelling any of the callers
+        # (including the one that started it) does not affect the others.
+        in_flight = self._futures.get(key)
+        if in_flight is None:
+            in_flight = asyncio.ensure_future(self._async_populate(key, factory))
+            in_flight.add_done_callback(functools.partial(self._flight_done, key))
+            self._futures[key] = in_flight
+        return in_flight
+
+    def _flight_done(self, key: _TKey, flight: asyncio.Future) -> None:
+        if self._futures.get(key) is flight:
+            del self._futures[key]
+        if not flight.cancelled():
+            # Exception is retrieved by waiters (if any), avoid "never retrieved" warnings
+            flight.exception()
+
+    async def _async_populate(
+        self, key: _TKey, factory: Callable[[], Awaitable[_TValue]]
+    ) -> _TValue:
+        value = await factory()
+        # Value is not stored if the key was invalidated while it was being fetched
+        if self._futures.get(key) is asyncio.current_task():
+            self.set(key, value)
+        return value
+
+    async def async_refresh(
+        self, key: _TKey, factory: Callable[[], Awaitable[_TValue]]
+    ) -> _TValue:
+        """Replace value with fresh `factory()` result, keeping current one until then."""
+        return await asyncio.shield(self._get_flight(key, factory))
+
+    def invalidate(self, key: Optional[_TKey] = None) -> None:
+        """Drop stored value for key (or all stored values)."""
+        if key is None:
+            self._values.clear()
+            self._futures.clear()
+        else:
+            self._values.pop(key, None)
+            self._futures.pop(key, None)
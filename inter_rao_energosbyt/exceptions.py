@@ -20,6 +20,10 @@ class ResponseCodeError(EnergosbytException):
         return "Error [%d]: %s" % (int(self), self.args[1])
 
 
+class RequestTimeoutException(EnergosbytException):
+    """Request timed out (either locally or on the portal side)"""
+
+
 class QueryArgumentException(EnergosbytException):
     def __init__(self, query_argument: str, *args) -> None:
         super().__init__(query_argument, *args)
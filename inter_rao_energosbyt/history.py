@@ -0,0 +1,347 @@
+__all__ = (
+    "BaseHistoryStore",
+    "HistoryKind",
+    "MemoryHistoryStore",
+    "SQLiteHistoryStore",
+    "make_history_account_key",
+)
+
+import asyncio
+import functools
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    TYPE_CHECKING,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+import attr
+
+from inter_rao_energosbyt.actions import DataMapping
+from inter_rao_energosbyt.converters import conv_dtstr
+
+if TYPE_CHECKING:
+    from inter_rao_energosbyt.interfaces import Account
+
+_TDataMapping = TypeVar("_TDataMapping", bound=DataMapping)
+_T = TypeVar("_T")
+
+HistoryRecord = Tuple[str, float, Mapping[str, Any]]
+"""Stored record: (record identifier, POSIX timestamp, response data)"""
+
+DEFAULT_HISTORY_OVERLAP = timedelta(days=45)
+
+
+def make_history_account_key(account: "Account") -> str:
+    api = account.api
+    return "%s:%s:%d" % (api.__class__.__name__, api.username, account.id)
+
+
+def _to_timestamp(value: datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    try:
+        return value.timestamp()
+    except (OverflowError, ValueError):
+        return datetime.min.replace(tzinfo=timezone.utc).timestamp()
+
+
+def _from_timestamp(value: float, tz: Optional[Any] = None) -> datetime:
+    # Naive datetimes are treated as UTC (see `_to_timestamp`)
+    if tz is None:
+        return datetime.fromtimestamp(value, tz=timezone.utc).replace(tzinfo=None)
+    return datetime.fromtimestamp(value, tz=tz)
+
+
+@attr.s(kw_only=True, frozen=True, slots=True)
+class HistoryKind(Generic[_TDataMapping]):
+    """Description of a dated response type kept within history store.
+
+    :param name: Unique storage name for records of this kind
+    :param data_cls: Response mapping class used to restore stored records
+    :param get_id: Record identity extractor (records with same identity replace each other)
+    :param get_time: Record timestamp string extractor
+    """
+
+    name: str = attr.ib()
+    data_cls: Type[_TDataMapping] = attr.ib()
+    get_id: Callable[[_TDataMapping], str] = attr.ib()
+    get_time: Callable[[_TDataMapping], str] = attr.ib()
+
+    def make_ids(self, datum: Iterable[_TDataMapping]) -> List[str]:
+        """Identities of records within a single response.
+
+        Rows that are indistinguishable by `get_id` (e.g. two equal payments on
+        the same day) are numbered in order of appearance, so they are kept as
+        separate records.
+        """
+        get_id = self.get_id
+        occurrences: Dict[str, int] = {}
+        record_ids = []
+        for data in datum:
+            record_id = get_id(data)
+            occurrence = occurrences.get(record_id, 0)
+            occurrences[record_id] = occurrence + 1
+            record_ids.append(record_id if occurrence == 0 else "%s#%d" % (record_id, occurrence))
+        return record_ids
+
+    def make_record(
+        self, data: _TDataMapping, tz: Optional[Any] = None, record_id: Optional[str] = None
+    ) -> HistoryRecord:
+        record_time = conv_dtstr(self.get_time(data))
+        if record_time.tzinfo is None and tz is not None:
+            localize = getattr(tz, "localize", None)  # pytz timezones
+            record_time = (
+                record_time.replace(tzinfo=tz) if localize is None else localize(record_time)
+            )
+        if record_id is None:
+            record_id = self.get_id(data)
+        return record_id, _to_timestamp(record_time), data.to_response()
+
+
+class BaseHistoryStore(ABC):
+    """Local append-only storage for dated account records.
+
+    Records are kept per account and per record kind. Along with records, store
+    keeps track of the continuous time range that has been synchronized with the
+    portal, so that subsequent requests only fetch the delta since the end of that
+    range (minus `overlap`, which catches late corrections of recent records).
+    """
+
+    def __init__(self, overlap: timedelta = DEFAULT_HISTORY_OVERLAP) -> None:
+        self.overlap: timedelta = overlap
+
+    @abstractmethod
+    def get_coverage(self, account_key: str, kind: str) -> Optional[Tuple[float, float]]:
+        """Retrieve synchronized range (as POSIX timestamps)"""
+
+    @abstractmethod
+    def set_coverage(self, account_key: str, kind: str, start: float, end: float) -> None:
+        """Store synchronized range (as POSIX timestamps)"""
+
+    @abstractmethod
+    def put_records(self, account_key: str, kind: str, records: Iterable[HistoryRecord]) -> None:
+        """Insert records, replacing existing ones with the same identifier"""
+
+    @abstractmethod
+    def get_records(
+        self, account_key: str, kind: str, start: float, end: float
+    ) -> List[Mapping[str, Any]]:
+        """Retrieve records within range (inclusive), ordered by time"""
+
+    @abstractmethod
+    def clear(self, account_key: Optional[str] = None, kind: Optional[str] = None) -> None:
+        """Remove stored records and coverage data"""
+
+    async def _async_call(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Perform storage operation from within event loop (directly by default)."""
+        return func(*args)
+
+    async def async_fetch(
+        self,
+        account: "Account",
+        kind: HistoryKind[_TDataMapping],
+        start: datetime,
+        end: datetime,
+        async_fetcher: Callable[[datetime, datetime], Awaitable[Iterable[_TDataMapping]]],
+    ) -> List[_TDataMapping]:
+        """Retrieve records for the range, fetching only what is missing from store.
+
+        :param account: Account the records belong to
+        :param kind: Records kind
+        :param start: Range start
+        :param end: Range end
+        :param async_fetcher: Portal request performer for arbitrary ranges
+        """
+        account_key = make_history_account_key(account)
+        tz = getattr(account, "timezone", None)
+        start_ts, end_ts = _to_timestamp(start), _to_timestamp(end)
+
+        fetch_ranges: List[Tuple[datetime, datetime]] = []
+        coverage = await self._async_call(self.get_coverage, account_key, kind.name)
+
+        if coverage is None:
+            fetch_ranges.append((start, end))
+            new_coverage = (start_ts, end_ts)
+        else:
+            covered_start, covered_end = coverage
+            if start_ts < covered_start:
+                fetch_ranges.append((start, _from_timestamp(covered_start, end.tzinfo)))
+
+            # Forward extension always starts within the synchronized range, so that
+            # coverage never spans a gap that has not been fetched.
+            delta_start = _from_timestamp(covered_end, end.tzinfo) - self.overlap
+            if end_ts > _to_timestamp(delta_start):
+                fetch_ranges.append((delta_start, end))
+
+            new_coverage = (min(start_ts, covered_start), max(end_ts, covered_end))
+
+        for fetch_start, fetch_end in fetch_ranges:
+            datum = list(await async_fetcher(fetch_start, fetch_end))
+            await self._async_call(
+                self.put_records,
+                account_key,
+                kind.name,
+                [
+                    kind.make_record(data, tz, record_id)
+                    for data, record_id in zip(datum, kind.make_ids(datum))
+                ],
+            )
+
+        await self._async_call(self.set_coverage, account_key, kind.name, *new_coverage)
+
+        records = await self._async_call(
+            self.get_records, account_key, kind.name, start_ts, end_ts
+        )
+        return list(map(kind.data_cls.from_response, records))
+
+
+class MemoryHistoryStore(BaseHistoryStore):
+    """History store kept in process memory"""
+
+    def __init__(self, overlap: timedelta = DEFAULT_HISTORY_OVERLAP) -> None:
+        super().__init__(overlap)
+        self._coverage: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        self._records: Dict[Tuple[str, str], Dict[str, Tuple[float, Mapping[str, Any]]]] = {}
+
+    def get_coverage(self, account_key: str, kind: str) -> Optional[Tuple[float, float]]:
+        return self._coverage.get((account_key, kind))
+
+    def set_coverage(self, account_key: str, kind: str, start: float, end: float) -> None:
+        self._coverage[(account_key, kind)] = (start, end)
+
+    def put_records(self, account_key: str, kind: str, records: Iterable[HistoryRecord]) -> None:
+        stored = self._records.setdefault((account_key, kind), {})
+        for record_id, record_ts, record_data in records:
+            stored[record_id] = (record_ts, record_data)
+
+    def get_records(
+        self, account_key: str, kind: str, start: float, end: float
+    ) -> List[Mapping[str, Any]]:
+        stored = self._records.get((account_key, kind))
+        if not stored:
+            return []
+        return [
+            record_data
+            for record_ts, record_data in sorted(stored.values(), key=lambda x: x[0])
+            if start <= record_ts <= end
+        ]
+
+    def clear(self, account_key: Optional[str] = None, kind: Optional[str] = None) -> None:
+        for container in (self._coverage, self._records):
+            for key in list(container.keys()):
+                if (account_key is None or key[0] == account_key) and (
+                    kind is None or key[1] == kind
+                ):
+                    del container[key]
+
+
+class SQLiteHistoryStore(BaseHistoryStore):
+    """History store backed by an SQLite database file.
+
+    Within `async_fetch`, database operations are performed in the event loop's
+    default executor, so that queries and commits do not block the loop.
+    """
+
+    def __init__(self, path: str, overlap: timedelta = DEFAULT_HISTORY_OVERLAP) -> None:
+        super().__init__(overlap)
+        self.path: str = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+
+        with self._lock, self._connection:
+            self._connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS history_records (
+                    account_key TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    record_id TEXT NOT NULL,
+                    record_ts REAL NOT NULL,
+                    record_data TEXT NOT NULL,
+                    PRIMARY KEY (account_key, kind, record_id)
+                );
+                CREATE INDEX IF NOT EXISTS history_records_ts
+                    ON history_records (account_key, kind, record_ts);
+                CREATE TABLE IF NOT EXISTS history_coverage (
+                    account_key TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    start_ts REAL NOT NULL,
+                    end_ts REAL NOT NULL,
+                    PRIMARY KEY (account_key, kind)
+                );
+                """
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    async def _async_call(self, func: Callable[..., _T], *args: Any) -> _T:
+        return await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(func, *args)
+        )
+
+    def get_coverage(self, account_key: str, kind: str) -> Optional[Tuple[float, float]]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT start_ts, end_ts FROM history_coverage WHERE account_key = ? AND kind = ?",
+                (account_key, kind),
+            ).fetchone()
+        return None if row is None else (row[0], row[1])
+
+    def set_coverage(self, account_key: str, kind: str, start: float, end: float) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO history_coverage VALUES (?, ?, ?, ?)",
+                (account_key, kind, start, end),
+            )
+
+    def put_records(self, account_key: str, kind: str, records: Iterable[HistoryRecord]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO history_records VALUES (?, ?, ?, ?, ?)",
+                (
+                    (account_key, kind, record_id, record_ts, json.dumps(record_data))
+                    for record_id, record_ts, record_data in records
+                ),
+            )
+
+    def get_records(
+        self, account_key: str, kind: str, start: float, end: float
+    ) -> List[Mapping[str, Any]]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT record_data FROM history_records "
+                "WHERE account_key = ? AND kind = ? AND record_ts BETWEEN ? AND ? "
+                "ORDER BY record_ts",
+                (account_key, kind, start, end),
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def clear(self, account_key: Optional[str] = None, kind: Optional[str] = None) -> None:
+        conditions, arguments = [], []
+        if account_key is not None:
+            conditions.append("account_key = ?")
+            arguments.append(account_key)
+        if kind is not None:
+            conditions.append("kind = ?")
+            arguments.append(kind)
+        where = (" WHERE " + " AND ".join(conditions)) if conditions else ""
+
+        with self._lock, self._connection:
+            for table in ("history_records", "history_coverage"):
+                self._connection.execute("DELETE FROM " + table + where, arguments)
@@ -20,26 +20,40 @@ __all__ = (
     "AbstractMeter",
     "AbstractMeterZone",
     "AbstractAccountWithMeterHistory",
+    "AccountAddOutcome",
+    "AccountAddRequest",
+    "AccountChangeEvent",
+    "AccountChangeType",
     "AccountID",
+    "AccountRefreshPlan",
+    "AccountRefreshReason",
+    "DatedLastSearchStrategy",
     "SupportedAccountsType",
 )
 import asyncio
+import functools
 import inspect
 import json
 import logging
 import re
+import time
 from abc import ABC, abstractmethod
 from collections import ChainMap
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from datetime import date, datetime, timedelta, tzinfo
+from enum import Enum
 from types import MappingProxyType
 from typing import (
     Any,
+    AsyncIterator,
     Awaitable,
     Callable,
     ClassVar,
     Collection,
     Dict,
     Generic,
+    Hashable,
     Iterable,
     List,
     Mapping,
@@ -49,6 +63,7 @@ from typing import (
     Set,
     SupportsFloat,
     SupportsInt,
+    TYPE_CHECKING,
     Tuple,
     Type,
     TypeVar,
@@ -58,34 +73,34 @@ from typing import (
 )
 from urllib import parse
 
-import aiohttp
-from dateutil.relativedelta import relativedelta
+import attr
 
 from inter_rao_energosbyt.actions import ActionResult, DataMapping
 from inter_rao_energosbyt.actions.auth import Login
 from inter_rao_energosbyt.actions.invalidate import ProfileExit
-from inter_rao_energosbyt.actions.sql.attributes import Attribute, GetLSAttributes
-from inter_rao_energosbyt.actions.sql.core import Init
-from inter_rao_energosbyt.actions.sql.generic import GetContactPhone
-from inter_rao_energosbyt.actions.sql.ls_generic import IndicationAndPayAvail
-from inter_rao_energosbyt.actions.sql.ls_management import (
-    GetLSGroups,
-    GetLSQuestions,
-    LSAdd,
-    LSConfirm,
-    LSDelete,
-    LSList,
-    LSSaveDescription,
-    LSSetGroup,
-)
+from inter_rao_energosbyt.cache import AsyncTTLCache
 from inter_rao_energosbyt.const import DEFAULT_USER_AGENT
+from inter_rao_energosbyt.converters import conv_dtstr
 from inter_rao_energosbyt.enums import ERROR_MESSAGES, ProviderType, ResponseCodes, ServiceType
-from inter_rao_energosbyt.exceptions import EnergosbytException, UnsupportedAccountException
+from inter_rao_energosbyt.exceptions import (
+    EnergosbytException,
+    RequestTimeoutException,
+    UnsupportedAccountException,
+)
 from inter_rao_energosbyt.util import (
     AnyDateArg,
     SupportsLessThan,
 )
 
+if TYPE_CHECKING:
+    import aiohttp
+
+    from inter_rao_energosbyt.actions.sql.attributes import Attribute
+    from inter_rao_energosbyt.actions.sql.ls_generic import IndicationAndPayAvail
+    from inter_rao_energosbyt.actions.sql.ls_management import LSAdd, LSList
+    from inter_rao_energosbyt.history import BaseHistoryStore, HistoryKind
+    from inter_rao_energosbyt.plugin_config import BasePluginConfigStore
+
 MeterID = str
 AccountID = int
 
@@ -108,6 +123,12 @@ class WithAccount(ABC, Generic[_TAccount]):
 _TAPI = TypeVar("_TAPI", bound="BaseEnergosbytAPI")
 
 
+def _get_sort_key(item: Any) -> Any:
+    # Items providing precomputed ordering keys are compared by them
+    sort_key = getattr(item, "sort_key", None)
+    return item if sort_key is None else sort_key
+
+
 class WithDatedRequests(ABC):
     __slots__ = ()
 
@@ -117,45 +138,273 @@ class WithDatedRequests(ABC):
         pass
 
     _RT_less_than = TypeVar("_RT_less_than", bound=SupportsLessThan)
+    _RT_data_mapping = TypeVar("_RT_data_mapping", bound=DataMapping)
+
+    async def _internal_async_fetch_dated(
+        self,
+        kind: "HistoryKind[_RT_data_mapping]",
+        start: "datetime",
+        end: "datetime",
+        async_fetcher: Callable[["datetime", "datetime"], Awaitable[Iterable[_RT_data_mapping]]],
+    ) -> Iterable[_RT_data_mapping]:
+        # Dated requests are only performed by accounts, which provide API object
+        history_store = getattr(self, "api").history_store
+
+        if self.dated_chunk_months:
+            async_fetcher = functools.partial(
+                self._internal_async_fetch_chunked, kind, async_fetcher=async_fetcher
+            )
+
+        if history_store is None:
+            return await async_fetcher(start, end)
+
+        return await history_store.async_fetch(self, kind, start, end, async_fetcher)
+
+    dated_chunk_months: ClassVar[Optional[int]] = None
+    """Split long dated requests into windows of this many months (disabled by default)"""
+    dated_chunk_max_splits: ClassVar[int] = 3
+    dated_chunk_max_windows: ClassVar[int] = 8
+
+    async def _internal_async_fetch_chunked(
+        self,
+        kind: "HistoryKind[_RT_data_mapping]",
+        start: "datetime",
+        end: "datetime",
+        async_fetcher: Callable[["datetime", "datetime"], Awaitable[Iterable[_RT_data_mapping]]],
+    ) -> List[_RT_data_mapping]:
+        """Fetch range in concurrent windows of `dated_chunk_months` months.
+
+        At most `dated_chunk_max_windows` windows are requested, the oldest one
+        spanning the rest of the range.
+
+        Windows share their boundaries, and items found in multiple windows are
+        merged by identity. A window that times out is split in half, at most
+        `dated_chunk_max_splits` times over.
+
+        :param kind: Items kind (provides item identities)
+        :param start: Range start
+        :param end: Range end
+        :param async_fetcher: Portal request performer for arbitrary ranges
+        """
+        from dateutil.relativedelta import relativedelta
+
+        chunk_size = relativedelta(months=self.dated_chunk_months)
+        max_splits = self.dated_chunk_max_splits
+
+        async def _async_fetch_window(
+            window_start: "datetime", window_end: "datetime", splits: int = 0
+        ) -> List[List[WithDatedRequests._RT_data_mapping]]:
+            try:
+                return [list(await async_fetcher(window_start, window_end))]
+            except RequestTimeoutException:
+                if splits >= max_splits:
+                    raise
+            window_middle = window_start + (window_end - window_start) / 2
+            halves = await asyncio.gather(
+                _async_fetch_window(window_start, window_middle, splits + 1),
+                _async_fetch_window(window_middle, window_end, splits + 1),
+            )
+            return halves[0] + halves[1]
+
+        # Windows are laid out backwards from the end; the oldest window absorbs
+        # whatever remains of the range once the window limit is reached.
+        windows = []
+        window_end = end
+        while True:
+            try:
+                window_start = window_end - chunk_size
+            except (OverflowError, ValueError):
+                window_start = start
+            if window_start <= start or len(windows) + 1 >= self.dated_chunk_max_windows:
+                windows.append((start, window_end))
+                break
+            windows.append((window_start, window_end))
+            window_end = window_start
+        windows.reverse()
+
+        if len(windows) == 1:
+            parts = await _async_fetch_window(start, end)
+        else:
+            parts = [
+                part
+                for window_parts in await asyncio.gather(
+                    *(_async_fetch_window(*window) for window in windows)
+                )
+                for part in window_parts
+            ]
+
+        if len(parts) == 1:
+            return parts[0]
+
+        merged: Dict[Hashable, WithDatedRequests._RT_data_mapping] = {}
+        for part in parts:
+            for item_id, item in zip(kind.make_ids(part), part):
+                merged.setdefault(item_id, item)
+
+        # Merged items are ordered by time, in the direction the portal orders them
+        get_time = kind.get_time
+        descending = False
+        for part in parts:
+            if len(part) > 1:
+                first_time = conv_dtstr(get_time(part[0]))
+                last_time = conv_dtstr(get_time(part[-1]))
+                if first_time != last_time:
+                    descending = first_time > last_time
+                    break
+
+        return sorted(
+            merged.values(), key=lambda x: conv_dtstr(get_time(x)), reverse=descending
+        )
+
+    dated_last_search: ClassVar["DatedLastSearchStrategy"]
 
     async def _internal_async_find_dated_last(
         self,
         async_getter: Callable[["datetime", "datetime"], Awaitable[Iterable[_RT_less_than]]],
         end: AnyDateArg = None,
-        step: int = 3,
-        limit: int = 3,
-        with_min_date: bool = True,
+        step: Optional[int] = None,
+        limit: Optional[int] = None,
+        with_min_date: Optional[bool] = None,
         period_difference_in_seconds: bool = False,
+        strategy: Optional["DatedLastSearchStrategy"] = None,
+        hint_key: Optional[str] = None,
     ) -> Optional[_RT_less_than]:
+        """Find latest dated item using probe windows of growing size.
+
+        When history store is configured, probe windows are served by it, so
+        repeated searches only request data not yet synchronized.
+
+        :param async_getter: Dated items getter
+        :param end: Latest date to search items before
+        :param step: Override for `strategy.step`
+        :param limit: Override for `strategy.limit`
+        :param with_min_date: Override for `strategy.with_min_date`
+        :param period_difference_in_seconds: Getter works with second-precision ranges
+        :param strategy: Search strategy (default: `dated_last_search` of the class)
+        :param hint_key: Key to remember search hint under (default: qualified name of
+                         `async_getter` when it is a bound method, no hints otherwise)
+        """
+        if strategy is None:
+            strategy = self.dated_last_search
+
+        overrides = {
+            name: value
+            for name, value in (("step", step), ("limit", limit), ("with_min_date", with_min_date))
+            if value is not None
+        }
+        if overrides:
+            strategy = attr.evolve(strategy, **overrides)
+
+        from dateutil.relativedelta import relativedelta
+
         if end is None:
             end = datetime.now(tz=self.timezone)
-        elif isinstance(end, date):
+        elif not isinstance(end, datetime):
             end = datetime(end.year, end.month, end.day)
 
-        orig_end = end
         delta = timedelta(seconds=1) if period_difference_in_seconds else timedelta(microseconds=1)
-        for i in range(limit):
-            difference = step ** i
-            start = end - relativedelta(months=difference)
-            all_items = await async_getter(start, end)
 
-            try:
-                return next(iter(sorted(all_items, reverse=True)))
-            except StopIteration:
-                end = start - delta
-                continue
+        # Dated requests are only performed by accounts, which store hints.
+        # Hints are lookback lengths (relative to `end`), so that the hint
+        # window keeps its size as time goes on.
+        hints: Optional[Dict[str, "timedelta"]] = (
+            getattr(self, "_dated_last_hints", None) if strategy.use_hints else None
+        )
+        if hint_key is None:
+            getter_func = getattr(async_getter, "__func__", None)
+            if getter_func is not None:
+                hint_key = getter_func.__qualname__
 
-        if with_min_date:
-            start = datetime.min.replace(tzinfo=orig_end.tzinfo)
-            all_items = await async_getter(start, orig_end)
+        def _remember(window_start: "datetime") -> None:
+            if hints is not None and hint_key is not None:
+                hints[hint_key] = end - window_start
+
+        if hints is not None and hint_key in hints:
             try:
-                return next(iter(sorted(all_items, reverse=True)))
-            except StopIteration:
-                pass
+                hint_start = end - hints[hint_key]
+            except (OverflowError, ValueError):
+                hint_start = None
+            if hint_start is not None:
+                # Any non-empty window that ends at `end` contains the latest item
+                last_item = max(
+                    await async_getter(hint_start, end), key=_get_sort_key, default=None
+                )
+                if last_item is not None:
+                    return last_item
+            del hints[hint_key]
+
+        windows = []
+        window_end = end
+        for i in range(strategy.limit):
+            window_start = window_end - relativedelta(months=strategy.step**i)
+            windows.append((window_start, window_end))
+            window_end = window_start - delta
+
+        # Optional backward walk over pages of fixed size (at most `walk_pages`)
+        for _ in range(strategy.walk_pages):
+            try:
+                window_start = window_end - relativedelta(months=strategy.walk_months)
+            except (OverflowError, ValueError):
+                break
+            windows.append((window_start, window_end))
+            window_end = window_start - delta
+
+        if strategy.concurrent:
+            results = await asyncio.gather(*(async_getter(*window) for window in windows))
+        else:
+            results = None
+
+        for i, (window_start, window_end) in enumerate(windows):
+            if results is None:
+                all_items = await async_getter(window_start, window_end)
+            else:
+                all_items = results[i]
+            last_item = max(all_items, key=_get_sort_key, default=None)
+            if last_item is not None:
+                _remember(window_start)
+                return last_item
+
+        if strategy.with_min_date:
+            # Single request for whatever precedes probed windows
+            window_end = windows[-1][0] - delta if windows else end
+            last_item = max(
+                await async_getter(datetime.min.replace(tzinfo=end.tzinfo), window_end),
+                key=_get_sort_key,
+                default=None,
+            )
+            if last_item is not None:
+                # Item may be arbitrarily old; do not remember a hint spanning everything
+                return last_item
 
         return None
 
 
+@attr.s(kw_only=True, frozen=True, slots=True)
+class DatedLastSearchStrategy:
+    """Configuration for latest dated item search.
+
+    :param step: Probe window growth factor (in months)
+    :param limit: Amount of probe windows
+    :param concurrent: Issue all probe windows at once instead of one by one
+    :param use_hints: Remember where latest items were found, and probe from there first
+    :param walk_months: Size of backward walk pages (in months) after probes are exhausted
+    :param walk_pages: Maximum amount of backward walk pages (`0` disables walking)
+    :param with_min_date: Finally request everything preceding walked windows at once
+                          (unbounded request, disabled by default)
+    """
+
+    step: int = attr.ib(default=3)
+    limit: int = attr.ib(default=3)
+    concurrent: bool = attr.ib(default=False)
+    use_hints: bool = attr.ib(default=True)
+    walk_months: int = attr.ib(default=12)
+    walk_pages: int = attr.ib(default=5)
+    with_min_date: bool = attr.ib(default=False)
+
+
+WithDatedRequests.dated_last_search = DatedLastSearchStrategy()
+
+
 class WithCalculateIndications(ABC):
     __slots__ = ()
 
@@ -170,12 +419,26 @@ class WithCalculateIndications(ABC):
 
 
 class Account(Generic[_TAPI]):
-    __slots__ = ("data", "api", "_contact_phone")
+    __slots__ = (
+        "data",
+        "api",
+        "_contact_phone",
+        "_dated_last_hints",
+        "_meters_snapshot",
+        "_preset_parameters",
+        "_tariff_history_snapshot",
+    )
 
-    def __init__(self, api: _TAPI, data: LSList) -> None:
+    def __init__(self, api: _TAPI, data: "LSList") -> None:
         self.api: _TAPI = api
-        self.data: LSList = data
+        self.data: "LSList" = data
         self._contact_phone: Optional[str] = None
+        self._dated_last_hints: Dict[str, "timedelta"] = {}
+        self._meters_snapshot: Optional[AsyncTTLCache[None, Mapping[str, Any]]] = None
+        self._preset_parameters: AsyncTTLCache[str, Tuple[str, str]] = AsyncTTLCache(
+            self.preset_parameters_ttl
+        )
+        self._tariff_history_snapshot: Optional[AsyncTTLCache[None, Collection[Any]]] = None
 
     async def async_update_related(self) -> None:
         return None
@@ -280,11 +543,203 @@ class Account(Generic[_TAPI]):
         return self._contact_phone
 
     async def async_update_contact_phone(self) -> str:
-        response = await GetContactPhone.async_request(self.api, kd_provider=self.data.kd_provider)
-        contact_phone = response.nn_contact_phone or ""
+        contact_phone = await self.api.async_get_contact_phone(self.data.kd_provider)
         self._contact_phone = contact_phone
         return contact_phone
 
+    #################################################################################
+    # Preset parameters
+    #################################################################################
+
+    preset_parameters_ttl: ClassVar[Optional[float]] = 6 * 60 * 60
+
+    async def _internal_async_prepare_preset_parameters(
+        self,
+        preset: str,
+        async_updater: Callable[[], Awaitable[Tuple[Optional[str], Optional[str]]]],
+    ) -> Tuple[str, str]:
+        """Resolve (proxy, provider) plugin parameters, caching them for `preset_parameters_ttl`.
+
+        When API has a plugin configuration store, parameters stored by a previous
+        process are used right away and revalidated in background.
+
+        :param preset: Preset name (cache key)
+        :param async_updater: Preset parameters retrieval coroutine function
+        """
+        cache = self._preset_parameters
+        config_store = self.api.plugin_config_store
+
+        async def _async_resolve() -> Tuple[str, str]:
+            proxy, provider = await async_updater()
+
+            if proxy is None or provider is None:
+                raise EnergosbytException("Could not retrieve %s plugin paramters" % (preset,))
+
+            if config_store is not None:
+                config_store.save(self, preset, (proxy, provider), self._get_preset_flags(preset))
+
+            return proxy, provider
+
+        if config_store is not None and preset not in cache:
+            config = config_store.load(self, preset)
+            if config is not None:
+                parameters = config.proxy, config.provider
+                self._restore_preset_parameters(preset, parameters, config.flags)
+                cache.set(preset, parameters)
+                self.api.run_in_background(cache.async_refresh(preset, _async_resolve))
+                return parameters
+
+        return await cache.async_get(preset, _async_resolve)
+
+    def _get_preset_flags(self, preset: str) -> Dict[str, Any]:
+        """Additional resolved flags to persist along with preset parameters."""
+        return {}
+
+    def _restore_preset_parameters(
+        self, preset: str, parameters: Tuple[str, str], flags: Mapping[str, Any]
+    ) -> None:
+        """Apply persisted preset parameters and flags to account state."""
+        return None
+
+    def invalidate_preset_parameters(self, preset: Optional[str] = None) -> None:
+        """Force preset parameters (of all presets by default) to be resolved again.
+
+        Stored plugin configuration records are removed as well, so that they are
+        not restored in place of the fresh resolution.
+        """
+        self._preset_parameters.invalidate(preset)
+
+        config_store = self.api.plugin_config_store
+        if config_store is not None:
+            config_store.discard(self, preset)
+
+
+#################################################################################
+# Account adding
+#################################################################################
+
+
+@attr.s(kw_only=True, frozen=True, slots=True)
+class AccountAddRequest:
+    """Parameters for adding a single account.
+
+    :param nn_ls: Account number
+    :param kd_provider: Provider ID
+    :param kd_ls_owner_type: Account owner type
+    :param attributes: Other account attributes (keyed by column names)
+    """
+
+    nn_ls: str = attr.ib(converter=str)
+    kd_provider: Optional[int] = attr.ib(default=None)
+    kd_ls_owner_type: Optional[int] = attr.ib(default=None)
+    attributes: Mapping[str, Any] = attr.ib(converter=MappingProxyType, factory=dict)
+
+
+@attr.s(kw_only=True, frozen=True, slots=True)
+class AccountAddOutcome:
+    """Result of adding a single account within bulk operation.
+
+    :param request: Original request
+    :param response: Server response (absent if request failed before or during sending)
+    :param questions: Questions pending confirmation for the added account
+    :param error: Exception encountered while processing request
+    """
+
+    request: AccountAddRequest = attr.ib()
+    response: Optional["LSAdd"] = attr.ib(default=None)
+    questions: Mapping[int, str] = attr.ib(converter=MappingProxyType, factory=dict)
+    error: Optional[Exception] = attr.ib(default=None)
+
+    @property
+    def is_success(self) -> bool:
+        return self.error is None
+
+    @property
+    def account_id(self) -> Optional[AccountID]:
+        response = self.response
+        return None if response is None else response.id_service
+
+
+#################################################################################
+# Account changes
+#################################################################################
+
+
+class AccountChangeType(Enum):
+    ADDED = "added"
+    REMOVED = "removed"
+    CHANGED = "changed"
+
+
+@attr.s(kw_only=True, frozen=True, slots=True)
+class AccountChangeEvent:
+    """Change of a single account detected during accounts list refresh.
+
+    :param type: Change type
+    :param account: Affected account object
+    :param changes: Changed `LSList` fields (name -> (old value, new value))
+    """
+
+    type: AccountChangeType = attr.ib()
+    account: "Account" = attr.ib()
+    changes: Mapping[str, Tuple[Any, Any]] = attr.ib(converter=MappingProxyType, factory=dict)
+
+    @property
+    def account_id(self) -> AccountID:
+        return self.account.id
+
+
+AccountsListener = Callable[[Sequence[AccountChangeEvent]], Any]
+
+
+# Account data fields plugin (preset) parameters are resolved from
+_PRESET_PARAMETERS_FIELDS = frozenset(("kd_provider", "vl_provider"))
+
+
+def _diff_account_data(old_data: "LSList", new_data: "LSList") -> Dict[str, Tuple[Any, Any]]:
+    if old_data == new_data:
+        return {}
+
+    changes = {}
+    for field in attr.fields(new_data.__class__):
+        old_value, new_value = getattr(old_data, field.name), getattr(new_data, field.name)
+        if old_value != new_value:
+            changes[field.name] = (old_value, new_value)
+    return changes
+
+
+#################################################################################
+# Refresh planning
+#################################################################################
+
+
+class AccountRefreshReason(Enum):
+    NEW = "new"
+    NOTICE = "notice"
+    STALE = "stale"
+    UNKNOWN = "unknown"
+
+
+NoticeSignature = Tuple[int, bool]
+
+
+@attr.s(kw_only=True, frozen=True, slots=True)
+class AccountRefreshPlan:
+    """Accounts scheduled for refresh, as decided by notice counters and staleness.
+
+    :param accounts: Accounts considered during planning
+    :param due: Accounts requiring refresh (account ID -> reason)
+    :param notices: Notice signatures observed during planning (`None` if unavailable)
+    """
+
+    accounts: Mapping[AccountID, "Account"] = attr.ib(converter=MappingProxyType)
+    due: Mapping[AccountID, AccountRefreshReason] = attr.ib(converter=MappingProxyType)
+    notices: Optional[Mapping[AccountID, NoticeSignature]] = attr.ib(default=None)
+
+    @property
+    def due_accounts(self) -> List["Account"]:
+        return [self.accounts[account_id] for account_id in self.due]
+
 
 #################################################################################
 # API
@@ -292,20 +747,89 @@ class Account(Generic[_TAPI]):
 
 SupportedAccountsType = MutableMapping[Tuple[Optional[int], Optional[int]], Type["Account"]]
 
+
+@attr.s(frozen=True, slots=True)
+class _SupportedAccountsIndex:
+    """Flattened resolution table for supported accounts registry"""
+
+    generation: int = attr.ib()
+    registry: SupportedAccountsType = attr.ib(repr=False)
+    registry_size: int = attr.ib()
+    exact: Mapping[Tuple[Optional[int], Optional[int]], Type["Account"]] = attr.ib()
+    resolved: Mapping[Tuple[Optional[int], Optional[int]], Optional[Type["Account"]]] = attr.ib()
+    provider_types: Collection[int] = attr.ib()
+    service_types: Collection[int] = attr.ib()
+
+    @classmethod
+    def build(cls, generation: int, supported_accounts: SupportedAccountsType):
+        exact = dict(supported_accounts.items())
+        provider_types = frozenset(key[0] for key in exact if key[0] is not None)
+        service_types = frozenset(key[1] for key in exact if key[1] is not None)
+
+        # Any provider (or service) type not present within the registry
+        # resolves exactly like `None`, thus only known combinations are stored.
+        resolved = {}
+        for provider_type in (None, *provider_types):
+            for service_type in (None, *service_types):
+                for key in (
+                    (provider_type, service_type),
+                    (provider_type, None),
+                    (None, service_type),
+                    (None, None),
+                ):
+                    if key in exact:
+                        resolved[(provider_type, service_type)] = exact[key]
+                        break
+                else:
+                    resolved[(provider_type, service_type)] = None
+
+        return cls(
+            generation,
+            supported_accounts,
+            len(exact),
+            MappingProxyType(exact),
+            MappingProxyType(resolved),
+            provider_types,
+            service_types,
+        )
+
+
 _TDataMapping = TypeVar("_TDataMapping", bound=DataMapping)
 
 
+@attr.s(kw_only=True, slots=True)
+class _AccountsUpdateDeferral:
+    api: "BaseEnergosbytAPI" = attr.ib()
+    pending: bool = attr.ib(default=False)
+
+
+# Deferrals are tracked per task (and tasks spawned within deferral context),
+# so that refreshes requested by unrelated concurrent tasks are not swallowed.
+_ACCOUNTS_UPDATE_DEFERRALS: ContextVar[Tuple[_AccountsUpdateDeferral, ...]] = ContextVar(
+    "accounts_update_deferrals", default=()
+)
+
+
 class BaseEnergosbytAPI(ABC):
     __slots__ = (
         "_accounts",
+        "_accounts_listeners",
+        "_accounts_stale",
+        "_accounts_update_future",
+        "_availability_cache",
+        "_background_tasks",
+        "_contact_phone_cache",
+        "_refresh_states",
         "_requests_counter",
         "_session",
         "_requests_limiter",
         "account_groups",
         "attributes_add_account",
         "auth_session",
+        "history_store",
         "max_request_attempts",
         "password",
+        "plugin_config_store",
         "username",
     )
 
@@ -313,6 +837,19 @@ class BaseEnergosbytAPI(ABC):
 
     SUPPORTED_ACCOUNTS: ClassVar[SupportedAccountsType] = {(None, None): Account}
 
+    # Incremented on every (un)registration, invalidates indices of all API classes
+    # (registrations on base classes propagate to subclasses via `ChainMap`).
+    _supported_accounts_generation: ClassVar[int] = 0
+
+    @staticmethod
+    def invalidate_supported_accounts() -> None:
+        """Drop supported accounts indices of all API classes.
+
+        Must be called after `SUPPORTED_ACCOUNTS` is modified directly (registering
+        and unregistering accounts takes care of this on its own).
+        """
+        BaseEnergosbytAPI._supported_accounts_generation += 1
+
     @classmethod
     @overload
     def register_supported_account(
@@ -343,12 +880,34 @@ class BaseEnergosbytAPI(ABC):
                     None if service_type is None else int(service_type),
                 )
             ] = account_cls_
+            cls.invalidate_supported_accounts()
             return account_cls_
 
         if account_cls is None:
             return _register_supported_account
         return _register_supported_account(account_cls)
 
+    @classmethod
+    def unregister_supported_account(
+        cls,
+        *,
+        provider_type: Optional[SupportsInt] = None,
+        service_type: Optional[SupportsInt] = None,
+    ) -> Optional[Type["Account"]]:
+        """Remove account class registered on this API class for given types.
+
+        :return: Removed account class (`None` if nothing was registered)
+        """
+        account_cls = cls.SUPPORTED_ACCOUNTS.pop(
+            (
+                None if provider_type is None else int(provider_type),
+                None if service_type is None else int(service_type),
+            ),
+            None,
+        )
+        cls.invalidate_supported_accounts()
+        return account_cls
+
     @classmethod
     def get_supported_account(
         cls,
@@ -356,24 +915,36 @@ class BaseEnergosbytAPI(ABC):
         service_type: Optional[SupportsInt],
         with_fallbacks: bool = True,
     ) -> Optional[Type["Account"]]:
-        supported_accounts: SupportedAccountsType = cls.SUPPORTED_ACCOUNTS
+        index = cls._get_supported_accounts_index()
         provider_type = None if provider_type is None else int(provider_type)
         service_type = None if service_type is None else int(service_type)
 
-        if (provider_type, service_type) in supported_accounts:
-            return supported_accounts[(provider_type, service_type)]
+        if not with_fallbacks:
+            return index.exact.get((provider_type, service_type))
 
-        if with_fallbacks:
-            if provider_type is not None and (provider_type, None) in supported_accounts:
-                return supported_accounts[(provider_type, None)]
+        if provider_type not in index.provider_types:
+            provider_type = None
+        if service_type not in index.service_types:
+            service_type = None
 
-            if service_type is not None and (None, service_type) in supported_accounts:
-                return supported_accounts[(None, provider_type)]
+        return index.resolved[(provider_type, service_type)]
 
-            if (None, None) in supported_accounts:
-                return supported_accounts[(None, None)]
-
-        return None
+    @classmethod
+    def _get_supported_accounts_index(cls) -> _SupportedAccountsIndex:
+        generation = BaseEnergosbytAPI._supported_accounts_generation
+        supported_accounts = cls.SUPPORTED_ACCOUNTS
+        index: Optional[_SupportedAccountsIndex] = cls.__dict__.get("_supported_accounts_index")
+        # Registry replacement and direct additions (or removals) are detected
+        # even when indices were not invalidated explicitly.
+        if (
+            index is None
+            or index.generation != generation
+            or index.registry is not supported_accounts
+            or index.registry_size != len(supported_accounts)
+        ):
+            index = _SupportedAccountsIndex.build(generation, supported_accounts)
+            cls._supported_accounts_index = index
+        return index
 
     def __init__(
         self,
@@ -382,6 +953,8 @@ class BaseEnergosbytAPI(ABC):
         user_agent: Optional[str] = None,
         max_request_attempts: int = 3,
         max_simultaneous_requests: int = 10,
+        history_store: Optional["BaseHistoryStore"] = None,
+        plugin_config_store: Optional["BasePluginConfigStore"] = None,
     ):
         self.username: str = username
         self.password: str = password
@@ -389,15 +962,31 @@ class BaseEnergosbytAPI(ABC):
         self.max_request_attempts: int = max_request_attempts
 
         self._accounts: Optional[Dict[AccountID, Account]] = None
+        self._accounts_update_future: Optional[Tuple[Tuple[Any, ...], asyncio.Future]] = None
+        self._accounts_listeners: List[AccountsListener] = []
+        self._accounts_stale: Set[AccountID] = set()
+        self._refresh_states: Dict[AccountID, Tuple[float, Optional[NoticeSignature]]] = {}
+        self._availability_cache: AsyncTTLCache[int, "IndicationAndPayAvail"] = AsyncTTLCache(
+            self.availability_cache_ttl
+        )
+        self._contact_phone_cache: AsyncTTLCache[int, str] = AsyncTTLCache(
+            self.contact_phone_cache_ttl
+        )
+
+        # aiohttp is imported on demand, as it dominates module import time
+        import aiohttp
 
         self._requests_counter: int = 0
-        self._session: aiohttp.ClientSession = aiohttp.ClientSession(
+        self._session: "aiohttp.ClientSession" = aiohttp.ClientSession(
             headers={aiohttp.hdrs.USER_AGENT: user_agent or DEFAULT_USER_AGENT},
             cookie_jar=aiohttp.CookieJar(),
         )
         self._requests_limiter: asyncio.Semaphore = asyncio.Semaphore(max_simultaneous_requests)
 
-        self.attributes_add_account: Optional[Sequence[Attribute]] = None
+        self.attributes_add_account: Optional[Sequence["Attribute"]] = None
+        self.history_store: Optional["BaseHistoryStore"] = history_store
+        self.plugin_config_store: Optional["BasePluginConfigStore"] = plugin_config_store
+        self._background_tasks: Set[asyncio.Future] = set()
 
     async def __aenter__(self):
         return self
@@ -406,11 +995,30 @@ class BaseEnergosbytAPI(ABC):
         await self.async_close()
 
     async def async_close(self) -> None:
+        for task in tuple(self._background_tasks):
+            task.cancel()
+
+        if self.plugin_config_store is not None:
+            await self.plugin_config_store.async_flush()
+
         if not self._session.closed:
             await self._session.close()
 
+    def run_in_background(self, coro: Awaitable[Any]) -> asyncio.Future:
+        """Schedule non-essential work; failures are logged, pending work is cancelled on close."""
+        task = asyncio.ensure_future(coro)
+        self._background_tasks.add(task)
+
+        def _done_callback(done_task: asyncio.Future) -> None:
+            self._background_tasks.discard(done_task)
+            if not done_task.cancelled() and done_task.exception() is not None:
+                self.LOGGER.debug("Background task failed: %s", done_task.exception())
+
+        task.add_done_callback(_done_callback)
+        return task
+
     @property
-    def session(self) -> aiohttp.ClientSession:
+    def session(self) -> "aiohttp.ClientSession":
         return self._session
 
     #################################################################################
@@ -476,6 +1084,8 @@ class BaseEnergosbytAPI(ABC):
     async def async_action_raw(
         self, action: str, query: str, data: Optional[Mapping[str, Any]] = None
     ) -> Mapping[str, Any]:
+        import aiohttp
+
         logger = self.LOGGER
 
         get_params = {"action": action, "query": query}
@@ -520,11 +1130,16 @@ class BaseEnergosbytAPI(ABC):
                                 "[%d] <- (a%d) (%d) %s" % (counter, attempt, status, response_text)
                             )
 
+                except aiohttp.ClientResponseError as e:
+                    if e.status in (408, 504):
+                        raise RequestTimeoutException("Timeout error: %s" % (e,))
+                    raise EnergosbytException("Client error: %s" % (e,))
+
                 except aiohttp.ClientError as e:
                     raise EnergosbytException("Client error: %s" % (e,))
 
                 except asyncio.TimeoutError:
-                    raise EnergosbytException("Timeout error")
+                    raise RequestTimeoutException("Timeout error")
 
                 try:
                     response_decoded: Mapping[str, Any] = json.loads(response_text)
@@ -620,7 +1235,7 @@ class BaseEnergosbytAPI(ABC):
                 vl_device_info={
                     "appVer": self.APP_VERSION,
                     "type": "browser",
-                    "userAgent": self._session.headers[aiohttp.hdrs.USER_AGENT],
+                    "userAgent": self._session.headers["User-Agent"],
                 },
                 remember=True,
             )
@@ -635,6 +1250,8 @@ class BaseEnergosbytAPI(ABC):
 
         self.auth_session = response
 
+        from inter_rao_energosbyt.actions.sql.core import Init
+
         try:
             await Init.async_request(self)
         except EnergosbytException:
@@ -671,22 +1288,23 @@ class BaseEnergosbytAPI(ABC):
     # Account add requests
     #################################################################################
 
-    async def async_update_ls_attributes(self) -> Sequence[Attribute]:
+    async def async_update_ls_attributes(self) -> Sequence["Attribute"]:
+        from inter_rao_energosbyt.actions.sql.attributes import GetLSAttributes
+
         response = await GetLSAttributes.async_request(self)
         attributes = tuple(response.attributes)
         self.attributes_add_account = attributes
         return attributes
 
-    async def async_add_account(
+    def _prepare_add_account_attributes(
         self,
+        ls_attributes: Iterable["Attribute"],
         nn_ls: str,
         kd_provider: Optional[SupportsInt] = None,
         kd_ls_owner_type: Optional[SupportsInt] = None,
-        *,
         validate: bool = True,
-        ignore_error_codes: Optional[Iterable[SupportsInt]] = None,
         **kwargs,
-    ) -> LSAdd:
+    ) -> List[Dict[str, Any]]:
         keys = set(kwargs.keys())
         keys.add("NN_LS")
 
@@ -704,31 +1322,32 @@ class BaseEnergosbytAPI(ABC):
         if len(keys) != len(attrs):
             raise TypeError("uppercase/lowercase attribute names collision")
 
-        request_attributes = []
-
-        ls_attributes = self.attributes_add_account
-        if ls_attributes is None:
-            ls_attributes = await self.async_update_ls_attributes()
+        if validate:
+            from inter_rao_energosbyt.actions.sql.attributes import validate_many
 
-        for attribute in ls_attributes:
-            col = attribute.nm_column.lower()
-            value = None
-            if col in attrs:
-                value = attrs[col]
-                if validate:
-                    value = attribute.validate(attrs[col])
-
-            elif validate:
-                value = attribute.validate(None)
-
-            if value is not None:
-                request_attributes.append(
-                    {
-                        "kd_entity": attribute.kd_entity,
-                        "nm_column": attribute.nm_column,
-                        "vl_attribute": value,
-                    }
-                )
+            attribute_values = validate_many(ls_attributes, attrs)
+        else:
+            attribute_values = [
+                (attribute, attrs[attribute.nm_column.lower()])
+                for attribute in ls_attributes
+                if attrs.get(attribute.nm_column.lower()) is not None
+            ]
+
+        return [
+            {
+                "kd_entity": attribute.kd_entity,
+                "nm_column": attribute.nm_column,
+                "vl_attribute": value,
+            }
+            for attribute, value in attribute_values
+        ]
+
+    async def _async_perform_add_account(
+        self,
+        request_attributes: List[Dict[str, Any]],
+        ignore_error_codes: Optional[Iterable[SupportsInt]] = None,
+    ) -> "LSAdd":
+        from inter_rao_energosbyt.actions.sql.ls_management import LSAdd
 
         response = (await LSAdd.async_request(self, attributes=request_attributes)).single()
 
@@ -743,12 +1362,124 @@ class BaseEnergosbytAPI(ABC):
 
         return response
 
+    async def async_add_account(
+        self,
+        nn_ls: str,
+        kd_provider: Optional[SupportsInt] = None,
+        kd_ls_owner_type: Optional[SupportsInt] = None,
+        *,
+        validate: bool = True,
+        ignore_error_codes: Optional[Iterable[SupportsInt]] = None,
+        **kwargs,
+    ) -> "LSAdd":
+        ls_attributes = self.attributes_add_account
+        if ls_attributes is None:
+            ls_attributes = await self.async_update_ls_attributes()
+
+        request_attributes = self._prepare_add_account_attributes(
+            ls_attributes, nn_ls, kd_provider, kd_ls_owner_type, validate, **kwargs
+        )
+
+        return await self._async_perform_add_account(request_attributes, ignore_error_codes)
+
+    async def async_add_accounts(
+        self,
+        requests: Iterable[
+            Union[AccountAddRequest, Tuple[str, Optional[SupportsInt], Mapping[str, Any]]]
+        ],
+        *,
+        validate: bool = True,
+        ignore_error_codes: Optional[Iterable[SupportsInt]] = None,
+        max_simultaneous: int = 4,
+        fetch_questions: bool = True,
+        update_accounts: bool = True,
+    ) -> List[AccountAddOutcome]:
+        """Add multiple accounts at once.
+
+        All requests are validated against a single attribute set before any
+        account is added; requests failing validation are not sent, and their
+        outcomes hold the validation error. Adding is performed concurrently.
+        Accounts list is refreshed once after all requests are processed.
+
+        :param requests: Account add requests (or `(nn_ls, kd_provider, attributes)` tuples)
+        :param validate: Validate attributes before sending
+        :param ignore_error_codes: Response codes not considered failures
+        :param max_simultaneous: Maximum amount of simultaneously processed requests
+        :param fetch_questions: Retrieve questions for accounts that require confirmation
+        :param update_accounts: Refresh accounts list after adding
+        :return: Outcomes, in the order of requests
+        """
+        add_requests = [
+            x
+            if isinstance(x, AccountAddRequest)
+            else AccountAddRequest(nn_ls=x[0], kd_provider=x[1], attributes=x[2])
+            for x in requests
+        ]
+
+        ls_attributes = self.attributes_add_account
+        if ls_attributes is None:
+            ls_attributes = await self.async_update_ls_attributes()
+
+        outcomes: List[Optional[AccountAddOutcome]] = []
+        prepared_attributes = {}
+        for i, add_request in enumerate(add_requests):
+            try:
+                prepared_attributes[i] = self._prepare_add_account_attributes(
+                    ls_attributes,
+                    add_request.nn_ls,
+                    add_request.kd_provider,
+                    add_request.kd_ls_owner_type,
+                    validate,
+                    **add_request.attributes,
+                )
+            except (TypeError, ValueError) as e:
+                outcomes.append(AccountAddOutcome(request=add_request, error=e))
+            else:
+                outcomes.append(None)
+
+        semaphore = asyncio.Semaphore(max_simultaneous)
+
+        async def _async_process(i: int) -> None:
+            add_request = add_requests[i]
+            async with semaphore:
+                try:
+                    response = await self._async_perform_add_account(
+                        prepared_attributes[i], ignore_error_codes
+                    )
+                except EnergosbytException as e:
+                    outcomes[i] = AccountAddOutcome(request=add_request, error=e)
+                    return
+
+                questions = {}
+                if fetch_questions and response.pr_confirm_question and response.id_service:
+                    try:
+                        questions = await self.async_get_questions(response.id_service)
+                    except EnergosbytException as e:
+                        outcomes[i] = AccountAddOutcome(
+                            request=add_request, response=response, error=e
+                        )
+                        return
+
+            outcomes[i] = AccountAddOutcome(
+                request=add_request, response=response, questions=questions
+            )
+
+        await asyncio.gather(*map(_async_process, prepared_attributes))
+        results = [outcome for outcome in outcomes if outcome is not None]
+
+        if update_accounts and any(outcome.response is not None for outcome in results):
+            await self._async_request_accounts_update()
+
+        return results
+
     async def async_get_questions(
         self, account_id: Union[AccountID, SupportsInt]
     ) -> Dict[int, str]:
         if not isinstance(account_id, AccountID):
             account_id = int(account_id)
 
+        from inter_rao_energosbyt.actions.sql.ls_management import GetLSQuestions
+
         response = await GetLSQuestions.async_request(self, id_service=account_id)
 
         return {question_item.id_question: question_item.nm_question for question_item in response}
@@ -768,6 +1499,8 @@ class BaseEnergosbytAPI(ABC):
             else:
                 answer = str(answer)
 
+        from inter_rao_energosbyt.actions.sql.ls_management import LSConfirm
+
         response = await LSConfirm.async_request(
             self,
             id_service=int(account_id),
@@ -779,7 +1512,7 @@ class BaseEnergosbytAPI(ABC):
             raise EnergosbytException("Invalid answer", response.kd_result, response.nm_result)
 
         if update_accounts:
-            await self.async_update_accounts()
+            await self._async_request_accounts_update()
 
     #################################################################################
     # Account delete request
@@ -790,6 +1523,8 @@ class BaseEnergosbytAPI(ABC):
         account_id: SupportsInt,
         update_accounts: bool = True,
     ) -> None:
+        from inter_rao_energosbyt.actions.sql.ls_management import LSDelete
+
         response = await LSDelete.async_request(
             self,
             id_service=int(account_id),
@@ -803,7 +1538,7 @@ class BaseEnergosbytAPI(ABC):
             )
 
         if update_accounts:
-            await self.async_update_accounts()
+            await self._async_request_accounts_update()
 
     #################################################################################
     # Account groups requests
@@ -813,6 +1548,8 @@ class BaseEnergosbytAPI(ABC):
         self, account_id: Optional[SupportsInt] = None
     ) -> Tuple[Dict[int, str], Optional[int]]:
         # @TODO: add overload
+        from inter_rao_energosbyt.actions.sql.ls_management import GetLSGroups
+
         response = await GetLSGroups.async_request(
             self,
             id_service=(None if account_id is None else int(account_id)),
@@ -834,6 +1571,8 @@ class BaseEnergosbytAPI(ABC):
         group_id: SupportsInt,
         update_accounts: bool = True,
     ) -> None:
+        from inter_rao_energosbyt.actions.sql.ls_management import LSSetGroup
+
         response = await LSSetGroup.async_request(
             self,
             id_service=int(account_id),
@@ -848,7 +1587,7 @@ class BaseEnergosbytAPI(ABC):
             )
 
         if update_accounts:
-            await self.async_update_accounts()
+            await self._async_request_accounts_update()
 
     async def async_set_account_description(
         self,
@@ -865,6 +1604,8 @@ class BaseEnergosbytAPI(ABC):
         """
         description = "" if description is None else str(description).strip()
 
+        from inter_rao_energosbyt.actions.sql.ls_management import LSSaveDescription
+
         response = await LSSaveDescription.async_request(
             self,
             id_service=int(account_id),
@@ -879,7 +1620,7 @@ class BaseEnergosbytAPI(ABC):
             )
 
         if update_accounts:
-            await self.async_update_accounts()
+            await self._async_request_accounts_update()
 
     #################################################################################
     # Account requests
@@ -899,14 +1640,98 @@ class BaseEnergosbytAPI(ABC):
 
         return account_cls(self, account_data)
 
+    def _get_accounts_update_deferral(self) -> Optional[_AccountsUpdateDeferral]:
+        for deferral in _ACCOUNTS_UPDATE_DEFERRALS.get():
+            if deferral.api is self:
+                return deferral
+        return None
+
+    @asynccontextmanager
+    async def deferred_account_updates(self) -> AsyncIterator[None]:
+        """Coalesce accounts list refreshes requested by management operations.
+
+        Within the context (of the current task, and tasks spawned within it),
+        operations called with `update_accounts=True` do not refresh accounts
+        list; a single refresh is performed at exit instead (when at least one
+        was requested, and the context exits without an exception). Contexts may
+        be nested.
+        """
+        if self._get_accounts_update_deferral() is not None:
+            # Nested context; refresh is performed by the outermost one
+            yield
+            return
+
+        deferral = _AccountsUpdateDeferral(api=self)
+        token = _ACCOUNTS_UPDATE_DEFERRALS.set(_ACCOUNTS_UPDATE_DEFERRALS.get() + (deferral,))
+        try:
+            yield
+        finally:
+            _ACCOUNTS_UPDATE_DEFERRALS.reset(token)
+
+        if deferral.pending:
+            await self.async_update_accounts()
+
+    async def _async_request_accounts_update(self) -> None:
+        deferral = self._get_accounts_update_deferral()
+        if deferral is None:
+            await self.async_update_accounts()
+        else:
+            deferral.pending = True
+
     async def async_update_accounts(
         self,
         skip_errors: bool = True,
         with_related: bool = True,
         disable: Optional[Iterable[int]] = None,
+        force_related: bool = False,
     ) -> Mapping[AccountID, Account]:
+        """Refresh accounts list.
+
+        Related data is only updated for added and changed accounts (as well as
+        accounts which failed to update previously), unless `force_related` is set.
+        Concurrent calls with the same arguments share a single request.
+        """
         if disable is not None:
-            disable = set(disable)
+            disable = frozenset(disable)
+
+        arguments = (skip_errors, with_related, disable, force_related)
+        in_flight = self._accounts_update_future
+        if in_flight is not None and in_flight[0] == arguments:
+            return await asyncio.shield(in_flight[1])
+
+        # Update runs in its own task, so cancelling any of the callers
+        # (including the one that started it) does not affect the others.
+        update_task = asyncio.ensure_future(self._async_perform_accounts_update(*arguments))
+        update_task.add_done_callback(self._accounts_update_done)
+        self._accounts_update_future = (arguments, update_task)
+
+        return await asyncio.shield(update_task)
+
+    def _accounts_update_done(self, update_task: asyncio.Future) -> None:
+        in_flight = self._accounts_update_future
+        if in_flight is not None and in_flight[1] is update_task:
+            self._accounts_update_future = None
+        if not update_task.cancelled():
+            # Exception is retrieved by waiters (if any), avoid "never retrieved" warnings
+            update_task.exception()
+
+    def add_accounts_listener(self, listener: AccountsListener) -> Callable[[], None]:
+        """Subscribe to account changes detected by `async_update_accounts`.
+
+        Listener is called with all events of a single refresh (coroutine
+        listeners are awaited). Returns callable that removes the listener.
+        """
+        self._accounts_listeners.append(listener)
+        return lambda: self._accounts_listeners.remove(listener)
+
+    async def _async_perform_accounts_update(
+        self,
+        skip_errors: bool,
+        with_related: bool,
+        disable: Optional[Set[int]],
+        force_related: bool,
+    ) -> Mapping[AccountID, Account]:
+        from inter_rao_energosbyt.actions.sql.ls_management import LSList
 
         response = await LSList.async_request(self)
 
@@ -914,6 +1739,8 @@ class BaseEnergosbytAPI(ABC):
         new_accounts: Dict[int, Account] = {}
         update_tasks: Dict[int, Awaitable[Any]] = {}
         remove_account_ids: Set[int] = set(accounts.keys())
+        events: List[AccountChangeEvent] = []
+        stale = self._accounts_stale
 
         for account_data in response:
             account_id = account_data.id_service
@@ -926,29 +1753,227 @@ class BaseEnergosbytAPI(ABC):
             except KeyError:
                 account = self._create_account_from_data(account_data)
                 new_accounts[account_id] = account
+                events.append(AccountChangeEvent(type=AccountChangeType.ADDED, account=account))
             else:
                 remove_account_ids.discard(account_id)
-                account.data = account_data
+                changes = _diff_account_data(account.data, account_data)
+                if changes:
+                    account.data = account_data
+                    if not _PRESET_PARAMETERS_FIELDS.isdisjoint(changes):
+                        account.invalidate_preset_parameters()
+                    self._refresh_states.pop(account_id, None)
+                    events.append(
+                        AccountChangeEvent(
+                            type=AccountChangeType.CHANGED, account=account, changes=changes
+                        )
+                    )
+                elif not (force_related or account_id in stale):
+                    continue
 
             if with_related:
                 update_tasks[account_id] = account.async_update_related()
+            else:
+                # Related data is updated on the next update with related data
+                stale.add(account_id)
 
         if update_tasks:
             results = await asyncio.gather(*update_tasks.values(), return_exceptions=True)
+            for account_id, result in zip(update_tasks.keys(), results):
+                if isinstance(result, BaseException):
+                    stale.add(account_id)
+                else:
+                    stale.discard(account_id)
             if not skip_errors and any(isinstance(x, BaseException) for x in results):
                 raise EnergosbytException("Could not perform accounts update")
 
         accounts.update(new_accounts)
 
         for account_id in remove_account_ids:
-            del accounts[account_id]
+            events.append(
+                AccountChangeEvent(type=AccountChangeType.REMOVED, account=accounts.pop(account_id))
+            )
+            stale.discard(account_id)
+            self._refresh_states.pop(account_id, None)
 
         self._accounts = accounts
 
+        if events:
+            for listener in tuple(self._accounts_listeners):
+                result = listener(events)
+                if inspect.isawaitable(result):
+                    await result
+
         return MappingProxyType(accounts)
 
-    async def async_get_availability(self, provider_id: SupportsInt) -> IndicationAndPayAvail:
-        return await IndicationAndPayAvail.async_request(self, kd_provider=int(provider_id))
+    #################################################################################
+    # Refresh planning
+    #################################################################################
+
+    refresh_max_staleness: ClassVar[timedelta] = timedelta(hours=12)
+
+    async def async_get_notice_signatures(
+        self, with_routine: bool = True
+    ) -> Dict[AccountID, NoticeSignature]:
+        """Retrieve notice counters for all accounts with a single request.
+
+        :param with_routine: Trigger notice processing on portal beforehand
+        """
+        from inter_rao_energosbyt.actions.sql.ls_generic import GetLSListNoticeStatus
+
+        if with_routine:
+            from inter_rao_energosbyt.actions.sql.core import NoticeRoutine
+
+            try:
+                await NoticeRoutine.async_request(self)
+            except EnergosbytException as e:
+                self.LOGGER.debug("Notice routine failed: %s", e)
+
+        return {
+            notice.id_service: (notice.cnt_notice, notice.is_critical)
+            for notice in await GetLSListNoticeStatus.async_request(self)
+        }
+
+    async def async_plan_accounts_refresh(
+        self,
+        accounts: Optional[Iterable[Account]] = None,
+        max_staleness: Optional[timedelta] = None,
+        with_routine: bool = True,
+    ) -> AccountRefreshPlan:
+        """Decide which accounts need their data refreshed.
+
+        An account is due when it was never refreshed, its notice counters
+        changed since the last refresh, or the last refresh is older than
+        `max_staleness`. When notice counters are unavailable, all accounts
+        are considered due.
+
+        :param accounts: Accounts to consider (default: all accounts)
+        :param max_staleness: Staleness bound (default: `refresh_max_staleness`)
+        :param with_routine: Trigger notice processing on portal beforehand
+        """
+        if accounts is None:
+            accounts = (await self.async_update_accounts()).values()
+        accounts = {account.id: account for account in accounts}
+
+        if max_staleness is None:
+            max_staleness = self.refresh_max_staleness
+
+        try:
+            notices = await self.async_get_notice_signatures(with_routine)
+        except EnergosbytException as e:
+            self.LOGGER.debug("Notice counters unavailable: %s", e)
+            notices = None
+
+        refreshed_before = time.monotonic() - max_staleness.total_seconds()
+        refresh_states = self._refresh_states
+        due = {}
+
+        for account_id in accounts:
+            try:
+                refreshed_at, signature = refresh_states[account_id]
+            except KeyError:
+                due[account_id] = AccountRefreshReason.NEW
+                continue
+
+            if notices is None:
+                due[account_id] = AccountRefreshReason.UNKNOWN
+            elif notices.get(account_id) != signature:
+                due[account_id] = AccountRefreshReason.NOTICE
+            elif refreshed_at < refreshed_before:
+                due[account_id] = AccountRefreshReason.STALE
+
+        return AccountRefreshPlan(accounts=accounts, due=due, notices=notices)
+
+    def mark_account_refreshed(
+        self, account_id: AccountID, plan: Optional[AccountRefreshPlan] = None
+    ) -> None:
+        """Record successful account refresh (with notice signature observed by `plan`)."""
+        notices = None if plan is None else plan.notices
+        self._refresh_states[account_id] = (
+            time.monotonic(),
+            None if notices is None else notices.get(account_id),
+        )
+
+    def invalidate_account_refresh(self, account_id: Optional[AccountID] = None) -> None:
+        """Force refresh of an account (or all accounts) on next planning."""
+        if account_id is None:
+            self._refresh_states.clear()
+        else:
+            self._refresh_states.pop(account_id, None)
+
+    async def async_refresh_accounts(
+        self,
+        refresher: Callable[[Account], Awaitable[Any]],
+        accounts: Optional[Iterable[Account]] = None,
+        max_staleness: Optional[timedelta] = None,
+        with_routine: bool = True,
+        max_simultaneous: int = 4,
+    ) -> Dict[AccountID, Optional[BaseException]]:
+        """Run `refresher` only for accounts that are due according to refresh plan.
+
+        Accounts whose refresh fails are retried on next call.
+
+        :param refresher: Coroutine function performing heavy per-account requests
+        :param accounts: Accounts to consider (default: all accounts)
+        :param max_staleness: Staleness bound (default: `refresh_max_staleness`)
+        :param with_routine: Trigger notice processing on portal beforehand
+        :param max_simultaneous: Maximum amount of simultaneously refreshed accounts
+        :return: Refreshed account IDs mapped to encountered exceptions (`None` on success)
+        """
+        plan = await self.async_plan_accounts_refresh(accounts, max_staleness, with_routine)
+        semaphore = asyncio.Semaphore(max_simultaneous)
+
+        async def _async_refresh(account: Account) -> None:
+            async with semaphore:
+                await refresher(account)
+            self.mark_account_refreshed(account.id, plan)
+
+        due_accounts = plan.due_accounts
+        results = await asyncio.gather(*map(_async_refresh, due_accounts), return_exceptions=True)
+
+        return {account.id: result for account, result in zip(due_accounts, results)}
+
+    #################################################################################
+    # Provider-wide data
+    #################################################################################
+
+    availability_cache_ttl: ClassVar[Optional[float]] = 15 * 60
+    contact_phone_cache_ttl: ClassVar[Optional[float]] = 24 * 60 * 60
+
+    async def async_get_availability(
+        self, provider_id: SupportsInt, use_cache: bool = True
+    ) -> "IndicationAndPayAvail":
+        from inter_rao_energosbyt.actions.sql.ls_generic import IndicationAndPayAvail
+
+        provider_id = int(provider_id)
+
+        async def _async_fetch() -> IndicationAndPayAvail:
+            return await IndicationAndPayAvail.async_request(self, kd_provider=provider_id)
+
+        if not use_cache:
+            self._availability_cache.invalidate(provider_id)
+        return await self._availability_cache.async_get(provider_id, _async_fetch)
+
+    async def async_get_contact_phone(
+        self, provider_id: SupportsInt, use_cache: bool = True
+    ) -> str:
+        from inter_rao_energosbyt.actions.sql.generic import GetContactPhone
+
+        provider_id = int(provider_id)
+
+        async def _async_fetch() -> str:
+            response = await GetContactPhone.async_request(self, kd_provider=provider_id)
+            return response.nn_contact_phone or ""
+
+        if not use_cache:
+            self._contact_phone_cache.invalidate(provider_id)
+        return await self._contact_phone_cache.async_get(provider_id, _async_fetch)
+
+    def invalidate_provider_caches(self, provider_id: Optional[SupportsInt] = None) -> None:
+        """Drop cached availability and contact phone for provider (or all providers)."""
+        if provider_id is not None:
+            provider_id = int(provider_id)
+        self._availability_cache.invalidate(provider_id)
+        self._contact_phone_cache.invalidate(provider_id)
 
 
 #################################################################################
@@ -1029,16 +2054,13 @@ class AbstractIndication(WithAccount["AbstractAccountWithIndications"], Supports
         )
 
     def __lt__(self, other: "AbstractIndication") -> bool:
-        self_taken_at, other_taken_at = self.taken_at, other.taken_at
-
-        if self_taken_at < other_taken_at:
-            return True
-
-        if self_taken_at > other_taken_at:
-            return False
+        return self.sort_key < other.sort_key
 
-        # this reacts to indications reset
-        return sum(self.values.values()) > sum(other.values.values())
+    @property
+    def sort_key(self) -> Tuple["datetime", float]:
+        """Ordering key (use with `sorted(..., key=...)` to avoid repeated comparisons)"""
+        # negated sum reacts to indications reset
+        return self.taken_at, -sum(self.values.values())
 
     @property
     @abstractmethod
@@ -1083,6 +2105,22 @@ class AbstractAccountWithIndications(WithDatedRequests, Account, ABC, Generic[_T
     async def async_get_last_indication(self, end: AnyDateArg = None) -> Optional[_TIndication]:
         return await self._internal_async_find_dated_last(self.async_get_indications, end)
 
+    def get_meter_indication_values(
+        self, meter: "AbstractMeter", indication: _TIndication
+    ) -> Optional[Mapping[str, Optional[float]]]:
+        """Values of indication keyed by zone IDs of given meter.
+
+        Indications without meter code are attributed to every meter.
+
+        :param meter: Meter of this account
+        :param indication: Indication of this account
+        :return: Zone values, `None` when indication does not belong to the meter
+        """
+        meter_code = indication.meter_code
+        if meter_code is None or meter_code == meter.id or meter_code == meter.code:
+            return indication.values
+        return None
+
 
 #################################################################################
 # Payments
@@ -1100,6 +2138,11 @@ class AbstractPayment(WithAccount["AbstractAccountWithPayments"], SupportsLessTh
     def __lt__(self, other: "AbstractPayment") -> bool:
         return self.paid_at < other.paid_at
 
+    @property
+    def sort_key(self) -> "datetime":
+        """Ordering key (use with `sorted(..., key=...)` to avoid repeated comparisons)"""
+        return self.paid_at
+
     @property
     @abstractmethod
     def paid_at(self) -> "datetime":
@@ -1169,6 +2212,11 @@ class AbstractInvoice(WithAccount["AbstractAccountWithInvoices"], SupportsLessTh
     def __lt__(self, other: "AbstractInvoice") -> bool:
         return self.period < other.period
 
+    @property
+    def sort_key(self) -> "date":
+        """Ordering key (use with `sorted(..., key=...)` to avoid repeated comparisons)"""
+        return self.period
+
     @property
     @abstractmethod
     def period(self) -> "date":
@@ -1342,6 +2390,10 @@ class _AbstractTransmittingMeterBase(AbstractMeter, ABC):
     def submission_period(self) -> Tuple["date", "date"]:
         pass
 
+    def get_submission_period(self, on_date: "date") -> Tuple["date", "date"]:
+        """Submission period relevant to given date (current period unless overridden)."""
+        return self.submission_period
+
 
 class AbstractSubmittableMeter(_AbstractTransmittingMeterBase, ABC):
     __slots__ = ()
@@ -1363,7 +2415,14 @@ class AbstractSubmittableMeter(_AbstractTransmittingMeterBase, ABC):
             **kwargs,
         )
 
-        return await self._internal_async_submit_indications(**validated_args)
+        result = await self._internal_async_submit_indications(**validated_args)
+
+        # Last indications of submitted meter are no longer actual
+        account = self.account
+        if isinstance(account, AbstractAccountWithMeters):
+            account.invalidate_meters_snapshot()
+
+        return result
 
 
 class AbstractCalculatableMeter(_AbstractTransmittingMeterBase, ABC):
@@ -1390,31 +2449,85 @@ class AbstractCalculatableMeter(_AbstractTransmittingMeterBase, ABC):
 
 
 _TMeter = TypeVar("_TMeter", bound=AbstractMeter)
+_TTransmittingMeter = TypeVar("_TTransmittingMeter", bound=_AbstractTransmittingMeterBase)
+
+
+def _wrap_seeding_meters_snapshot(async_get_meters: Callable[..., Awaitable[Any]]):
+    @functools.wraps(async_get_meters)
+    async def _async_get_meters(self: "AbstractAccountWithMeters", *args, **kwargs):
+        meters = await async_get_meters(self, *args, **kwargs)
+        self._get_meters_snapshot_cache().set(None, meters)
+        return meters
+
+    setattr(_async_get_meters, "_seeds_meters_snapshot", True)
+    return _async_get_meters
 
 
 class AbstractAccountWithMeters(Account, ABC, Generic[_TMeter]):
     __slots__ = ()
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # Every retrieval replaces meter snapshot with its result
+        async_get_meters = cls.__dict__.get("async_get_meters")
+        if not (
+            async_get_meters is None
+            or getattr(async_get_meters, "__isabstractmethod__", False)
+            or getattr(async_get_meters, "_seeds_meters_snapshot", False)
+        ):
+            cls.async_get_meters = _wrap_seeding_meters_snapshot(async_get_meters)  # type: ignore[assignment]
+
     @abstractmethod
     async def async_get_meters(self) -> Mapping[str, _TMeter]:
+        """Retrieve meters (result replaces meter snapshot)."""
         pass
 
-    async def async_submit_indications(self, **kwargs: Union[int, float]) -> Mapping[str, Any]:
-        meters = await self.async_get_meters()
+    meters_snapshot_ttl: ClassVar[Optional[float]] = 5 * 60
 
-        expected_calls: List[Tuple[AbstractSubmittableMeter, Dict[str, Union[int, float]]]] = []
-        unknown: Set[str] = set(kwargs.keys())
+    def _get_meters_snapshot_cache(self) -> AsyncTTLCache[None, Mapping[str, _TMeter]]:
+        snapshot = self._meters_snapshot
+        if snapshot is None:
+            snapshot = AsyncTTLCache(self.meters_snapshot_ttl)
+            self._meters_snapshot = snapshot
+        return snapshot
+
+    async def async_get_meters_snapshot(self, force_refresh: bool = False) -> Mapping[str, _TMeter]:
+        """Retrieve meters, reusing result of a recent retrieval.
+
+        Snapshot is kept for `meters_snapshot_ttl` seconds, is replaced by every
+        `async_get_meters()` call and is dropped after indications are submitted.
+        Concurrent callers share a single retrieval.
+        """
+        snapshot = self._get_meters_snapshot_cache()
+        if force_refresh:
+            snapshot.invalidate()
+
+        return await snapshot.async_get(None, self.async_get_meters)
+
+    def invalidate_meters_snapshot(self) -> None:
+        if self._meters_snapshot is not None:
+            self._meters_snapshot.invalidate()
+
+    async def _async_match_meter_zones(
+        self, meter_type: Type[_TTransmittingMeter], values: Mapping[str, Union[int, float]]
+    ) -> List[Tuple[_TTransmittingMeter, Dict[str, Union[int, float]]]]:
+        """Distribute zone values between snapshot meters of given type."""
+        meters = await self.async_get_meters_snapshot()
+
+        expected_calls: List[Tuple[_TTransmittingMeter, Dict[str, Union[int, float]]]] = []
+        unknown: Set[str] = set(values.keys())
 
         for meter_id, meter in meters.items():
-            if not isinstance(meter, AbstractSubmittableMeter):
+            if not isinstance(meter, meter_type):
                 continue
 
-            valid_keys = kwargs.keys() & set(meter.zones)
+            valid_keys = values.keys() & set(meter.zones)
             if valid_keys:
                 if not valid_keys & unknown:
                     raise EnergosbytException("multiple meters appear to have same zone IDs")
 
-                expected_calls.append((meter, {k: kwargs[k] for k in valid_keys}))
+                expected_calls.append((meter, {k: values[k] for k in valid_keys}))
                 unknown.difference_update(valid_keys)
 
         if unknown:
@@ -1422,6 +2535,22 @@ class AbstractAccountWithMeters(Account, ABC, Generic[_TMeter]):
                 "could not match meters for provided tariff IDs: " + ", ".join(unknown)
             )
 
+        return expected_calls
+
+    async def async_calculate_indications(
+        self, **kwargs: Union[int, float]
+    ) -> Mapping[str, SupportsFloat]:
+        expected_calls = await self._async_match_meter_zones(AbstractCalculatableMeter, kwargs)
+
+        results = await asyncio.gather(
+            *(meter.async_calculate_indications(**call_args) for meter, call_args in expected_calls)  # type: ignore[arg-type]
+        )
+
+        return dict(zip(map(lambda x: x[0].id, expected_calls), results))
+
+    async def async_submit_indications(self, **kwargs: Union[int, float]) -> Mapping[str, Any]:
+        expected_calls = await self._async_match_meter_zones(AbstractSubmittableMeter, kwargs)
+
         results = await asyncio.gather(
             *(meter.async_submit_indications(**call_args) for meter, call_args in expected_calls)  # type: ignore[arg-type]
         )
@@ -1475,10 +2604,41 @@ _TTariffHistoryEntry = TypeVar("_TTariffHistoryEntry", bound=AbstractTariffHisto
 class AbstractAccountWithTariffHistory(Account, ABC, Generic[_TTariffHistoryEntry]):
     __slots__ = ()
 
+    tariff_history_snapshot_ttl: ClassVar[Optional[float]] = 24 * 60 * 60
+
     @abstractmethod
     async def async_get_tariff_history(self) -> Collection[_TTariffHistoryEntry]:
         pass
 
+    async def async_get_tariff_history_snapshot(
+        self, force_refresh: bool = False
+    ) -> Collection[_TTariffHistoryEntry]:
+        """Retrieve tariff history, reusing result of a recent retrieval.
+
+        Snapshot is kept for `tariff_history_snapshot_ttl` seconds.
+        """
+        snapshot = self._tariff_history_snapshot
+        if snapshot is None:
+            snapshot = AsyncTTLCache(self.tariff_history_snapshot_ttl)
+            self._tariff_history_snapshot = snapshot
+        elif force_refresh:
+            snapshot.invalidate()
+
+        return await snapshot.async_get(None, self.async_get_tariff_history)
+
+    @property
+    def tariff_history_snapshot_time(self) -> Optional[datetime]:
+        """Time tariff history snapshot was retrieved at (`None` when not kept)."""
+        snapshot = self._tariff_history_snapshot
+        age = None if snapshot is None else snapshot.get_age(None)
+        if age is None:
+            return None
+        return datetime.now(self.timezone) - timedelta(seconds=age)
+
+    def invalidate_tariff_history_snapshot(self) -> None:
+        if self._tariff_history_snapshot is not None:
+            self._tariff_history_snapshot.invalidate()
+
 
 #################################################################################
 # Meters history
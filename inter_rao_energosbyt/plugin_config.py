@@ -0,0 +1,253 @@
+__all__ = (
+    "BasePluginConfigStore",
+    "JSONPluginConfigStore",
+    "MemoryPluginConfigStore",
+    "PLUGIN_CONFIG_VERSION",
+    "PluginConfig",
+    "make_plugin_config_account_key",
+)
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, TYPE_CHECKING, Tuple
+
+import attr
+
+if TYPE_CHECKING:
+    from inter_rao_energosbyt.interfaces import Account
+
+_LOGGER = logging.getLogger(__name__)
+
+PLUGIN_CONFIG_VERSION = 1
+"""Stored record format version (records of other versions are ignored)"""
+
+
+def make_plugin_config_account_key(account: "Account") -> str:
+    api = account.api
+    return "%s:%s:%d" % (api.__class__.__name__, api.username, account.id)
+
+
+def _make_version(account: "Account") -> str:
+    # Portal application version is included, as plugin configuration
+    # may change along with portal updates.
+    return "%d:%s" % (PLUGIN_CONFIG_VERSION, account.api.APP_VERSION)
+
+
+@attr.s(kw_only=True, frozen=True, slots=True)
+class PluginConfig:
+    """Resolved plugin parameters of a single account preset.
+
+    :param proxy: Plugin proxy name
+    :param provider: Plugin provider string
+    :param flags: Additional resolved account flags (e.g. `byt_only`)
+    :param version: Version stamp the configuration was stored with
+    :param stored_at: POSIX timestamp the configuration was stored at
+    """
+
+    proxy: str = attr.ib()
+    provider: str = attr.ib()
+    flags: Mapping[str, Any] = attr.ib(converter=MappingProxyType, factory=dict)
+    version: str = attr.ib()
+    stored_at: float = attr.ib(factory=time.time)
+
+    def to_record(self) -> Dict[str, Any]:
+        return {
+            "proxy": self.proxy,
+            "provider": self.provider,
+            "flags": dict(self.flags),
+            "version": self.version,
+            "stored_at": self.stored_at,
+        }
+
+    @classmethod
+    def from_record(cls, record: Mapping[str, Any]) -> "PluginConfig":
+        return cls(
+            proxy=record["proxy"],
+            provider=record["provider"],
+            flags=record.get("flags") or {},
+            version=record["version"],
+            stored_at=record.get("stored_at", 0.0),
+        )
+
+
+class BasePluginConfigStore(ABC):
+    """Persistent storage for resolved account plugin parameters.
+
+    Records are kept per account (API class, username and account ID) and per
+    preset. Records stored with a different version stamp are disregarded.
+    """
+
+    @abstractmethod
+    def get_record(self, account_key: str, preset: str) -> Optional[Mapping[str, Any]]:
+        """Retrieve stored record"""
+
+    @abstractmethod
+    def put_record(self, account_key: str, preset: str, record: Mapping[str, Any]) -> None:
+        """Store record, replacing existing one"""
+
+    @abstractmethod
+    def clear(self, account_key: Optional[str] = None, preset: Optional[str] = None) -> None:
+        """Remove stored records"""
+
+    async def async_flush(self) -> None:
+        """Persist pending changes (stores writing immediately do nothing)"""
+        return None
+
+    def load(self, account: "Account", preset: str) -> Optional[PluginConfig]:
+        record = self.get_record(make_plugin_config_account_key(account), preset)
+        if record is None:
+            return None
+        try:
+            config = PluginConfig.from_record(record)
+        except (KeyError, TypeError, ValueError):
+            return None
+        if config.version != _make_version(account):
+            return None
+        return config
+
+    def save(
+        self,
+        account: "Account",
+        preset: str,
+        parameters: Tuple[str, str],
+        flags: Optional[Mapping[str, Any]] = None,
+    ) -> PluginConfig:
+        config = PluginConfig(
+            proxy=parameters[0],
+            provider=parameters[1],
+            flags=flags or {},
+            version=_make_version(account),
+        )
+        self.put_record(make_plugin_config_account_key(account), preset, config.to_record())
+        return config
+
+    def discard(self, account: "Account", preset: Optional[str] = None) -> None:
+        """Remove stored records of an account (of all presets by default)"""
+        self.clear(make_plugin_config_account_key(account), preset)
+
+
+class MemoryPluginConfigStore(BasePluginConfigStore):
+    """Plugin configuration store kept in process memory"""
+
+    def __init__(self) -> None:
+        self._records: Dict[Tuple[str, str], Mapping[str, Any]] = {}
+
+    def get_record(self, account_key: str, preset: str) -> Optional[Mapping[str, Any]]:
+        return self._records.get((account_key, preset))
+
+    def put_record(self, account_key: str, preset: str, record: Mapping[str, Any]) -> None:
+        self._records[(account_key, preset)] = record
+
+    def clear(self, account_key: Optional[str] = None, preset: Optional[str] = None) -> None:
+        for key in list(self._records.keys()):
+            if (account_key is None or key[0] == account_key) and (
+                preset is None or key[1] == preset
+            ):
+                del self._records[key]
+
+
+class JSONPluginConfigStore(MemoryPluginConfigStore):
+    """Plugin configuration store backed by a JSON file.
+
+    File is read once upon creation. Changes made while an event loop is running
+    are collected for `write_delay` seconds and written atomically in the loop's
+    default executor; `async_flush()` (called by `BaseEnergosbytAPI.async_close()`)
+    or `flush()` write pending changes right away. Without a running event loop
+    changes are written immediately.
+    """
+
+    def __init__(self, path: str, write_delay: float = 1.0) -> None:
+        super().__init__()
+        self.path: str = path
+        self.write_delay: float = write_delay
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._changes: int = 0
+        self._written_changes: int = 0
+        self._write_handle: Optional[asyncio.TimerHandle] = None
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                contents = json.load(f)
+        except FileNotFoundError:
+            contents = {}
+        except ValueError:
+            # Corrupted file is replaced on next write
+            contents = {}
+
+        for account_key, presets in contents.items():
+            for preset, record in presets.items():
+                self._records[(account_key, preset)] = record
+
+    def _snapshot(self) -> Tuple[int, Dict[str, Dict[str, Mapping[str, Any]]]]:
+        with self._lock:
+            contents: Dict[str, Dict[str, Mapping[str, Any]]] = {}
+            for (account_key, preset), record in self._records.items():
+                contents.setdefault(account_key, {})[preset] = record
+            return self._changes, contents
+
+    def _write(self, changes: int, contents: Mapping[str, Any]) -> None:
+        with self._write_lock:
+            # Snapshot taken earlier may be written after a newer one
+            if changes <= self._written_changes:
+                return
+
+            temp_path = self.path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(contents, f, ensure_ascii=False, indent=1, sort_keys=True)
+            os.replace(temp_path, self.path)
+            self._written_changes = changes
+
+    def _cancel_scheduled_write(self) -> None:
+        if self._write_handle is not None:
+            self._write_handle.cancel()
+            self._write_handle = None
+
+    def _schedule_write(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+
+        if self._write_handle is None:
+            self._write_handle = loop.call_later(self.write_delay, self._start_write, loop)
+
+    def _start_write(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._write_handle = None
+        future = loop.run_in_executor(None, self._write, *self._snapshot())
+
+        def _done_callback(done_future: asyncio.Future) -> None:
+            if not done_future.cancelled() and done_future.exception() is not None:
+                _LOGGER.warning("Could not write %s: %s", self.path, done_future.exception())
+
+        future.add_done_callback(_done_callback)
+
+    def flush(self) -> None:
+        """Write pending changes, blocking until done"""
+        self._cancel_scheduled_write()
+        if self._changes > self._written_changes:
+            self._write(*self._snapshot())
+
+    async def async_flush(self) -> None:
+        self._cancel_scheduled_write()
+        if self._changes > self._written_changes:
+            await asyncio.get_running_loop().run_in_executor(None, self._write, *self._snapshot())
+
+    def put_record(self, account_key: str, preset: str, record: Mapping[str, Any]) -> None:
+        with self._lock:
+            super().put_record(account_key, preset, record)
+            self._changes += 1
+        self._schedule_write()
+
+    def clear(self, account_key: Optional[str] = None, preset: Optional[str] = None) -> None:
+        with self._lock:
+            super().clear(account_key, preset)
+            self._changes += 1
+        self._schedule_write()
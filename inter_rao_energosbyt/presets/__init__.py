@@ -1,12 +1,28 @@
+__all__ = (
+    "HasAPIProperty",
+    "adapters",
+    "byt",
+    "containers",
+    "smorodina",
+    "view",
+)
+
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+from inter_rao_energosbyt.util import lazy_submodules
+
 if TYPE_CHECKING:
     from inter_rao_energosbyt.interfaces import BaseEnergosbytAPI
 
+_SUBMODULES = frozenset(__all__[1:])
+
 
 class HasAPIProperty(ABC):
     @property
     @abstractmethod
     def api(self) -> "BaseEnergosbytAPI":
         pass
+
+
+__getattr__, __dir__ = lazy_submodules(__name__, _SUBMODULES, globals())
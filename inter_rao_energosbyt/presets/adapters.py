@@ -1,7 +1,7 @@
 import logging
 from abc import abstractmethod
 from datetime import date, datetime
-from types import MappingProxyType
+from operator import attrgetter
 from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
 import attr
@@ -11,10 +11,15 @@ from inter_rao_energosbyt.presets.containers import IndicationContainer
 from inter_rao_energosbyt.interfaces import (
     AbstractAccountWithIndications,
     AbstractAccountWithInvoices,
+    AbstractIndication,
     AbstractInvoice,
+    AbstractMeter,
     Account,
 )
-from inter_rao_energosbyt.util import AnyDateArg, process_start_end_arguments
+from inter_rao_energosbyt.util import AnyDateArg, process_start_end_arguments, resolve_zone_id
+
+INVOICE_METER_CODE = "invoice"
+"""Meter code of indications derived from invoices"""
 
 
 @attr.s(kw_only=False, frozen=True, slots=True, str=False, repr=False)
@@ -27,34 +32,98 @@ class VirtualInvoice(AbstractInvoice):
 _INIT_DATETIME = datetime(1, 1, 1, tzinfo=pytz.utc)
 
 
+def _date_as_datetime(d: "date") -> "datetime":
+    return datetime(year=d.year, month=d.month, day=d.day)
+
+
+@attr.s(kw_only=True, slots=True)
+class _InvoiceSeriesEntry:
+    """Cumulative values after processing invoice(s) of a period"""
+
+    period: "date" = attr.ib()
+    values: Dict[str, float] = attr.ib()
+    source: Optional[str] = attr.ib()
+    description: str = attr.ib()
+    visible: bool = attr.ib(default=True)
+    key_count: int = attr.ib(default=0)
+
+
+@attr.s(kw_only=True, slots=True)
+class _InvoiceSeriesState:
+    """Cumulative series synthesized from invoices, along with continuation data.
+
+    Entries of periods before `boundary` are final; invoices starting with
+    `boundary` period are re-processed on subsequent updates.
+    """
+
+    entries: List[_InvoiceSeriesEntry] = attr.ib(factory=list)
+    values: Optional[Dict[str, float]] = attr.ib(default=None)
+    keys: List[str] = attr.ib(factory=list)
+    descriptions: Dict[str, str] = attr.ib(factory=dict)
+    boundary: Optional["date"] = attr.ib(default=None)
+
+    def copy(self) -> "_InvoiceSeriesState":
+        return _InvoiceSeriesState(
+            entries=list(self.entries),
+            values=None if self.values is None else dict(self.values),
+            keys=list(self.keys),
+            descriptions=dict(self.descriptions),
+            boundary=self.boundary,
+        )
+
+
 class AccountWithInvoicesToIndications(
     AbstractAccountWithInvoices, AbstractAccountWithIndications, Account
 ):
+    """Account deriving indications from cumulative invoice values.
+
+    Series synthesized from invoices is kept between calls, and only invoices
+    starting with the last processed period are requested afterwards. Invoices
+    issued late for earlier periods are therefore not picked up until
+    `reset_indications_from_invoices()` is called.
+    """
+
+    __slots__ = ("_invoice_series_checkpoint",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._invoice_series_checkpoint: Optional[_InvoiceSeriesState] = None
+
     @abstractmethod
     def _get_invoice_values(
         self, invoice: AbstractInvoice
     ) -> Tuple[Mapping[str, float], Optional[Mapping[str, str]]]:
         pass
 
-    async def async_get_indications_from_invoices(
-        self, start: AnyDateArg = None, end: AnyDateArg = None
-    ) -> List[IndicationContainer]:
-        start, end = process_start_end_arguments(start, end, self.timezone)
+    def reset_indications_from_invoices(self) -> None:
+        """Discard cumulative series synthesized from invoices earlier"""
+        self._invoice_series_checkpoint = None
 
-        all_invoices = sorted(await self.async_get_invoices(_INIT_DATETIME, end))
-        invoices_iterator = iter(all_invoices)
+    def get_meter_indication_values(
+        self, meter: AbstractMeter, indication: AbstractIndication
+    ) -> Optional[Mapping[str, Optional[float]]]:
+        if indication.meter_code != INVOICE_METER_CODE:
+            return super().get_meter_indication_values(meter, indication)
 
-        try:
-            previous_invoice = next(invoices_iterator)
-        except StopIteration:
-            return []
+        # Invoice values are keyed by zone IDs resolved from service names
+        values = indication.values
+        meter_values = {}
+        for zone_id, zone in meter.zones.items():
+            key = resolve_zone_id(zone.name)
+            if key in values:
+                meter_values[zone_id] = values[key]
 
-        all_indications: Dict["date", IndicationContainer] = {}
+        return meter_values or None
 
-        init_values, descriptions = self._get_invoice_values(previous_invoice)
+    def _extend_invoice_series(
+        self, state: _InvoiceSeriesState, invoices: Iterable[AbstractInvoice]
+    ) -> Optional[_InvoiceSeriesState]:
+        """Process invoices (sorted by period) into series state.
 
-        if descriptions is None:
-            descriptions = {}
+        Returns snapshot of the state taken before the last processed period.
+        """
+        entries, keys, descriptions = state.entries, state.keys, state.descriptions
+        snapshot: Optional[_InvoiceSeriesState] = None
 
         def _get_description(values_: Mapping[str, float]):
             return ", ".join(
@@ -64,91 +133,134 @@ class AccountWithInvoicesToIndications(
                 )
             )
 
-        def _get_source(invoice_: AbstractInvoice):
-            return str(invoice_.period) + " (" + invoice_.id + ")"
-
-        def _update_extra_values(extra_keys: Iterable[str]):
-            zero_extra = dict.fromkeys(extra_keys, 0.0)
-            for indication in all_indications.values():
-                values = dict(indication.values)
-                values.update(zero_extra)
-                object.__setattr__(indication, "values", MappingProxyType(values))
+        for invoice in invoices:
+            period = invoice.period
+            if state.boundary is None or period > state.boundary:
+                snapshot = state.copy()
+                snapshot.boundary = period
+                state.boundary = period
 
-        def _process_values(next_invoice_: AbstractInvoice):
-            nonlocal previous_indication
-            next_values, next_descriptions = self._get_invoice_values(next_invoice_)
-
-            period = next_invoice_.period
-            period_present = period in all_indications
-
-            if period_present:
-                merged_values_source = all_indications[period].values
-            else:
-                merged_values_source = previous_indication.values
+            next_values, next_descriptions = self._get_invoice_values(invoice)
+            source = str(period) + " (" + invoice.id + ")"
 
-            merged_values = dict(merged_values_source)
+            if state.values is None:
+                # First invoice determines series origin
+                if next_descriptions is not None:
+                    descriptions.update(next_descriptions)
 
-            extra_keys = next_values.keys() - merged_values.keys()
-            if extra_keys:
-                _update_extra_values(extra_keys)
-                for key in extra_keys:
-                    merged_values[key] = 0.0
+                if not any(next_values.values()):
+                    state.values = dict(next_values)
+                    keys.extend(next_values.keys())
+                    entries.append(
+                        _InvoiceSeriesEntry(
+                            period=period,
+                            values=state.values,
+                            source=source,
+                            description=_get_description(next_values),
+                            visible=False,
+                            key_count=len(keys),
+                        )
+                    )
+                    continue
+
+                state.values = {}
+
+            merged_values = dict(state.values)
+
+            for key in next_values.keys() - merged_values.keys():
+                merged_values[key] = 0.0
+                if key not in keys:
+                    keys.append(key)
 
             for key, value in next_values.items():
                 merged_values[key] = round(merged_values[key] + value, 2)
 
-            if period_present:
-                object.__setattr__(
-                    all_indications[period], "values", MappingProxyType(merged_values)
-                )
+            state.values = merged_values
+            last_entry = entries[-1] if entries else None
+
+            if last_entry is not None and last_entry.visible and last_entry.period == period:
+                # Invoices of the same period only add up values; descriptions
+                # are kept as of the first invoice of the period.
+                last_entry.values = merged_values
+                last_entry.key_count = len(keys)
             else:
                 if next_descriptions is not None:
                     descriptions.update(next_descriptions)
 
-                indication_at = _date_as_datetime(next_invoice_.period)
-                previous_indication = IndicationContainer(
-                    account=self,
-                    meter_code="invoice",
-                    taken_at=indication_at,
-                    values=merged_values,
-                    taken_by=None,
-                    source=_get_source(next_invoice_),
-                    description=_get_description(merged_values),
+                entries.append(
+                    _InvoiceSeriesEntry(
+                        period=period,
+                        values=merged_values,
+                        source=source,
+                        description=_get_description(merged_values),
+                        key_count=len(keys),
+                    )
                 )
 
-                if indication_at.astimezone(pytz.utc) >= start:
-                    all_indications[period] = previous_indication
-
-        def _date_as_datetime(d: "date"):
-            return datetime(year=d.year, month=d.month, day=d.day)
-
-        if any(init_values.values()):
-            next_invoice = previous_invoice
-            previous_indication = IndicationContainer(
-                account=self,
-                meter_code="invoice",
-                taken_at=_INIT_DATETIME,
-                values=dict.fromkeys(init_values.keys(), 0.0),
-                taken_by=None,
-                source=None,
-                description="<Virtual init values>",
-            )
-            _process_values(next_invoice)
+        return snapshot
+
+    async def async_get_indications_from_invoices(
+        self, start: AnyDateArg = None, end: AnyDateArg = None
+    ) -> List[IndicationContainer]:
+        start, end = process_start_end_arguments(start, end, self.timezone)
+
+        checkpoint = self._invoice_series_checkpoint
+        if checkpoint is None:
+            state, fetch_start = _InvoiceSeriesState(), _INIT_DATETIME
         else:
-            previous_indication = IndicationContainer(
-                account=self,
-                meter_code="invoice",
-                taken_at=_date_as_datetime(previous_invoice.period),
-                values=init_values,
-                taken_by=None,
-                source=_get_source(previous_invoice),
-                description=_get_description(init_values),
+            state = checkpoint.copy()
+            fetch_start = datetime(
+                year=checkpoint.boundary.year,
+                month=checkpoint.boundary.month,
+                day=checkpoint.boundary.day,
+                tzinfo=end.tzinfo,
+            )
+
+        if fetch_start <= end:
+            invoices = sorted(
+                await self.async_get_invoices(fetch_start, end), key=attrgetter("sort_key")
             )
+            if checkpoint is not None:
+                invoices = [x for x in invoices if x.period >= checkpoint.boundary]
+
+            snapshot = self._extend_invoice_series(state, invoices)
+            if snapshot is not None and (
+                checkpoint is None or snapshot.boundary > checkpoint.boundary
+            ):
+                self._invoice_series_checkpoint = snapshot
+
+        end_date = end.date()
+        entries = [entry for entry in state.entries if entry.period <= end_date]
+        if not entries:
+            return []
+
+        # Keys encountered later are zero-filled in a single pass
+        zero_values = dict.fromkeys(state.keys[: entries[-1].key_count], 0.0)
+
+        indications = []
+        for entry in entries:
+            indication_at = _date_as_datetime(entry.period)
+            if not entry.visible or indication_at.astimezone(pytz.utc) < start:
+                continue
 
-        for next_invoice in invoices_iterator:
-            _process_values(next_invoice)
+            values = dict(entry.values)
+            if len(values) < len(zero_values):
+                for key in zero_values.keys() - values.keys():
+                    values[key] = 0.0
+
+            indications.append(
+                IndicationContainer(
+                    account=self,
+                    meter_code=INVOICE_METER_CODE,
+                    taken_at=indication_at,
+                    values=values,
+                    taken_by=None,
+                    source=entry.source,
+                    description=entry.description,
+                )
+            )
 
-        return list(all_indications.values())
+        return indications
 
     async def async_get_indications(
         self,
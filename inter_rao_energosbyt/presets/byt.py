@@ -12,9 +12,13 @@ __all__ = (
     "AccountWithBytPayments",
     "AccountWithBytTariffHistory",
     "AccountWithStaticBytProxy",
+    "BYT_INDICATIONS_HISTORY",
+    "BYT_INVOICES_HISTORY",
+    "BYT_PAYMENTS_HISTORY",
     "BytAccountBase",
     "BytAccountWithInfoBase",
     "BytBalance",
+    "BytChargeEstimate",
     "BytCheckupStatus",
     "BytIndication",
     "BytInfoDouble",
@@ -32,11 +36,14 @@ __all__ = (
 import asyncio
 from abc import ABC, abstractmethod
 from datetime import date, datetime
+from functools import lru_cache
 from types import MappingProxyType
 from typing import (
     Any,
+    ClassVar,
     Dict,
     Generic,
+    Iterable,
     List,
     Mapping,
     Optional,
@@ -72,6 +79,7 @@ from inter_rao_energosbyt.converters import (
     conv_str_optional,
 )
 from inter_rao_energosbyt.exceptions import EnergosbytException
+from inter_rao_energosbyt.history import HistoryKind
 from inter_rao_energosbyt.interfaces import (
     AbstractAccountWithBalance,
     AbstractAccountWithIndications,
@@ -94,7 +102,7 @@ from inter_rao_energosbyt.presets.containers import (
     TariffHistoryEntry,
     ZoneHistoryEntry,
 )
-from inter_rao_energosbyt.util import AnyDateArg, process_start_end_arguments
+from inter_rao_energosbyt.util import AnyDateArg, get_submission_period, process_start_end_arguments
 
 if TYPE_CHECKING:
     from inter_rao_energosbyt.actions.sql.byt import _LSInfoBase
@@ -102,16 +110,63 @@ if TYPE_CHECKING:
 _TAccount = TypeVar("_TAccount", bound=Account)
 
 
+@lru_cache(maxsize=None)
+def _get_zone_search_names(data_cls: type, search_key: str) -> Tuple[str, ...]:
+    # Attribute names that may denote zone presence, in probing order
+    field_names = attr.fields_dict(data_cls)
+    search_names = []
+    while search_key % (len(search_names) + 1) in field_names:
+        search_names.append(search_key % (len(search_names) + 1))
+    return tuple(search_names)
+
+
+@lru_cache(maxsize=None)
+def _get_zone_ids(tariff_key: str, zone_count: int) -> Tuple[str, ...]:
+    return tuple(map(tariff_key.__mod__, range(1, zone_count + 1)))
+
+
 def _extract_numerical_zone_ids(
     data: object,
     search_key: str = "nm_t%d",
     tariff_key: str = "t%d",
 ) -> Tuple[str, ...]:
-    tariff_count = 1
-    while getattr(data, search_key % tariff_count, None) is not None:
-        tariff_count += 1
+    tariff_count = 0
+
+    if attr.has(data.__class__):
+        for search_name in _get_zone_search_names(data.__class__, search_key):
+            if getattr(data, search_name) is None:
+                break
+            tariff_count += 1
+    else:
+        while getattr(data, search_key % (tariff_count + 1), None) is not None:
+            tariff_count += 1
+
+    return _get_zone_ids(tariff_key, tariff_count)
+
+
+@lru_cache(maxsize=None)
+def _get_zone_accessors(
+    data_cls: type, zone_count: int, templates: Tuple[str, ...]
+) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    # Per-zone attribute names, formatted once per (class, zone count)
+    return tuple(
+        (zone_id, tuple(template % zone_id for template in templates))
+        for zone_id in _get_zone_ids("t%d", zone_count)
+    )
+
 
-    return tuple(map(tariff_key.__mod__, range(1, tariff_count)))
+def _extract_zone_values(
+    data: object, *templates: str
+) -> Tuple[Tuple[str, Tuple[Any, ...]], ...]:
+    """Retrieve values of templated (e.g. `"vl_%s_tariff"`) attributes for every zone.
+
+    Missing attributes are substituted with `None`.
+    """
+    zone_count = len(_extract_numerical_zone_ids(data))
+    return tuple(
+        (zone_id, tuple(getattr(data, name, None) for name in names))
+        for zone_id, names in _get_zone_accessors(data.__class__, zone_count, templates)
+    )
 
 
 class WithBytProxy(ABC):
@@ -133,15 +188,12 @@ class WithBytProxy(ABC):
 
     @final
     async def _internal_async_prepare_byt_preset_parameters(self) -> Tuple[str, str]:
-        proxy, provider = self.byt_plugin_proxy, self.byt_plugin_provider
-
-        if proxy is None or provider is None:
-            proxy, provider = await self.async_update_byt_preset_parameters()
-
-            if proxy is None or provider is None:
-                raise EnergosbytException("Could not retrieve byt plugin paramters")
+        return await self._internal_async_prepare_preset_parameters(
+            "byt", self.async_update_byt_preset_parameters
+        )
 
-        return proxy, provider
+    def invalidate_byt_preset_parameters(self) -> None:
+        self.invalidate_preset_parameters("byt")
 
 
 class WithStaticBytProxy(WithBytProxy, ABC):
@@ -192,24 +244,36 @@ class BytPayment(AbstractPayment, WithAccount["AccountWithBytPayments"]):
         return self.status == "Зачислен"
 
 
+BYT_PAYMENTS_HISTORY: HistoryKind[Pays] = HistoryKind(
+    name="byt_payments",
+    data_cls=Pays,
+    get_id=lambda x: x.dt_pay + "_" + str(x.sm_pay),
+    get_time=lambda x: x.dt_pay,
+)
+
+
 class AccountWithBytPayments(WithBytProxy, AbstractAccountWithPayments[BytPayment], ABC):
     __slots__ = ()
 
+    dated_chunk_months: ClassVar[Optional[int]] = 12
+
+    async def _async_fetch_byt_payments_data(self, start: "datetime", end: "datetime"):
+        proxy, provider = await self._internal_async_prepare_byt_preset_parameters()
+        return await Pays.async_request(self.api, proxy, provider, dt_st=start, dt_en=end)
+
     async def async_get_byt_payments(
         self, start: AnyDateArg = None, end: AnyDateArg = None
     ) -> List[BytPayment]:
         start, end = process_start_end_arguments(start, end, self.timezone)
-        proxy, provider = await self._internal_async_prepare_byt_preset_parameters()
         from_response = BytPayment.from_response
         return list(
             map(
                 lambda x: from_response(self, x),
-                await Pays.async_request(
-                    self.api,
-                    proxy,
-                    provider,
-                    dt_st=start,
-                    dt_en=end,
+                await self._internal_async_fetch_dated(
+                    BYT_PAYMENTS_HISTORY,
+                    start,
+                    end,
+                    self._async_fetch_byt_payments_data,
                 ),
             )
         )
@@ -233,7 +297,7 @@ class BytIndication(IndicationContainer, WithAccount["AccountWithBytIndications"
 
     @classmethod
     def from_response(cls, account: "AccountWithBytIndications", data: "Indications"):
-        zone_ids = _extract_numerical_zone_ids(data)
+        zone_values = _extract_zone_values(data, "vl_%s", "pr_zone_%s")
 
         dt_invoice_period = data.dt_invoice_period
         invoice_period: Optional["date"] = (
@@ -249,7 +313,7 @@ class BytIndication(IndicationContainer, WithAccount["AccountWithBytIndications"
 
         return cls(
             account=account,
-            values={zone_id: getattr(data, "vl_" + zone_id) for zone_id in zone_ids},
+            values={zone_id: value for zone_id, (value, _) in zone_values},
             taken_at=datetime.fromisoformat(data.dt_indication),
             source=data.nm_indication_take,
             taken_by=data.nm_description_take,
@@ -257,54 +321,75 @@ class BytIndication(IndicationContainer, WithAccount["AccountWithBytIndications"
             invoice_period=invoice_period,
             meter_installation_date=meter_installation_date,
             meter_precision=data.vl_meter_precision,
-            zone_periods={zone_id: getattr(data, "pr_zone_" + zone_id) for zone_id in zone_ids},
+            zone_periods={zone_id: period for zone_id, (_, period) in zone_values},
         )
 
+    @classmethod
+    def from_responses(
+        cls, account: "AccountWithBytIndications", datum: Iterable["Indications"]
+    ) -> List["BytIndication"]:
+        from_response = cls.from_response
+        return [from_response(account, data) for data in datum]
+
+
+BYT_INDICATIONS_HISTORY: HistoryKind[Indications] = HistoryKind(
+    name="byt_indications",
+    data_cls=Indications,
+    get_id=lambda x: "%s_%s_%s_%s_%s"
+    % (x.dt_indication, x.dt_meter_installation, x.vl_t1, x.vl_t2, x.vl_t3),
+    get_time=lambda x: x.dt_indication,
+)
+
 
 class AccountWithBytIndications(WithBytProxy, AbstractAccountWithIndications[BytIndication], ABC):
     __slots__ = ()
 
+    dated_chunk_months: ClassVar[Optional[int]] = 12
+
     async def async_get_indications(
         self, start: AnyDateArg = None, end: AnyDateArg = None
     ) -> List[BytIndication]:
         return await self.async_get_byt_indications(start, end)
 
+    async def _async_fetch_byt_indications_data(self, start: "datetime", end: "datetime"):
+        proxy, provider = await self._internal_async_prepare_byt_preset_parameters()
+        return await Indications.async_request(self.api, proxy, provider, dt_st=start, dt_en=end)
+
     async def async_get_byt_indications(
         self, start: AnyDateArg = None, end: AnyDateArg = None
     ) -> List[BytIndication]:
         start, end = process_start_end_arguments(start, end, self.timezone)
-        proxy, provider = await self.async_update_byt_preset_parameters()
 
-        response = await Indications.async_request(
-            self.api,
-            proxy,
-            provider,
-            dt_st=start,
-            dt_en=end,
+        # Both indications and info requests depend only on preset parameters;
+        # resolve those once, then perform both requests concurrently.
+        await self._internal_async_prepare_byt_preset_parameters()
+
+        fetch_indications = self._internal_async_fetch_dated(
+            BYT_INDICATIONS_HISTORY,
+            start,
+            end,
+            self._async_fetch_byt_indications_data,
         )
 
-        from_response = BytIndication.from_response
+        with_info = isinstance(self, AccountWithBytInfo)
+        info = self.info if with_info else None
 
-        def _create_indication(response_item: "Indications"):
-            return from_response(self, response_item)
+        if with_info and info is None:
+            response, info = await asyncio.gather(fetch_indications, self.async_update_info())
+        else:
+            response = await fetch_indications
 
-        # @TODO: add meter code
-        if isinstance(self, AccountWithBytInfo):
-            info = self.info
-            if info is None:
-                info = await self.async_update_info()
+        indications = BytIndication.from_responses(self, response)
 
+        # @TODO: add meter code
+        if info is not None:
             meter_code, meter_installation_date = info.meter_code, info.meter_installation_date
             if meter_code is not None and meter_installation_date is not None:
-                _orig_create_indication = _create_indication
-
-                def _create_indication(response_item: "Indications"):
-                    indication = _orig_create_indication(response_item)
+                for indication in indications:
                     if indication.meter_installation_date == meter_installation_date:
                         object.__setattr__(indication, "meter_code", meter_code)
-                    return indication
 
-        return list(map(_create_indication, response))
+        return indications
 
 
 BYT_INVOICE_SECTION = "byt_invoice_section"
@@ -387,31 +472,53 @@ class BytInvoice(InvoiceContainer, WithAccount["AccountWithBytInvoices"]):
     details: Sequence[BytInvoiceDetail] = attr.ib(converter=tuple, factory=tuple)
 
     @classmethod
-    def byt_invoice_sections(cls) -> Dict[str, str]:
+    def byt_invoice_sections(cls) -> Mapping[str, str]:
+        """Retrieve mapping of invoice section labels to field names (cached per class)"""
+        try:
+            return _BYT_INVOICE_SECTIONS[cls]
+        except KeyError:
+            pass
+
         invoice_sections = {}
         for field in attr.fields(cls):
             invoice_section = field.metadata.get(BYT_INVOICE_SECTION)
             if invoice_section:
                 invoice_sections[invoice_section] = field.name
 
+        invoice_sections = _BYT_INVOICE_SECTIONS[cls] = MappingProxyType(invoice_sections)
         return invoice_sections
 
     @classmethod
     def from_response(cls, account: "AccountWithBytInvoices", data: Invoice) -> "BytInvoice":
-        section_args = {}
+        return cls._from_response(account, data, cls.byt_invoice_sections())
+
+    @classmethod
+    def from_responses(
+        cls, account: "AccountWithBytInvoices", datum: Iterable[Invoice]
+    ) -> List["BytInvoice"]:
+        """Create invoices from multiple responses at once"""
         invoice_sections = cls.byt_invoice_sections()
+        return [cls._from_response(account, data, invoice_sections) for data in datum]
+
+    @classmethod
+    def _from_response(
+        cls,
+        account: "AccountWithBytInvoices",
+        data: Invoice,
+        invoice_sections: Mapping[str, str],
+    ) -> "BytInvoice":
+        section_args = {}
         for common_data in data.data_common:
-            try:
-                section_args[invoice_sections[common_data.nm_value]] = common_data.vl_value
-            except KeyError:
-                continue
+            field_name = invoice_sections.get(common_data.nm_value)
+            if field_name is not None:
+                section_args[field_name] = common_data.vl_value
 
         invoice_details = []
         for detail_data_group in data.data_detail:
             if len(detail_data_group) != 3:
                 # Safeguard to prevent errors
                 continue
-            header, counted, tariff = tuple(detail_data_group)
+            header, counted, tariff = detail_data_group
             invoice_details.append(
                 BytInvoiceDetail(
                     name=header.nm_value,
@@ -434,31 +541,44 @@ class BytInvoice(InvoiceContainer, WithAccount["AccountWithBytInvoices"]):
         )
 
 
+_BYT_INVOICE_SECTIONS: Dict[Type[BytInvoice], Mapping[str, str]] = {}
+
+
+BYT_INVOICES_HISTORY: HistoryKind[Invoice] = HistoryKind(
+    name="byt_invoices",
+    data_cls=Invoice,
+    get_id=lambda x: str(x.id_korr),
+    get_time=lambda x: x.dt_period,
+)
+
+
 class AccountWithBytInvoices(WithBytProxy, AbstractAccountWithInvoices[BytInvoice], ABC):
     __slots__ = ()
 
+    dated_chunk_months: ClassVar[Optional[int]] = 12
+
     async def async_get_invoices(
         self, start: AnyDateArg = None, end: AnyDateArg = None
     ) -> List[BytInvoice]:
         return await self.async_get_byt_invoices(start, end)
 
+    async def _async_fetch_byt_invoices_data(self, start: "datetime", end: "datetime"):
+        proxy, provider = await self._internal_async_prepare_byt_preset_parameters()
+        return await Invoice.async_request(self.api, proxy, provider, dt_st=start, dt_en=end)
+
     async def async_get_byt_invoices(
         self, start: AnyDateArg = None, end: AnyDateArg = None
     ) -> List[BytInvoice]:
         start, end = process_start_end_arguments(start, end, self.timezone)
-        proxy, provider = await self._internal_async_prepare_byt_preset_parameters()
 
-        return list(
-            map(
-                lambda x: BytInvoice.from_response(self, x),
-                await Invoice.async_request(
-                    self.api,
-                    proxy,
-                    provider,
-                    dt_st=start,
-                    dt_en=end,
-                ),
-            )
+        return BytInvoice.from_responses(
+            self,
+            await self._internal_async_fetch_dated(
+                BYT_INVOICES_HISTORY,
+                start,
+                end,
+                self._async_fetch_byt_invoices_data,
+            ),
         )
 
 
@@ -487,18 +607,41 @@ class BytZoneInfoContainer:
 
     @classmethod
     def from_info(cls, ls_info: "_LSInfoBase", zone_id: str):
-        return cls(
-            name=getattr(ls_info, f"nm_{zone_id}"),
-            description=getattr(ls_info, f"nm_{zone_id}_description"),
-            tariff=getattr(ls_info, f"vl_{zone_id}_tariff"),
-            within_name=getattr(ls_info, f"nm_{zone_id}_within", None),
-            within_description=getattr(ls_info, f"nm_{zone_id}_description_within", None),
-            within_tariff=getattr(ls_info, f"vl_{zone_id}_tariff_within", None),
-        )
+        return cls.from_info_zones(ls_info)[zone_id]
+
+    @classmethod
+    def from_info_zones(cls, ls_info: "_LSInfoBase") -> Dict[str, "BytZoneInfoContainer"]:
+        """Create containers for all zones present within info object"""
+        return {
+            zone_id: cls(
+                name=name,
+                description=description,
+                tariff=tariff,
+                within_name=within_name,
+                within_description=within_description,
+                within_tariff=within_tariff,
+            )
+            for zone_id, (
+                name,
+                description,
+                tariff,
+                within_name,
+                within_description,
+                within_tariff,
+            ) in _extract_zone_values(
+                ls_info,
+                "nm_%s",
+                "nm_%s_description",
+                "vl_%s_tariff",
+                "nm_%s_within",
+                "nm_%s_description_within",
+                "vl_%s_tariff_within",
+            )
+        }
 
 
 class _BytInfo(ABC, Generic[_TLSInfoBase]):
-    __slots__ = ("_ls_info",)
+    __slots__ = ("_ls_info", "_zones")
 
     def __str__(self) -> str:
         return f'{self.__class__.__name__}("{self.full_name}", {self.meter_code})'
@@ -515,6 +658,7 @@ class _BytInfo(ABC, Generic[_TLSInfoBase]):
 
     def __init__(self, data: _TLSInfoBase) -> None:
         self._ls_info: _TLSInfoBase = data
+        self._zones: Optional[Mapping[str, BytZoneInfoContainer]] = None
 
     @property
     @abstractmethod
@@ -569,11 +713,12 @@ class _BytInfo(ABC, Generic[_TLSInfoBase]):
 
     @property
     def zones(self) -> Optional[Mapping[str, BytZoneInfoContainer]]:
-        ls_info = self._ls_info
-        return {
-            zone_id: BytZoneInfoContainer.from_info(ls_info, zone_id)
-            for zone_id in _extract_numerical_zone_ids(ls_info)
-        }
+        zones = self._zones
+        if zones is None:
+            zones = self._zones = MappingProxyType(
+                BytZoneInfoContainer.from_info_zones(self._ls_info)
+            )
+        return zones
 
 
 class BytInfoSingle(_BytInfo[LSInfo]):
@@ -748,16 +893,23 @@ class BytMeter(MeterContainer, WithAccount["AccountWithBytMeters"]):
         account: "AccountWithBytMeters",
         data: "Meters",
     ) -> _TBytMeter:
-        zone_ids = _extract_numerical_zone_ids(data)
         zones = {
             zone_id: BytMeterZoneContainer(
-                name=getattr(data, "nm_%s" % zone_id),
-                last_indication=getattr(data, "vl_%s_last_ind" % zone_id),
-                today_indication=getattr(data, "vl_%s_today" % zone_id),
-                invoice_indication=getattr(data, "vl_%s_inv" % zone_id),
-                invoice_name=getattr(data, "nm_%s_inv" % zone_id),
+                name=name,
+                last_indication=last_indication,
+                today_indication=today_indication,
+                invoice_indication=invoice_indication,
+                invoice_name=invoice_name,
+            )
+            for zone_id, (
+                name,
+                last_indication,
+                today_indication,
+                invoice_indication,
+                invoice_name,
+            ) in _extract_zone_values(
+                data, "nm_%s", "vl_%s_last_ind", "vl_%s_today", "vl_%s_inv", "nm_%s_inv"
             )
-            for zone_id in zone_ids
         }
 
         dt_ind_inv = data.dt_ind_inv
@@ -793,6 +945,22 @@ class BytMeter(MeterContainer, WithAccount["AccountWithBytMeters"]):
         )
 
 
+@attr.s(kw_only=True, frozen=True, slots=True)
+class BytChargeEstimate:
+    """Charge for prospective indications.
+
+    :param charge: Charge amount
+    :param is_confirmed: Whether the charge was calculated by the portal
+    :param tariff: Tariff history entry used for local estimation
+    :param consumption: Consumption per zone used for local estimation
+    """
+
+    charge: float = attr.ib(converter=float)
+    is_confirmed: bool = attr.ib()
+    tariff: Optional["BytTariffHistoryEntry"] = attr.ib(default=None)
+    consumption: Mapping[str, float] = attr.ib(converter=MappingProxyType, factory=dict)
+
+
 class AbstractBytSubmittableMeter(
     AbstractSubmittableMeter, AbstractCalculatableMeter, BytMeter, ABC
 ):
@@ -800,11 +968,10 @@ class AbstractBytSubmittableMeter(
 
     @property
     def submission_period(self) -> Tuple["date", "date"]:
-        today = date.today()
-        return (
-            today.replace(day=self._period_start_day),
-            today.replace(day=self._period_end_day),
-        )
+        return self.get_submission_period(date.today())
+
+    def get_submission_period(self, on_date: "date") -> Tuple["date", "date"]:
+        return get_submission_period(on_date, self._period_start_day, self._period_end_day)
     
     @property
     def save_indications_query(self) -> str:
@@ -880,13 +1047,9 @@ class AbstractBytSubmittableMeter(
         **kwargs,
     ) -> SupportsFloat:
         request_data = await self._prepare_byt_indications_request(t1=t1, t2=t2, t3=t3, **kwargs)
+        proxy, provider = await self.account._internal_async_prepare_byt_preset_parameters()
 
-        response = await CalcCharge.async_request(
-            self.account.api,
-            self.account.byt_plugin_proxy,
-            self.account.byt_plugin_provider,
-            **request_data,
-        )
+        response = await CalcCharge.async_request(self.account.api, proxy, provider, **request_data)
 
         if not response.is_success:
             raise EnergosbytException(
@@ -909,6 +1072,113 @@ class AbstractBytSubmittableMeter(
 
         return charge
 
+    async def _async_estimate_charge_locally(
+        self, values: Mapping[str, Any], social_norm: Optional[float]
+    ) -> Optional[BytChargeEstimate]:
+        account = self.account
+        if not isinstance(account, AbstractAccountWithTariffHistory):
+            return None
+
+        try:
+            tariff_history = await account.async_get_tariff_history_snapshot()
+        except EnergosbytException:
+            return None
+
+        today = datetime.now(account.timezone).date()
+        billing_start = today.replace(day=1)
+
+        retrieved_at = account.tariff_history_snapshot_time
+        if retrieved_at is None or retrieved_at.astimezone(account.timezone).date() < billing_start:
+            # Tariffs retrieved before current billing period may be outdated
+            return None
+
+        for tariff in tariff_history:
+            if tariff.start_date <= today and (tariff.end_date is None or today <= tariff.end_date):
+                break
+        else:
+            # Tariff history does not cover current date
+            return None
+
+        consumption = {}
+        for zone_id, zone in self.zones.items():
+            if zone_id not in tariff.zones:
+                return None
+            last_indication = zone.last_indication
+            value = values.get(zone_id)
+            if value is None:
+                value = last_indication or 0.0
+            if last_indication is None or value < last_indication:
+                # Consumption can not be derived (e.g. meter reset)
+                return None
+            consumption[zone_id] = float(value) - last_indication
+
+        # Social norm is distributed among zones proportionally to their consumption
+        norm_volume = sum(
+            volume
+            for zone_id, volume in consumption.items()
+            if tariff.zones[zone_id].within_value is not None
+        )
+        norm_share = min(1.0, (social_norm or 0.0) / norm_volume) if norm_volume else 0.0
+
+        charge = 0.0
+        for zone_id, volume in consumption.items():
+            zone_tariff = tariff.zones[zone_id]
+
+            within_volume = 0.0
+            if zone_tariff.within_value is not None:
+                within_volume = volume * norm_share
+                charge += within_volume * zone_tariff.within_value
+
+            charge += (volume - within_volume) * zone_tariff.tariff
+
+        return BytChargeEstimate(
+            charge=round(charge, 2),
+            is_confirmed=False,
+            tariff=tariff,
+            consumption=consumption,
+        )
+
+    async def async_estimate_indications_charge(
+        self,
+        *,
+        t1: Optional[IndicationType] = None,
+        t2: Optional[IndicationType] = None,
+        t3: Optional[IndicationType] = None,
+        social_norm: Optional[float] = None,
+        confirm: bool = False,
+        ignore_periods: bool = False,
+        ignore_values: bool = False,
+        **kwargs,
+    ) -> BytChargeEstimate:
+        """Estimate charge for indications without submitting them.
+
+        Charge is computed locally from the account's tariff history snapshot
+        and meter's last indications. Portal calculation (`CalcCharge`) is used
+        when confirmation is requested, tariff history was retrieved before current
+        billing period or does not cover current date, or consumption can not be
+        derived locally. Social norm is distributed among zones proportionally
+        to their consumption.
+
+        :param social_norm: Consumption volume charged at social norm ("within") tariffs
+        :param confirm: Always calculate charge with the portal
+        """
+        values = await self._internal_async_perform_pre_transmission_checks(
+            ignore_periods=ignore_periods,
+            ignore_values=ignore_values,
+            t1=t1,
+            t2=t2,
+            t3=t3,
+            **kwargs,
+        )
+
+        if not confirm:
+            estimate = await self._async_estimate_charge_locally(values, social_norm)
+            if estimate is not None:
+                return estimate
+
+        charge = await self._internal_async_calculate_indications(**values)
+        return BytChargeEstimate(charge=charge, is_confirmed=True)
+
     async def async_submit_indications(
         self,
         *,
@@ -946,7 +1216,7 @@ class AbstractBytSubmittableMeter(
         response = await SaveIndications.async_request(
             self.account.api,
             self.byt_plugin_submit_indications,
-            self.account.byt_plugin_provider,
+            provider,
             **request_data,
             query=self.save_indications_query
         )
@@ -1016,7 +1286,7 @@ class AccountWithBytBalance(WithBytProxy, AbstractAccountWithBalance[BytBalance]
     __slots__ = ()
 
     async def async_get_byt_balance(self) -> BytBalance:
-        proxy, provider = await self.async_update_byt_preset_parameters()
+        proxy, provider = await self._internal_async_prepare_byt_preset_parameters()
         response_balance = await CurrentBalance.async_request(self.api, proxy, provider)
         if response_balance is None:
             raise EnergosbytException("server did not respond with byt balance data")
@@ -1040,12 +1310,14 @@ class BytTariffHistoryEntry(TariffHistoryEntry, WithAccount["AccountWithBytTarif
     ) -> "BytTariffHistoryEntry":
         zones = {
             zone_id: ZoneHistoryEntry(
-                name=getattr(data, "nm_" + zone_id),
-                tariff=getattr(data, "vl_" + zone_id + "_tariff"),
-                within_name=getattr(data, "nm_" + zone_id + "_within", None),
-                within_value=getattr(data, "vl_" + zone_id + "_tariff_within", None),
+                name=name,
+                tariff=tariff,
+                within_name=within_name,
+                within_value=within_value,
+            )
+            for zone_id, (name, tariff, within_name, within_value) in _extract_zone_values(
+                data, "nm_%s", "vl_%s_tariff", "nm_%s_within", "vl_%s_tariff_within"
             )
-            for zone_id in _extract_numerical_zone_ids(data)
         }
 
         transmission_cost = data.vl_give_vltr
@@ -1062,14 +1334,21 @@ class BytTariffHistoryEntry(TariffHistoryEntry, WithAccount["AccountWithBytTarif
             transmission_cost=transmission_cost,
         )
 
+    @classmethod
+    def from_responses(
+        cls, account: "AccountWithBytTariffHistory", datum: Iterable["TariffHistory"]
+    ) -> List["BytTariffHistoryEntry"]:
+        from_response = cls.from_response
+        return [from_response(account, data) for data in datum]
+
 
 class AccountWithBytTariffHistory(
     WithBytProxy, AbstractAccountWithTariffHistory[BytTariffHistoryEntry], ABC
 ):
     async def async_get_byt_tariff_history(self) -> List[BytTariffHistoryEntry]:
-        proxy, provider = await self.async_update_byt_preset_parameters()
+        proxy, provider = await self._internal_async_prepare_byt_preset_parameters()
         response = await TariffHistory.async_request(self.api, proxy, provider)
-        return list(map(lambda x: BytTariffHistoryEntry.from_response(self, x), response))
+        return BytTariffHistoryEntry.from_responses(self, response)
 
     async def async_get_tariff_history(self) -> List[BytTariffHistoryEntry]:
         return await self.async_get_byt_tariff_history()
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from datetime import date, datetime
-from typing import Any, Iterable, List, Mapping, Optional, TYPE_CHECKING, Tuple, Union, final
+from types import MappingProxyType
+from typing import Any, Iterable, List, Mapping, Optional, Tuple, Union, final
 
 import attr
 
@@ -14,11 +15,13 @@ from inter_rao_energosbyt.converters import (
     conv_datestr_optional,
 )
 from inter_rao_energosbyt.exceptions import EnergosbytException
+from inter_rao_energosbyt.history import HistoryKind
 from inter_rao_energosbyt.interfaces import (
     AbstractAccountWithMeters,
     AbstractBalance,
     AbstractIndication,
     AbstractInvoice,
+    AbstractMeter,
     AbstractMeterZone,
     AbstractPayment,
     AbstractAccountWithBalance,
@@ -40,10 +43,12 @@ from inter_rao_energosbyt.actions.sql.abonent import (
     AbonentSaveIndication,
 )
 from inter_rao_energosbyt.presets.adapters import AccountWithInvoicesToIndications
-from inter_rao_energosbyt.util import AnyDateArg, extrapolate_zone_id, process_start_end_arguments
-
-if TYPE_CHECKING:
-    from inter_rao_energosbyt.actions.sql.abonent import _AbonentChargeDetailBase
+from inter_rao_energosbyt.util import (
+    AnyDateArg,
+    get_submission_period,
+    process_start_end_arguments,
+    resolve_zone_id,
+)
 
 
 class WithSmorodinaProxy(ABC):
@@ -64,15 +69,12 @@ class WithSmorodinaProxy(ABC):
         pass
 
     async def _internal_async_prepare_smorodina_preset_parameters(self) -> Tuple[str, str]:
-        proxy, provider = self.smorodina_plugin_proxy, self.smorodina_plugin_provider
-
-        if proxy is None or provider is None:
-            proxy, provider = await self.async_update_smorodina_preset_parameters()
-
-            if proxy is None or provider is None:
-                raise EnergosbytException("Could not retrieve smorodina plugin paramters")
+        return await self._internal_async_prepare_preset_parameters(
+            "smorodina", self.async_update_smorodina_preset_parameters
+        )
 
-        return proxy, provider
+    def invalidate_smorodina_preset_parameters(self) -> None:
+        self.invalidate_preset_parameters("smorodina")
 
 
 class WithStaticSmorodinaProxy(WithSmorodinaProxy, ABC):
@@ -102,11 +104,12 @@ class AccountWithStaticSmorodinaProxy(WithStaticSmorodinaProxy, Account, ABC):
 
 
 class SmorodinaPayment(AbstractPayment):
-    __slots__ = ("_account", "_data")
+    __slots__ = ("_account", "_data", "_paid_at")
 
     def __init__(self, account: "AccountWithSmorodinaPayments", data: "AbonentPays") -> None:
         self._account: "AccountWithSmorodinaPayments" = account
         self._data: "AbonentPays" = data
+        self._paid_at: "datetime" = datetime.fromisoformat(data.dt_pay)
 
     @property
     def account(self) -> "AccountWithSmorodinaPayments":
@@ -114,7 +117,11 @@ class SmorodinaPayment(AbstractPayment):
 
     @property
     def paid_at(self) -> "datetime":
-        return datetime.fromisoformat(self._data.dt_pay)
+        return self._paid_at
+
+    @property
+    def sort_key(self) -> "datetime":
+        return self._paid_at
 
     @property
     def amount(self) -> float:
@@ -133,25 +140,35 @@ class SmorodinaPayment(AbstractPayment):
         return self.status == "Принят"
 
 
+SMORODINA_PAYMENTS_HISTORY: HistoryKind[AbonentPays] = HistoryKind(
+    name="smorodina_payments",
+    data_cls=AbonentPays,
+    get_id=lambda x: x.dt_pay + "_" + str(x.sm_pay) + "_" + x.nm_agnt,
+    get_time=lambda x: x.dt_pay,
+)
+
+
 class AccountWithSmorodinaPayments(
     WithSmorodinaProxy, AbstractAccountWithPayments[SmorodinaPayment], Account, ABC
 ):
     __slots__ = ()
 
+    async def _async_fetch_smorodina_payments_data(self, start: "datetime", end: "datetime"):
+        proxy, provider = await self._internal_async_prepare_smorodina_preset_parameters()
+        return await AbonentPays.async_request(self.api, proxy, provider, dt_st=start, dt_en=end)
+
     async def async_get_smorodina_payments(
         self,
         start: AnyDateArg = None,
         end: AnyDateArg = None,
     ) -> Iterable[SmorodinaPayment]:
         start, end = process_start_end_arguments(start, end, self.timezone)
-        proxy, provider = await self._internal_async_prepare_smorodina_preset_parameters()
 
-        response = await AbonentPays.async_request(
-            self.api,
-            proxy,
-            provider,
-            dt_st=start,
-            dt_en=end,
+        response = await self._internal_async_fetch_dated(
+            SMORODINA_PAYMENTS_HISTORY,
+            start,
+            end,
+            self._async_fetch_smorodina_payments_data,
         )
 
         return list(map(lambda x: SmorodinaPayment(self, x), response))
@@ -226,25 +243,10 @@ class SmorodinaMeter(MeterContainer, WithAccount["AccountWithSmorodinaMeters"]):
 
     @property
     def submission_period(self) -> Tuple["date", "date"]:
-        today = date.today()
-
-        start_date = today.replace(day=self._period_start_day or 1)
-
-        period_end_day = self._period_end_day
+        return self.get_submission_period(date.today())
 
-        if period_end_day is None:
-            end_date = today
-            day = 31
-            while True:
-                try:
-                    end_date = end_date.replace(day=day)
-                    break
-                except ValueError:
-                    day -= 1
-        else:
-            end_date = today.replace(day=period_end_day)
-
-        return (start_date, end_date)
+    def get_submission_period(self, on_date: "date") -> Tuple["date", "date"]:
+        return get_submission_period(on_date, self._period_start_day, self._period_end_day)
 
 
 class AbstractSmorodinaSubmittableMeter(
@@ -331,13 +333,18 @@ class AccountWithSmorodinaMeters(
 
 
 class SmorodinaIndication(AbstractIndication):
-    __slots__ = ("_account", "_data")
+    __slots__ = ("_account", "_data", "_taken_at", "_values", "_sort_key")
 
     def __init__(
         self, account: "AccountWithSmorodinaIndications", data: "AbonentIndications"
     ) -> None:
         self._account: "AccountWithSmorodinaIndications" = account
         self._data: "AbonentIndications" = data
+        self._taken_at: "datetime" = datetime.fromisoformat(data.dt_indication)
+        self._values: Mapping[str, Optional[float]] = MappingProxyType(
+            {"t" + str(data.id_counter_zn): data.vl_indication}
+        )
+        self._sort_key: Tuple["datetime", float] = (self._taken_at, -(data.vl_indication or 0.0))
 
     @property
     def account(self) -> "AccountWithSmorodinaIndications":
@@ -349,11 +356,15 @@ class SmorodinaIndication(AbstractIndication):
 
     @property
     def taken_at(self) -> "datetime":
-        return datetime.fromisoformat(self._data.dt_indication)
+        return self._taken_at
 
     @property
     def values(self) -> Mapping[str, Optional[float]]:
-        return {str(self.zone_id): self._data.vl_indication}
+        return self._values
+
+    @property
+    def sort_key(self) -> Tuple["datetime", float]:
+        return self._sort_key
 
     @property
     def epd_date(self) -> Optional["date"]:
@@ -404,6 +415,14 @@ class SmorodinaIndication(AbstractIndication):
         return self._data.nn_pu
 
 
+SMORODINA_INDICATIONS_HISTORY: HistoryKind[AbonentIndications] = HistoryKind(
+    name="smorodina_indications",
+    data_cls=AbonentIndications,
+    get_id=lambda x: str(x.id_indication),
+    get_time=lambda x: x.dt_indication,
+)
+
+
 class AccountWithSmorodinaIndications(
     WithSmorodinaProxy, AbstractAccountWithIndications[SmorodinaIndication], ABC
 ):
@@ -414,14 +433,33 @@ class AccountWithSmorodinaIndications(
     ) -> List[SmorodinaIndication]:
         return await self.async_get_smorodina_indications(start, end)
 
+    def get_meter_indication_values(
+        self, meter: AbstractMeter, indication: AbstractIndication
+    ) -> Optional[Mapping[str, Optional[float]]]:
+        # Every zone of a physical meter is a separate single-zone meter
+        if isinstance(meter, SmorodinaMeter) and isinstance(indication, SmorodinaIndication):
+            zone_id = "t" + str(meter.zone_id)
+            if indication.meter_id == str(meter.meter_id) and indication.zone_id == zone_id:
+                return {"t1": indication.indication}
+            return None
+        return super().get_meter_indication_values(meter, indication)
+
+    async def _async_fetch_smorodina_indications_data(self, start: "datetime", end: "datetime"):
+        proxy, provider = await self._internal_async_prepare_smorodina_preset_parameters()
+        return await AbonentIndications.async_request(
+            self.api, proxy, provider, dt_st=start, dt_en=end
+        )
+
     async def async_get_smorodina_indications(
         self, start: AnyDateArg = None, end: AnyDateArg = None
     ) -> List[SmorodinaIndication]:
         start, end = process_start_end_arguments(start, end, self.timezone)
-        proxy, provider = await self._internal_async_prepare_smorodina_preset_parameters()
 
-        response = await AbonentIndications.async_request(
-            self.api, proxy, provider, dt_st=start, dt_en=end
+        response = await self._internal_async_fetch_dated(
+            SMORODINA_INDICATIONS_HISTORY,
+            start,
+            end,
+            self._async_fetch_smorodina_indications_data,
         )
 
         return list(map(lambda x: SmorodinaIndication(self, x), response))
@@ -493,6 +531,14 @@ class SmorodinaInvoice(AbstractInvoice):
         return self._data.sm_tovkgo
 
 
+SMORODINA_INVOICES_HISTORY: HistoryKind[AbonentChargeDetail] = HistoryKind(
+    name="smorodina_invoices",
+    data_cls=AbonentChargeDetail,
+    get_id=lambda x: x.dt_period,
+    get_time=lambda x: x.dt_period,
+)
+
+
 class AccountWithSmorodinaInvoices(
     WithSmorodinaProxy, AbstractAccountWithInvoices[SmorodinaInvoice], Account, ABC
 ):
@@ -503,12 +549,9 @@ class AccountWithSmorodinaInvoices(
     ) -> List[SmorodinaInvoice]:
         return await self.async_get_smorodina_invoices(start, end)
 
-    async def async_get_smorodina_invoices(
-        self, start: AnyDateArg = None, end: AnyDateArg = None
-    ) -> List[SmorodinaInvoice]:
-        start, end = process_start_end_arguments(start, end, self.timezone)
+    async def _async_fetch_smorodina_invoices_data(self, start: "datetime", end: "datetime"):
         proxy, provider = await self._internal_async_prepare_smorodina_preset_parameters()
-        response = await AbonentChargeDetail.async_request(
+        return await AbonentChargeDetail.async_request(
             self.api,
             proxy,
             provider,
@@ -517,6 +560,17 @@ class AccountWithSmorodinaInvoices(
             kd_tp_mode=1,
         )
 
+    async def async_get_smorodina_invoices(
+        self, start: AnyDateArg = None, end: AnyDateArg = None
+    ) -> List[SmorodinaInvoice]:
+        start, end = process_start_end_arguments(start, end, self.timezone)
+        response = await self._internal_async_fetch_dated(
+            SMORODINA_INVOICES_HISTORY,
+            start,
+            end,
+            self._async_fetch_smorodina_invoices_data,
+        )
+
         all_invoices = []
         for invoice_group in response:
             period = conv_datestr(invoice_group.dt_period)
@@ -527,13 +581,14 @@ class AccountWithSmorodinaInvoices(
 
 
 class SmorodinaBalance(AbstractBalance):
-    __slots__ = ("_account", "_data")
+    __slots__ = ("_account", "_data", "_timestamp")
 
     def __init__(
         self, account: "AccountWithSmorodinaBalance", data: "AbonentCurrentBalance"
     ) -> None:
         self._account: "AccountWithSmorodinaBalance" = account
         self._data: "AbonentCurrentBalance" = data
+        self._timestamp: "datetime" = datetime.fromisoformat(data.dt_period_balance)
 
     @property
     def account(self) -> "AccountWithSmorodinaBalance":
@@ -541,7 +596,7 @@ class SmorodinaBalance(AbstractBalance):
 
     @property
     def timestamp(self) -> "datetime":
-        return datetime.fromisoformat(self._data.dt_period_balance)
+        return self._timestamp
 
     @property
     def balance(self) -> float:
@@ -586,7 +641,7 @@ class AccountWithSmorodinaBalance(
     __slots__ = ()
 
     async def async_get_balance(self) -> SmorodinaBalance:
-        proxy, provider = self.smorodina_plugin_proxy, self.smorodina_plugin_provider
+        proxy, provider = await self._internal_async_prepare_smorodina_preset_parameters()
         response_balance = await AbonentCurrentBalance.async_request(self.api, proxy, provider)
         if response_balance is None:
             raise EnergosbytException("server did not respond with smorodina balance data")
@@ -605,20 +660,12 @@ class AccountWithVirtualSmorodinaIndications(
         all_values = {}
         name_remaps = {}
 
-        def _recursive_children_collect(current_root: "_AbonentChargeDetailBase"):
-            if isinstance(current_root, AbonentChargeDetailService):
-                service_name = current_root.nm_service
-                try:
-                    remapped_name = name_remaps[service_name]
-                except KeyError:
-                    remapped_name = extrapolate_zone_id(service_name)
-                    name_remaps[service_name] = remapped_name
-                all_values[remapped_name] = current_root.vl_charged_volume
-            if current_root.child is not None:
-                for child in current_root.child:
-                    _recursive_children_collect(child)
-
-        _recursive_children_collect(invoice._data)
+        for _, node in invoice._data.iter_tree():
+            if isinstance(node, AbonentChargeDetailService):
+                service_name = node.nm_service
+                remapped_name = resolve_zone_id(service_name)
+                name_remaps[service_name] = remapped_name
+                all_values[remapped_name] = node.vl_charged_volume
 
         return (all_values, {v: k for k, v in name_remaps.items()})
 
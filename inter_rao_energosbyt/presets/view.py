@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from datetime import date, datetime
 from typing import Iterable, List, Optional, Tuple
 
-from inter_rao_energosbyt.exceptions import EnergosbytException
+from inter_rao_energosbyt.history import HistoryKind
 from inter_rao_energosbyt.interfaces import (
     AbstractAccountWithInvoices,
     AbstractAccountWithPayments,
@@ -39,15 +39,12 @@ class WithViewProxy(ABC):
         pass
 
     async def _internal_async_prepare_view_preset_parameters(self) -> Tuple[str, str]:
-        proxy, provider = self.view_plugin_proxy, self.view_plugin_provider
-
-        if proxy is None or provider is None:
-            proxy, provider = await self.async_update_view_preset_parameters()
-
-            if proxy is None or provider is None:
-                raise EnergosbytException("Could not retrieve view plugin paramters")
+        return await self._internal_async_prepare_preset_parameters(
+            "view", self.async_update_view_preset_parameters
+        )
 
-        return proxy, provider
+    def invalidate_view_preset_parameters(self) -> None:
+        self.invalidate_preset_parameters("view")
 
 
 class WithStaticViewProxy(WithViewProxy, ABC):
@@ -76,11 +73,13 @@ class AccountWithStaticViewProxy(WithStaticViewProxy, Account, ABC):
 
 
 class ViewPayment(AbstractPayment):
-    __slots__ = ("_account", "_data")
+    __slots__ = ("_account", "_data", "_paid_at", "_period")
 
     def __init__(self, account: "AccountWithViewPayments", data: "ViewInfoPaymentReceived") -> None:
         self._account: "AccountWithViewPayments" = account
         self._data: "ViewInfoPaymentReceived" = data
+        self._paid_at: "datetime" = datetime.fromisoformat(data.dt_payment)
+        self._period: "date" = datetime.fromisoformat(data.dt_period).date()
 
     @property
     def account(self) -> "AccountWithViewPayments":
@@ -88,11 +87,15 @@ class ViewPayment(AbstractPayment):
 
     @property
     def paid_at(self) -> "datetime":
-        return datetime.fromisoformat(self._data.dt_payment)
+        return self._paid_at
+
+    @property
+    def sort_key(self) -> "datetime":
+        return self._paid_at
 
     @property
     def period(self) -> "date":
-        return datetime.fromisoformat(self._data.dt_period).date()
+        return self._period
 
     @property
     def agent(self) -> str:
@@ -120,15 +123,21 @@ class ViewPayment(AbstractPayment):
         return str(data.id_service_provider) + "_" + str(data.id_service)
 
 
+VIEW_PAYMENTS_HISTORY: HistoryKind[ViewInfoPaymentReceived] = HistoryKind(
+    name="view_payments",
+    data_cls=ViewInfoPaymentReceived,
+    get_id=lambda x: "%s_%d_%d_%s"
+    % (x.dt_payment, x.id_service_provider, x.id_service, x.payment),
+    get_time=lambda x: x.dt_payment,
+)
+
+
 class AccountWithViewPayments(WithViewProxy, AbstractAccountWithPayments[ViewPayment], ABC):
     __slots__ = ()
 
-    async def async_get_view_payments(
-        self, start: "datetime", end: "datetime"
-    ) -> List[ViewPayment]:
+    async def _async_fetch_view_payments_data(self, start: "datetime", end: "datetime"):
         proxy, provider = await self._internal_async_prepare_view_preset_parameters()
-
-        response = await ViewInfoPaymentReceived.async_request(
+        return await ViewInfoPaymentReceived.async_request(
             self.api,
             proxy,
             provider,
@@ -136,6 +145,18 @@ class AccountWithViewPayments(WithViewProxy, AbstractAccountWithPayments[ViewPay
             dt_end=end,
         )
 
+    async def async_get_view_payments(
+        self, start: AnyDateArg = None, end: AnyDateArg = None
+    ) -> List[ViewPayment]:
+        start, end = process_start_end_arguments(start, end, self.timezone)
+
+        response = await self._internal_async_fetch_dated(
+            VIEW_PAYMENTS_HISTORY,
+            start,
+            end,
+            self._async_fetch_view_payments_data,
+        )
+
         return list(map(lambda x: ViewPayment(self, x), response))
 
     async def async_get_payments(
@@ -145,11 +166,14 @@ class AccountWithViewPayments(WithViewProxy, AbstractAccountWithPayments[ViewPay
 
 
 class ViewInvoice(AbstractInvoice):
-    __slots__ = ("_account", "_data", "_period")
+    __slots__ = ("_account", "_data", "_period", "_total")
 
     def __init__(self, account: "AccountWithViewInvoices", data: "ViewInfoFormedAccounts") -> None:
         self._account: "AccountWithViewInvoices" = account
         self._data: "ViewInfoFormedAccounts" = data
+        self._period: "date" = datetime.fromisoformat(data.dt_period).date()
+        children = data.child
+        self._total: float = sum(x.sm_to_pay for x in children) if children else 0.0
 
     @property
     def account(self) -> "AccountWithViewInvoices":
@@ -157,12 +181,23 @@ class ViewInvoice(AbstractInvoice):
 
     @property
     def period(self) -> "date":
-        return datetime.fromisoformat(self._data.dt_period).date()
+        return self._period
+
+    @property
+    def sort_key(self) -> "date":
+        return self._period
 
     @property
     def total(self) -> float:
-        children = self._data.child
-        return sum(x.sm_to_pay for x in children) if children else 0.0
+        return self._total
+
+
+VIEW_INVOICES_HISTORY: HistoryKind[ViewInfoFormedAccounts] = HistoryKind(
+    name="view_invoices",
+    data_cls=ViewInfoFormedAccounts,
+    get_id=lambda x: x.dt_period,
+    get_time=lambda x: x.dt_period,
+)
 
 
 class AccountWithViewInvoices(WithViewProxy, AbstractAccountWithInvoices[ViewInvoice], ABC):
@@ -173,13 +208,9 @@ class AccountWithViewInvoices(WithViewProxy, AbstractAccountWithInvoices[ViewInv
     ) -> List[ViewInvoice]:
         return await self.async_get_view_invoices(start, end)
 
-    async def async_get_view_invoices(
-        self, start: AnyDateArg = None, end: AnyDateArg = None
-    ) -> List[ViewInvoice]:
-        start, end = process_start_end_arguments(start, end, self.timezone)
+    async def _async_fetch_view_invoices_data(self, start: "datetime", end: "datetime"):
         proxy, provider = await self._internal_async_prepare_view_preset_parameters()
-
-        response = await ViewInfoFormedAccounts.async_request(
+        return await ViewInfoFormedAccounts.async_request(
             self.api,
             proxy,
             provider,
@@ -187,4 +218,16 @@ class AccountWithViewInvoices(WithViewProxy, AbstractAccountWithInvoices[ViewInv
             dt_end=end,
         )
 
+    async def async_get_view_invoices(
+        self, start: AnyDateArg = None, end: AnyDateArg = None
+    ) -> List[ViewInvoice]:
+        start, end = process_start_end_arguments(start, end, self.timezone)
+
+        response = await self._internal_async_fetch_dated(
+            VIEW_INVOICES_HISTORY,
+            start,
+            end,
+            self._async_fetch_view_invoices_data,
+        )
+
         return list(map(lambda x: ViewInvoice(self, x), response))
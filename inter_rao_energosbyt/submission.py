@@ -0,0 +1,903 @@
+__all__ = (
+    "BulkIndicationSubmitter",
+    "IndicationAnomaly",
+    "IndicationAnomalyChecker",
+    "IndicationAnomalyType",
+    "IndicationSubmission",
+    "IndicationSubmissionOutcome",
+    "SubmissionEvent",
+    "SubmissionEventType",
+    "SubmissionKey",
+    "SubmissionScheduler",
+    "SubmissionStatus",
+)
+
+import asyncio
+import functools
+import heapq
+import itertools
+import logging
+from collections import deque
+from datetime import date, datetime, timedelta, tzinfo
+from enum import Enum
+from types import MappingProxyType
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Collection,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    SupportsFloat,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlparse
+
+import attr
+
+from inter_rao_energosbyt.enums import ResponseCodes
+from inter_rao_energosbyt.exceptions import EnergosbytException
+from inter_rao_energosbyt.interfaces import (
+    AbstractAccountWithIndications,
+    AbstractAccountWithMeters,
+    AbstractCalculatableMeter,
+    AbstractIndication,
+    AbstractMeter,
+    AbstractSubmittableMeter,
+    BaseEnergosbytAPI,
+    _AbstractTransmittingMeterBase,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+SubmissionKey = Tuple[str, str, int, str, Tuple[Tuple[str, float], ...]]
+"""Submission identity: (API class, username, account ID, meter ID, zone values)"""
+
+
+class SubmissionStatus(Enum):
+    SUBMITTED = "submitted"
+    CALCULATED = "calculated"
+    DUPLICATE = "duplicate"
+    REJECTED = "rejected"
+    CALCULATION_FAILED = "calculation_failed"
+    FLAGGED = "flagged"
+    FAILED = "failed"
+
+
+@attr.s(kw_only=True, frozen=True, slots=True)
+class IndicationSubmission:
+    """Indications to submit for a single meter.
+
+    :param account: Account the meter belongs to
+    :param meter_id: Meter identifier (as returned by `async_get_meters`)
+    :param values: Zone values (zone ID -> value)
+    :param ignore_periods: Skip submission period check
+    :param ignore_values: Skip check against last indications
+    :param ignore_anomalies: Skip check against indications history
+    """
+
+    account: AbstractAccountWithMeters = attr.ib()
+    meter_id: str = attr.ib()
+    values: Mapping[str, Union[int, float]] = attr.ib(converter=MappingProxyType)
+    ignore_periods: bool = attr.ib(default=False)
+    ignore_values: bool = attr.ib(default=False)
+    ignore_anomalies: bool = attr.ib(default=False)
+
+    @property
+    def key(self) -> SubmissionKey:
+        api = self.account.api
+        return (
+            api.__class__.__name__,
+            api.username,
+            self.account.id,
+            self.meter_id,
+            tuple(sorted((zone_id, float(value)) for zone_id, value in self.values.items())),
+        )
+
+
+@attr.s(kw_only=True, frozen=True, slots=True)
+class IndicationSubmissionOutcome:
+    """Result of processing a single submission.
+
+    :param submission: Processed submission
+    :param status: Processing status
+    :param charge: Charge calculated during dry run (if performed)
+    :param result: Submission response
+    :param error: Exception that stopped processing
+    :param anomalies: Anomalies found by the history check
+    """
+
+    submission: IndicationSubmission = attr.ib()
+    status: SubmissionStatus = attr.ib()
+    charge: Optional[SupportsFloat] = attr.ib(default=None)
+    result: Any = attr.ib(default=None)
+    error: Optional[BaseException] = attr.ib(default=None)
+    anomalies: Tuple["IndicationAnomaly", ...] = attr.ib(converter=tuple, default=())
+
+    @property
+    def is_success(self) -> bool:
+        return self.status in (SubmissionStatus.SUBMITTED, SubmissionStatus.CALCULATED)
+
+
+#################################################################################
+# Anomaly checks
+#################################################################################
+
+
+class IndicationAnomalyType(Enum):
+    DECREASE = "decrease"
+    EXCEEDS_AVERAGE = "exceeds_average"
+
+    @property
+    def response_code(self) -> ResponseCodes:
+        """Portal response code the anomaly is expected to be reported with"""
+        if self is IndicationAnomalyType.EXCEEDS_AVERAGE:
+            return ResponseCodes.INDICATIONS_EXCEED_AVERAGE
+        return ResponseCodes.WARNING_DATA_INCORRECT
+
+
+@attr.s(kw_only=True, frozen=True, slots=True)
+class IndicationAnomaly:
+    """Suspicious value of a single zone.
+
+    :param type: Anomaly type
+    :param zone_id: Zone identifier
+    :param value: Submitted value
+    :param previous: Last known value
+    :param expected: Expected consumption since last known value (if known)
+    """
+
+    type: IndicationAnomalyType = attr.ib()
+    zone_id: str = attr.ib()
+    value: float = attr.ib()
+    previous: float = attr.ib()
+    expected: Optional[float] = attr.ib(default=None)
+
+    @property
+    def response_code(self) -> ResponseCodes:
+        return self.type.response_code
+
+
+@attr.s(kw_only=True, slots=True)
+class _ZoneProfile:
+    last_value: float = attr.ib()
+    last_date: date = attr.ib()
+    rates: Deque[float] = attr.ib()
+    resets: int = attr.ib(default=0)
+
+    @property
+    def average_rate(self) -> Optional[float]:
+        rates = self.rates
+        return sum(rates) / len(rates) if rates else None
+
+
+IndicationsProfile = Dict[str, _ZoneProfile]
+
+
+class IndicationAnomalyChecker:
+    """Local check of prospective indications against indications history.
+
+    Daily consumption rates are derived per zone from consecutive readings;
+    a decrease between readings is treated as a meter reset and starts the
+    series anew. A value is flagged when it is less than the last known one,
+    or when consumption since the last reading exceeds the rolling average
+    (over `window` last intervals) by `threshold` times.
+
+    :param window: Amount of latest intervals the average is computed over
+    :param threshold: Multiplier of expected consumption considered excessive
+    :param min_intervals: Minimum amount of intervals to compare against average
+    :param tolerance: Consumption (per reading) that is never considered excessive
+    :param history_days: Depth of indications history to retrieve
+
+    Indications are attributed to meters (and their zones) with account's
+    `get_meter_indication_values()`. Last values of profiles are replaced with
+    meters' last indications when those are not older, so that series derived
+    from invoices (cumulative volumes, not meter readings) only contribute
+    consumption rates.
+    """
+
+    def __init__(
+        self,
+        window: int = 6,
+        threshold: float = 3.0,
+        min_intervals: int = 2,
+        tolerance: float = 10.0,
+        history_days: int = 400,
+    ) -> None:
+        self.window: int = window
+        self.threshold: float = threshold
+        self.min_intervals: int = min_intervals
+        self.tolerance: float = tolerance
+        self.history_days: int = history_days
+
+    def build_profile(
+        self,
+        indications: Iterable[AbstractIndication],
+        get_values: Optional[
+            Callable[[AbstractIndication], Optional[Mapping[str, Optional[float]]]]
+        ] = None,
+    ) -> IndicationsProfile:
+        """Compute per-zone consumption profile in a single pass over indications.
+
+        :param indications: Indications history
+        :param get_values: Zone values getter (indications it returns `None` for are skipped)
+        """
+        profile: IndicationsProfile = {}
+        window = self.window
+
+        for indication in sorted(indications, key=lambda x: x.sort_key):
+            values = indication.values if get_values is None else get_values(indication)
+            if values is None:
+                continue
+
+            taken_on = indication.taken_at.date()
+            for zone_id, value in values.items():
+                if value is None:
+                    continue
+
+                zone = profile.get(zone_id)
+                if zone is None:
+                    profile[zone_id] = _ZoneProfile(
+                        last_value=value, last_date=taken_on, rates=deque(maxlen=window)
+                    )
+                    continue
+
+                if value < zone.last_value:
+                    # Meter reset (or replacement): consumption series starts anew
+                    zone.resets += 1
+                    zone.rates.clear()
+                else:
+                    days = (taken_on - zone.last_date).days
+                    if days <= 0:
+                        # Repeated reading within the same day extends the interval
+                        zone.last_value = value
+                        continue
+                    zone.rates.append((value - zone.last_value) / days)
+
+                zone.last_value = value
+                zone.last_date = taken_on
+
+        return profile
+
+    def anchor_profile(self, profile: IndicationsProfile, meter: AbstractMeter) -> None:
+        """Replace last values of profile with meter's last indications (when not older)."""
+        last_date = meter.last_indications_date
+        for zone_id, meter_zone in meter.zones.items():
+            last_value = meter_zone.last_indication
+            if last_value is None:
+                continue
+
+            zone = profile.get(zone_id)
+            if zone is None:
+                if last_date is not None:
+                    profile[zone_id] = _ZoneProfile(
+                        last_value=last_value, last_date=last_date, rates=deque(maxlen=self.window)
+                    )
+            elif last_date is None or last_date >= zone.last_date:
+                zone.last_value = last_value
+                if last_date is not None:
+                    zone.last_date = last_date
+
+    def check(
+        self,
+        profile: IndicationsProfile,
+        values: Mapping[str, Union[int, float]],
+        on_date: Optional[date] = None,
+    ) -> List[IndicationAnomaly]:
+        """Check prospective values against profile.
+
+        :param profile: Profile built with `build_profile`
+        :param values: Zone values (zone ID -> value)
+        :param on_date: Date the values are taken on (default: today)
+        """
+        if on_date is None:
+            on_date = date.today()
+
+        anomalies = []
+        for zone_id, value in values.items():
+            zone = profile.get(zone_id)
+            if zone is None or value is None:
+                continue
+
+            value = float(value)
+            if value < zone.last_value:
+                anomalies.append(
+                    IndicationAnomaly(
+                        type=IndicationAnomalyType.DECREASE,
+                        zone_id=zone_id,
+                        value=value,
+                        previous=zone.last_value,
+                    )
+                )
+                continue
+
+            average_rate = zone.average_rate
+            if average_rate is None or len(zone.rates) < self.min_intervals:
+                continue
+
+            expected = average_rate * max((on_date - zone.last_date).days, 1)
+            if value - zone.last_value > max(expected * self.threshold, self.tolerance):
+                anomalies.append(
+                    IndicationAnomaly(
+                        type=IndicationAnomalyType.EXCEEDS_AVERAGE,
+                        zone_id=zone_id,
+                        value=value,
+                        previous=zone.last_value,
+                        expected=expected,
+                    )
+                )
+
+        return anomalies
+
+    async def async_get_history(
+        self, account: AbstractAccountWithMeters
+    ) -> Collection[AbstractIndication]:
+        """Retrieve indications history the profiles of account meters are built from."""
+        if not isinstance(account, AbstractAccountWithIndications):
+            return ()
+
+        end = datetime.now(account.timezone)
+        return await account.async_get_indications(end - timedelta(days=self.history_days), end)
+
+    def build_profiles(
+        self,
+        histories: Mapping[int, Union[Collection[AbstractIndication], BaseException]],
+        meters: Mapping[int, Union[Mapping[str, AbstractMeter], BaseException]],
+        submissions: Iterable[IndicationSubmission],
+    ) -> Dict[Tuple[int, str], Union[IndicationsProfile, BaseException]]:
+        """Build profiles of submitted meters from histories and meters (keyed by `id(account)`)."""
+        profiles: Dict[Tuple[int, str], Union[IndicationsProfile, BaseException]] = {}
+
+        for submission in submissions:
+            account = submission.account
+            account_key = id(account)
+            key = (account_key, submission.meter_id)
+            if key in profiles:
+                continue
+
+            history = histories[account_key]
+            account_meters = meters[account_key]
+            if isinstance(history, BaseException):
+                profiles[key] = history
+            elif isinstance(account_meters, BaseException):
+                profiles[key] = account_meters
+            else:
+                meter = account_meters.get(submission.meter_id)
+                if meter is None or not isinstance(account, AbstractAccountWithIndications):
+                    profiles[key] = {}
+                    continue
+
+                profile = self.build_profile(
+                    history, functools.partial(account.get_meter_indication_values, meter)
+                )
+                self.anchor_profile(profile, meter)
+                profiles[key] = profile
+
+        return profiles
+
+    async def async_check_submissions(
+        self, submissions: Iterable[IndicationSubmission]
+    ) -> List[List[IndicationAnomaly]]:
+        """Check submissions batch, retrieving history once per account.
+
+        :param submissions: Submissions to check
+        :return: Anomalies, in the order of submissions
+        """
+        submissions = list(submissions)
+        accounts = {id(x.account): x.account for x in submissions if not x.ignore_anomalies}
+
+        histories, meters = await asyncio.gather(
+            asyncio.gather(
+                *map(self.async_get_history, accounts.values()), return_exceptions=True
+            ),
+            asyncio.gather(
+                *(x.async_get_meters_snapshot() for x in accounts.values()),
+                return_exceptions=True,
+            ),
+        )
+        profiles = self.build_profiles(
+            dict(zip(accounts.keys(), histories)),
+            dict(zip(accounts.keys(), meters)),
+            (x for x in submissions if not x.ignore_anomalies),
+        )
+
+        return [
+            self.check_submission(
+                profiles.get((id(submission.account), submission.meter_id), {}), submission
+            )
+            for submission in submissions
+        ]
+
+    def check_submission(
+        self,
+        profile: Union[IndicationsProfile, BaseException],
+        submission: IndicationSubmission,
+    ) -> List[IndicationAnomaly]:
+        # Submissions are not flagged when history could not be retrieved
+        if isinstance(profile, BaseException) or submission.ignore_anomalies:
+            return []
+        on_date = datetime.now(getattr(submission.account, "timezone", None)).date()
+        return self.check(profile, submission.values, on_date)
+
+
+#################################################################################
+# Bulk submission
+#################################################################################
+
+
+class BulkIndicationSubmitter:
+    """Submission engine for indications of many meters across accounts.
+
+    Processing of a batch is performed in stages:
+    1. meters are resolved from account meter snapshots (one retrieval per account);
+    2. local pre-transmission checks run for every submission;
+    3. optionally, values are checked against indications history (submissions
+       with anomalies are flagged and not sent);
+    4. optionally, charges are calculated for calculatable meters (dry run);
+    5. indications are submitted.
+
+    Requests are limited per portal host. Limits are kept by each submitter
+    instance: separate submitters (or processes) sharing a host do not account
+    for each other's requests.
+
+    Submissions that were already sent successfully by this submitter (same
+    account, meter and values) are not sent again. This only covers the current
+    process and this submitter instance; `submitted_keys` has to be persisted and
+    restored by the caller to avoid repeated submissions across restarts.
+
+    :param max_per_host: Maximum amount of simultaneous requests per portal host
+    :param calculate: Calculate charges before submitting
+    :param dry_run: Stop after calculating charges, do not submit
+    :param anomaly_checker: Checker of values against indications history
+    """
+
+    def __init__(
+        self,
+        max_per_host: int = 8,
+        calculate: bool = False,
+        dry_run: bool = False,
+        anomaly_checker: Optional[IndicationAnomalyChecker] = None,
+    ) -> None:
+        self.max_per_host: int = max_per_host
+        self.calculate: bool = calculate or dry_run
+        self.dry_run: bool = dry_run
+        self.anomaly_checker: Optional[IndicationAnomalyChecker] = anomaly_checker
+        self._host_limiters: Dict[str, asyncio.Semaphore] = {}
+        self._submitted: Set[SubmissionKey] = set()
+        self._in_flight: Set[SubmissionKey] = set()
+
+    @property
+    def submitted_keys(self) -> Set[SubmissionKey]:
+        """Keys of successful submissions (may be persisted and restored to span restarts)"""
+        return self._submitted
+
+    def _get_host_limiter(self, api: BaseEnergosbytAPI) -> asyncio.Semaphore:
+        host = urlparse(api.REQUEST_URL).netloc
+        try:
+            return self._host_limiters[host]
+        except KeyError:
+            limiter = asyncio.Semaphore(self.max_per_host)
+            self._host_limiters[host] = limiter
+            return limiter
+
+    async def _async_resolve_meters(
+        self, submissions: Iterable[IndicationSubmission]
+    ) -> Dict[int, Union[Mapping[str, Any], BaseException]]:
+        accounts = {id(x.account): x.account for x in submissions}
+
+        async def _async_get_meters(account: AbstractAccountWithMeters) -> Mapping[str, Any]:
+            async with self._get_host_limiter(account.api):
+                return await account.async_get_meters_snapshot()
+
+        results = await asyncio.gather(
+            *map(_async_get_meters, accounts.values()), return_exceptions=True
+        )
+        return dict(zip(accounts.keys(), results))
+
+    async def _async_resolve_histories(
+        self, checker: IndicationAnomalyChecker, submissions: Iterable[IndicationSubmission]
+    ) -> Dict[int, Union[Collection[AbstractIndication], BaseException]]:
+        accounts = {id(x.account): x.account for x in submissions}
+
+        async def _async_get_history(
+            account: AbstractAccountWithMeters,
+        ) -> Collection[AbstractIndication]:
+            async with self._get_host_limiter(account.api):
+                return await checker.async_get_history(account)
+
+        results = await asyncio.gather(
+            *map(_async_get_history, accounts.values()), return_exceptions=True
+        )
+        return dict(zip(accounts.keys(), results))
+
+    async def _async_process(
+        self, submission: IndicationSubmission, meter: AbstractSubmittableMeter
+    ) -> IndicationSubmissionOutcome:
+        limiter = self._get_host_limiter(submission.account.api)
+        # Pre-transmission checks were performed by `async_submit` already
+        arguments = dict(submission.values, ignore_periods=True, ignore_values=True)
+
+        charge = None
+        if self.calculate and isinstance(meter, AbstractCalculatableMeter):
+            try:
+                async with limiter:
+                    charge = await meter.async_calculate_indications(**arguments)
+            except Exception as e:
+                return IndicationSubmissionOutcome(
+                    submission=submission, status=SubmissionStatus.CALCULATION_FAILED, error=e
+                )
+
+        if self.dry_run:
+            return IndicationSubmissionOutcome(
+                submission=submission, status=SubmissionStatus.CALCULATED, charge=charge
+            )
+
+        key = submission.key
+        if key in self._submitted or key in self._in_flight:
+            return IndicationSubmissionOutcome(
+                submission=submission, status=SubmissionStatus.DUPLICATE, charge=charge
+            )
+
+        self._in_flight.add(key)
+        try:
+            async with limiter:
+                result = await meter.async_submit_indications(**arguments)
+        except Exception as e:
+            return IndicationSubmissionOutcome(
+                submission=submission, status=SubmissionStatus.FAILED, charge=charge, error=e
+            )
+        else:
+            self._submitted.add(key)
+        finally:
+            self._in_flight.discard(key)
+
+        return IndicationSubmissionOutcome(
+            submission=submission, status=SubmissionStatus.SUBMITTED, charge=charge, result=result
+        )
+
+    async def async_submit(
+        self, submissions: Iterable[IndicationSubmission]
+    ) -> List[IndicationSubmissionOutcome]:
+        """Process submissions batch.
+
+        :param submissions: Submissions to process
+        :return: Outcomes, in the order of submissions
+        """
+        submissions = list(submissions)
+        meters_by_account = await self._async_resolve_meters(submissions)
+
+        outcomes: List[Optional[IndicationSubmissionOutcome]] = [None] * len(submissions)
+        pending: List[Tuple[int, IndicationSubmission, AbstractSubmittableMeter]] = []
+        batch_keys: Set[SubmissionKey] = set()
+
+        # Local checks are performed for the whole batch before any request is made
+        for index, submission in enumerate(submissions):
+            meters = meters_by_account[id(submission.account)]
+            error: Optional[BaseException] = None
+
+            if isinstance(meters, BaseException):
+                error = meters
+            else:
+                meter = meters.get(submission.meter_id)
+                if not isinstance(meter, AbstractSubmittableMeter):
+                    error = EnergosbytException(
+                        "meter %s does not exist or is not submittable" % (submission.meter_id,)
+                    )
+                elif submission.values.keys() - meter.zones.keys():
+                    error = EnergosbytException(
+                        "meter %s does not have zones: %s"
+                        % (
+                            submission.meter_id,
+                            ", ".join(submission.values.keys() - meter.zones.keys()),
+                        )
+                    )
+                else:
+                    try:
+                        await meter._internal_async_perform_pre_transmission_checks(
+                            ignore_periods=submission.ignore_periods,
+                            ignore_values=submission.ignore_values,
+                            **submission.values,
+                        )
+                    except EnergosbytException as e:
+                        error = e
+
+            if error is not None:
+                outcomes[index] = IndicationSubmissionOutcome(
+                    submission=submission, status=SubmissionStatus.REJECTED, error=error
+                )
+                continue
+
+            key = submission.key
+            if not self.dry_run and key in batch_keys:
+                outcomes[index] = IndicationSubmissionOutcome(
+                    submission=submission, status=SubmissionStatus.DUPLICATE
+                )
+                continue
+
+            batch_keys.add(key)
+            pending.append((index, submission, meter))
+
+        checker = self.anomaly_checker
+        if checker is not None:
+            checked = [x for _, x, _ in pending if not x.ignore_anomalies]
+            profiles = checker.build_profiles(
+                await self._async_resolve_histories(checker, checked), meters_by_account, checked
+            )
+
+            unflagged = []
+            for index, submission, meter in pending:
+                anomalies = checker.check_submission(
+                    profiles.get((id(submission.account), submission.meter_id), {}), submission
+                )
+                if anomalies:
+                    outcomes[index] = IndicationSubmissionOutcome(
+                        submission=submission, status=SubmissionStatus.FLAGGED, anomalies=anomalies
+                    )
+                else:
+                    unflagged.append((index, submission, meter))
+            pending = unflagged
+
+        results = await asyncio.gather(
+            *(self._async_process(submission, meter) for _, submission, meter in pending)
+        )
+        for (index, _, _), outcome in zip(pending, results):
+            outcomes[index] = outcome
+
+        return outcomes  # type: ignore[return-value]
+
+
+#################################################################################
+# Submission periods scheduling
+#################################################################################
+
+
+class SubmissionEventType(Enum):
+    OPENED = "opened"
+    CLOSING = "closing"
+
+
+@attr.s(kw_only=True, frozen=True, slots=True)
+class SubmissionEvent:
+    """Submission period event of a single meter.
+
+    :param type: Event type
+    :param at: Moment the event is due
+    :param meter: Affected meter
+    :param period: Submission period (first day, last day)
+    :param attempt: Amount of failed attempts to process the event
+    """
+
+    type: SubmissionEventType = attr.ib()
+    at: datetime = attr.ib()
+    meter: _AbstractTransmittingMeterBase = attr.ib()
+    period: Tuple[date, date] = attr.ib()
+    attempt: int = attr.ib(default=0)
+
+    @property
+    def account(self) -> AbstractAccountWithMeters:
+        return self.meter.account
+
+
+def _localize(value: date, tz: Optional[tzinfo]) -> datetime:
+    naive = datetime(value.year, value.month, value.day)
+    if tz is None:
+        return naive.astimezone()
+    localize = getattr(tz, "localize", None)  # pytz timezones
+    return naive.replace(tzinfo=tz) if localize is None else localize(naive)
+
+
+def _get_next_period(
+    meter: _AbstractTransmittingMeterBase, period: Tuple[date, date]
+) -> Optional[Tuple[date, date]]:
+    # Periods are monthly; the day after period end may still belong to
+    # the same month's period, so the next month is probed as well.
+    after_end = period[1] + timedelta(days=1)
+    for on_date in (after_end, (after_end.replace(day=1) + timedelta(days=32)).replace(day=1)):
+        next_period = meter.get_submission_period(on_date)
+        if next_period[1] > period[1]:
+            return next_period
+    return None
+
+
+SubmissionEventsCallback = Callable[
+    [AbstractAccountWithMeters, List[SubmissionEvent]], Optional[Awaitable[Any]]
+]
+
+
+class SubmissionScheduler:
+    """Timer queue of submission period events for meters across accounts.
+
+    Meters are scheduled by their `get_submission_period()`: an `OPENED` event is
+    due at the start of the period (or immediately, if the period is already
+    open), and a `CLOSING` event is due `closing_notice` before the period ends.
+    Once a meter's `CLOSING` event is taken, its next period is scheduled.
+
+    Events the callback of `async_run` fails to process are retried after
+    `retry_delay`, until the period ends.
+
+    :param closing_notice: How long before period end `CLOSING` event is due
+    :param retry_delay: Delay before retrying events that failed to be processed
+    """
+
+    def __init__(
+        self,
+        closing_notice: timedelta = timedelta(days=1),
+        retry_delay: timedelta = timedelta(minutes=15),
+    ) -> None:
+        self.closing_notice: timedelta = closing_notice
+        self.retry_delay: timedelta = retry_delay
+        self._queue: List[Tuple[datetime, int, SubmissionEvent, int]] = []
+        self._sequence = itertools.count()
+        # Meter key -> scheduling generation; events of older generations are discarded
+        self._generations: Dict[Tuple[int, str], int] = {}
+
+    def __len__(self) -> int:
+        return len(self._generations)
+
+    @staticmethod
+    def _get_meter_key(meter: _AbstractTransmittingMeterBase) -> Tuple[int, str]:
+        return meter.account.id, meter.id
+
+    def _push(self, event: SubmissionEvent, generation: int) -> None:
+        heapq.heappush(self._queue, (event.at, next(self._sequence), event, generation))
+
+    def _schedule_period(
+        self,
+        meter: _AbstractTransmittingMeterBase,
+        period: Tuple[date, date],
+        generation: int,
+        now: datetime,
+    ) -> None:
+        tz = getattr(meter.account, "timezone", None)
+        opens_at = _localize(period[0], tz)
+        closes_at = _localize(period[1] + timedelta(days=1), tz)
+
+        self._push(
+            SubmissionEvent(
+                type=SubmissionEventType.OPENED, at=max(opens_at, now), meter=meter, period=period
+            ),
+            generation,
+        )
+        self._push(
+            SubmissionEvent(
+                type=SubmissionEventType.CLOSING,
+                at=max(closes_at - self.closing_notice, opens_at, now),
+                meter=meter,
+                period=period,
+            ),
+            generation,
+        )
+
+    def add_meter(
+        self, meter: _AbstractTransmittingMeterBase, now: Optional[datetime] = None
+    ) -> None:
+        """Schedule (or reschedule) submission period events for meter."""
+        tz = getattr(meter.account, "timezone", None)
+        now = datetime.now(tz).astimezone() if now is None else now
+        today = now.astimezone(tz).date() if tz is not None else now.date()
+
+        period = meter.get_submission_period(today)
+        if period[1] < today:
+            next_period = _get_next_period(meter, period)
+            if next_period is None:
+                # Meter can not tell future periods
+                self.remove_meter(meter)
+                return
+            period = next_period
+
+        key = self._get_meter_key(meter)
+        generation = self._generations.get(key, 0) + 1
+        self._generations[key] = generation
+        self._schedule_period(meter, period, generation, now)
+
+    def remove_meter(self, meter: _AbstractTransmittingMeterBase) -> None:
+        self._generations.pop(self._get_meter_key(meter), None)
+
+    async def async_add_account(
+        self, account: AbstractAccountWithMeters, now: Optional[datetime] = None
+    ) -> None:
+        """Schedule all submittable meters of account (from its meter snapshot)."""
+        for meter in (await account.async_get_meters_snapshot()).values():
+            if isinstance(meter, _AbstractTransmittingMeterBase):
+                self.add_meter(meter, now)
+
+    def _is_current(self, event: SubmissionEvent, generation: int) -> bool:
+        return self._generations.get(self._get_meter_key(event.meter)) == generation
+
+    @property
+    def next_wakeup(self) -> Optional[datetime]:
+        """Moment the earliest pending event is due"""
+        queue = self._queue
+        while queue and not self._is_current(queue[0][2], queue[0][3]):
+            heapq.heappop(queue)
+        return queue[0][0] if queue else None
+
+    def pop_due(self, now: Optional[datetime] = None) -> List[SubmissionEvent]:
+        """Take events that are due, scheduling next periods for closing meters."""
+        return [event for event, _ in self._pop_due(now)]
+
+    def _pop_due(self, now: Optional[datetime] = None) -> List[Tuple[SubmissionEvent, int]]:
+        now = datetime.now().astimezone() if now is None else now
+        queue = self._queue
+        events = []
+
+        while queue and queue[0][0] <= now:
+            _, _, event, generation = heapq.heappop(queue)
+            if not self._is_current(event, generation):
+                continue
+
+            events.append((event, generation))
+
+            # Next period is scheduled upon the first attempt only
+            if event.type == SubmissionEventType.CLOSING and not event.attempt:
+                meter = event.meter
+                next_period = _get_next_period(meter, event.period)
+                if next_period is not None:
+                    self._schedule_period(meter, next_period, generation, now)
+                else:
+                    self.remove_meter(meter)
+
+        return events
+
+    def _retry(self, events: Iterable[Tuple[SubmissionEvent, int]], now: datetime) -> None:
+        retry_at = now + self.retry_delay
+        for event, generation in events:
+            if not self._is_current(event, generation):
+                continue
+            tz = getattr(event.account, "timezone", None)
+            if retry_at < _localize(event.period[1] + timedelta(days=1), tz):
+                self._push(attr.evolve(event, at=retry_at, attempt=event.attempt + 1), generation)
+
+    async def async_run(
+        self, callback: SubmissionEventsCallback, stop_event: Optional[asyncio.Event] = None
+    ) -> None:
+        """Wait for due events and pass them to callback, grouped by account.
+
+        Only accounts with due events are woken up. Runs until `stop_event` is set
+        or no meters are left to schedule. Callback failures are logged and the
+        failed events are retried (see `retry_delay`); other meters are unaffected.
+
+        :param callback: Called with account and its due events (may be a coroutine function)
+        :param stop_event: Event stopping the loop
+        """
+        if stop_event is None:
+            stop_event = asyncio.Event()
+
+        while not stop_event.is_set():
+            next_wakeup = self.next_wakeup
+            if next_wakeup is None:
+                return
+
+            delay = (next_wakeup - datetime.now().astimezone()).total_seconds()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            events_by_account: Dict[
+                int, Tuple[AbstractAccountWithMeters, List[Tuple[SubmissionEvent, int]]]
+            ] = {}
+            for event, generation in self._pop_due():
+                account = event.account
+                events_by_account.setdefault(account.id, (account, []))[1].append(
+                    (event, generation)
+                )
+
+            for account, account_events in events_by_account.values():
+                try:
+                    result = callback(account, [event for event, _ in account_events])
+                    if result is not None and asyncio.iscoroutine(result):
+                        await result
+                except Exception:
+                    _LOGGER.exception(
+                        "Submission events callback failed for account %s", account.id
+                    )
+                    self._retry(account_events, datetime.now().astimezone())
@@ -1,10 +1,18 @@
+import calendar
+import importlib
 import re
 from datetime import date, datetime, tzinfo
+from functools import lru_cache
+from types import ModuleType
 from typing import (
     Any,
+    Callable,
     Generator,
+    Iterable,
+    List,
     Mapping,
     Optional,
+    Pattern,
     Protocol,
     Set,
     SupportsFloat,
@@ -34,6 +42,28 @@ def all_subclasses(cls: _TT) -> Set[_TT]:
     return sbcls.union(s for c in sbcls for s in all_subclasses(c))
 
 
+def lazy_submodules(
+    package_name: str, submodules: Iterable[str], package_globals: Mapping[str, Any]
+) -> Tuple[Callable[[str], ModuleType], Callable[[], List[str]]]:
+    """Create module `__getattr__` and `__dir__` (PEP 562) importing submodules on access.
+
+    :param package_name: Package name (`__name__`)
+    :param submodules: Names of submodules to import lazily
+    :param package_globals: Package globals (`globals()`)
+    """
+    submodules = frozenset(submodules)
+
+    def __getattr__(name: str) -> ModuleType:
+        if name in submodules:
+            return importlib.import_module("." + name, package_name)
+        raise AttributeError("module %r has no attribute %r" % (package_name, name))
+
+    def __dir__() -> List[str]:
+        return sorted(set(package_globals) | submodules)
+
+    return __getattr__, __dir__
+
+
 #################################################################################
 # Tariff ID utilities
 #################################################################################
@@ -51,18 +81,72 @@ ZONE_ID_SEARCH_INDEX = (
 )
 
 
+_zone_id_search_index = [(tariff_id, list(options)) for tariff_id, options in ZONE_ID_SEARCH_INDEX]
+_zone_id_matcher: Optional[Pattern[str]] = None
+
+
+def _compile_zone_id_matcher() -> Pattern[str]:
+    # Each index entry becomes a capturing group within a lookahead alternation,
+    # so that every position reports the highest priority entry matching there.
+    return re.compile(
+        "(?=%s)"
+        % "|".join(
+            "(%s)" % "|".join(map(re.escape, (tariff_id, *options)))
+            for tariff_id, options in _zone_id_search_index
+        )
+    )
+
+
+def register_zone_id_synonyms(zone_id: str, *synonyms: str) -> None:
+    """Register additional (e.g. regional) service name parts for zone ID.
+
+    Synonyms of known zone IDs retain their priority; new zone IDs are matched
+    after all existing ones.
+    """
+    global _zone_id_matcher
+
+    synonyms_lower = [synonym.lower() for synonym in synonyms if synonym]
+    for tariff_id, options in _zone_id_search_index:
+        if tariff_id == zone_id:
+            options.extend(x for x in synonyms_lower if x not in options)
+            break
+    else:
+        _zone_id_search_index.append((zone_id, synonyms_lower))
+
+    _zone_id_matcher = None
+    resolve_zone_id.cache_clear()
+
+
 def extrapolate_zone_id(value: str, default: Optional[str] = None) -> str:
-    lower_value = value.lower()
-    for tariff_id, options in ZONE_ID_SEARCH_INDEX:
-        if tariff_id in lower_value:
-            return tariff_id
-        for option in options:
-            if option in lower_value:
-                return tariff_id
+    global _zone_id_matcher
+
+    matcher = _zone_id_matcher
+    if matcher is None:
+        matcher = _zone_id_matcher = _compile_zone_id_matcher()
+
+    best_index = None
+    for match in matcher.finditer(value.lower()):
+        index = match.lastindex
+        if index is not None and (best_index is None or index < best_index):
+            best_index = index
+            if index == 1:
+                break
+
+    if best_index is not None:
+        return _zone_id_search_index[best_index - 1][0]
 
     return slugify(value, separator="_") if default is None else default
 
 
+ZONE_ID_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=ZONE_ID_CACHE_SIZE)
+def resolve_zone_id(value: str, default: Optional[str] = None) -> str:
+    """Memoized variant of `extrapolate_zone_id`, shared across the process."""
+    return extrapolate_zone_id(value, default)
+
+
 def iter_numerical_tariffs(data: Mapping[str, Any], check_key: str) -> Generator[str, Any, None]:
     current_indication_index = 0
     while True:
@@ -99,6 +183,44 @@ def camel_to_snake(name):
     return _RE_SECOND.sub(r"\1_\2", _RE_FIRST.sub(r"\1_\2", name)).lower()
 
 
+def _get_month_day(year: int, month: int, day: Optional[int], default_last: bool) -> date:
+    last_day = calendar.monthrange(year, month)[1]
+    if day is None:
+        day = last_day if default_last else 1
+    return date(year, month, max(1, min(day, last_day)))
+
+
+def get_submission_period(
+    on_date: date, start_day: Optional[int], end_day: Optional[int]
+) -> Tuple[date, date]:
+    """Calculate monthly submission period relevant to given date.
+
+    Missing start (end) day stands for the first (last) day of month; days that
+    exceed month length are clamped to its last day. Periods with end day less
+    than start day span month boundary.
+    """
+    year, month = on_date.year, on_date.month
+
+    if start_day is None or end_day is None or start_day <= end_day:
+        return (
+            _get_month_day(year, month, start_day, False),
+            _get_month_day(year, month, end_day, True),
+        )
+
+    if on_date <= _get_month_day(year, month, end_day, True):
+        previous_month = on_date.replace(day=1) - relativedelta(months=1)
+        return (
+            _get_month_day(previous_month.year, previous_month.month, start_day, False),
+            _get_month_day(year, month, end_day, True),
+        )
+
+    next_month = on_date.replace(day=1) + relativedelta(months=1)
+    return (
+        _get_month_day(year, month, start_day, False),
+        _get_month_day(next_month.year, next_month.month, end_day, True),
+    )
+
+
 class SupportsLessThan(Protocol):
     def __lt__(self, __other: Any) -> bool:
         ...
@@ -0,0 +1,117 @@
+import asyncio
+
+from inter_rao_energosbyt.api.moscow import MESEletricityAccount, MoscowEnergosbytAPI
+
+LS_ROW = {
+    "data": {"KD_LS_OWNER_TYPE": 1, "nm_street": "street"},
+    "id_service": 100,
+    "kd_provider": 1,
+    "kd_service_type": 1,
+    "kd_status": 1,
+    "nm_ls_group": "g",
+    "nm_ls_group_full": "g",
+    "nm_provider": "p",
+    "nm_type": "t",
+    "nn_ls": "123",
+    "pr_ls_group_edit": 1,
+    "vl_provider": "{}",
+}
+
+
+class RelatedCountingAccount(MESEletricityAccount):
+    __slots__ = ()
+
+    related_updates = []
+    preset_invalidations = []
+
+    async def async_update_related(self) -> None:
+        self.related_updates.append(self.id)
+
+    def invalidate_preset_parameters(self, preset=None) -> None:
+        self.preset_invalidations.append(self.id)
+        super().invalidate_preset_parameters(preset)
+
+
+class FakeAccountsAPI(MoscowEnergosbytAPI):
+    __slots__ = ("rows",)
+
+    def __init__(self, rows):
+        super().__init__("user", "pass")
+        self.rows = rows
+
+    async def _async_action_with_exceptions(self, action, query, data):
+        return {"success": True, "data": [dict(row) for row in self.rows]}
+
+    def _create_account_from_data(self, account_data):
+        return RelatedCountingAccount(self, account_data)
+
+
+def _run(scenario):
+    async def _main():
+        api = FakeAccountsAPI([LS_ROW, dict(LS_ROW, id_service=101)])
+        try:
+            return await scenario(api)
+        finally:
+            await api.async_close()
+
+    RelatedCountingAccount.related_updates.clear()
+    RelatedCountingAccount.preset_invalidations.clear()
+    return asyncio.run(_main())
+
+
+def test_related_update_skips_unchanged_accounts():
+    async def _scenario(api):
+        await api.async_update_accounts()
+        await api.async_update_accounts()
+
+    _run(_scenario)
+    assert sorted(RelatedCountingAccount.related_updates) == [100, 101]
+
+
+def test_related_update_catches_up_after_update_without_related():
+    async def _scenario(api):
+        await api.async_update_accounts(with_related=False)
+        assert RelatedCountingAccount.related_updates == []
+
+        api.rows = [dict(LS_ROW, nn_ls="456"), dict(LS_ROW, id_service=101)]
+        await api.async_update_accounts(with_related=False)
+
+        await api.async_update_accounts()
+        await api.async_update_accounts()
+
+    _run(_scenario)
+    assert sorted(RelatedCountingAccount.related_updates) == [100, 101]
+
+
+def test_cancelled_caller_does_not_cancel_shared_update():
+    async def _scenario(api):
+        first = asyncio.ensure_future(api.async_update_accounts())
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(api.async_update_accounts())
+        await asyncio.sleep(0)
+
+        first.cancel()
+        accounts = await second
+        assert first.cancelled()
+        assert sorted(accounts) == [100, 101]
+
+    _run(_scenario)
+    assert sorted(RelatedCountingAccount.related_updates) == [100, 101]
+
+
+def test_preset_parameters_invalidated_only_on_provider_changes():
+    async def _scenario(api):
+        await api.async_update_accounts()
+
+        api.rows = [dict(LS_ROW, nm_ls_group="other"), dict(LS_ROW, id_service=101)]
+        await api.async_update_accounts()
+        assert RelatedCountingAccount.preset_invalidations == []
+
+        api.rows = [
+            dict(LS_ROW, nm_ls_group="other"),
+            dict(LS_ROW, id_service=101, vl_provider='{"a": 1}'),
+        ]
+        await api.async_update_accounts()
+        assert RelatedCountingAccount.preset_invalidations == [101]
+
+    _run(_scenario)
@@ -0,0 +1,98 @@
+import asyncio
+from datetime import date, datetime
+from types import SimpleNamespace
+
+import pytz
+
+from inter_rao_energosbyt.actions.sql.ls_management import LSList
+from inter_rao_energosbyt.presets.adapters import AccountWithInvoicesToIndications
+
+LS_ROW = {
+    "data": {"KD_LS_OWNER_TYPE": 1, "nm_street": "street"},
+    "id_service": 100,
+    "kd_provider": 1,
+    "kd_service_type": 1,
+    "kd_status": 1,
+    "nm_ls_group": "g",
+    "nm_ls_group_full": "g",
+    "nm_provider": "p",
+    "nm_type": "t",
+    "nn_ls": "123",
+    "pr_ls_group_edit": 1,
+    "vl_provider": "{}",
+}
+
+
+def _invoice(period, invoice_id, values, descriptions):
+    return SimpleNamespace(
+        period=period,
+        id=invoice_id,
+        sort_key=(period, invoice_id),
+        values=values,
+        descriptions=descriptions,
+    )
+
+
+class InvoicesAccount(AccountWithInvoicesToIndications):
+    timezone = pytz.utc
+
+    def __init__(self, invoices):
+        super().__init__(SimpleNamespace(), LSList.from_response(LS_ROW))
+        self.invoices = invoices
+        self.requests = []
+
+    def _get_invoice_values(self, invoice):
+        return invoice.values, invoice.descriptions
+
+    async def async_get_invoices(self, start=None, end=None):
+        self.requests.append((start, end))
+        return [x for x in self.invoices if start.date() <= x.period <= end.date()]
+
+    @property
+    def start_date(self):
+        return date(2000, 1, 1)
+
+    @property
+    def end_date(self):
+        return None
+
+
+def _get_indications(account):
+    return asyncio.run(
+        account.async_get_indications_from_invoices(
+            datetime(2020, 1, 1, tzinfo=pytz.utc), datetime(2020, 12, 31, tzinfo=pytz.utc)
+        )
+    )
+
+
+def test_invoice_indications_keep_period_description():
+    account = InvoicesAccount(
+        [
+            _invoice(date(2020, 1, 1), "1", {"t1": 0.0}, {"t1": "Day"}),
+            _invoice(date(2020, 2, 1), "2", {"t1": 10.0}, {"t1": "Day"}),
+            _invoice(date(2020, 2, 1), "3", {"t1": 5.0}, {"t1": "Recalculated"}),
+            _invoice(date(2020, 3, 1), "4", {"t1": 5.0}, None),
+        ]
+    )
+
+    february, march = _get_indications(account)
+    assert dict(february.values) == {"t1": 15.0}
+    assert dict(march.values) == {"t1": 20.0}
+    assert february.description == march.description == "t1: Day"
+
+
+def test_invoice_series_checkpoint_is_per_account():
+    invoices = [
+        _invoice(date(2020, 1, 1), "1", {"t1": 0.0}, None),
+        _invoice(date(2020, 2, 1), "2", {"t1": 10.0}, None),
+        _invoice(date(2020, 3, 1), "3", {"t1": 10.0}, None),
+    ]
+    first, second = InvoicesAccount(invoices), InvoicesAccount(invoices[:2])
+
+    assert len(_get_indications(first)) == 2
+    assert len(_get_indications(second)) == 1
+    assert first._invoice_series_checkpoint is not second._invoice_series_checkpoint
+
+    # Only invoices starting with the last processed period are requested again
+    _get_indications(first)
+    assert first.requests[-1][0].date() == date(2020, 3, 1)
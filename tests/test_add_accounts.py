@@ -0,0 +1,68 @@
+import asyncio
+
+from inter_rao_energosbyt.api.moscow import MoscowEnergosbytAPI
+from inter_rao_energosbyt.exceptions import EnergosbytException
+
+
+class FakeLSAdd:
+    pr_confirm_question = False
+    id_service = None
+
+    def __init__(self, nn_ls):
+        self.nn_ls = nn_ls
+
+
+class RecordingAPI(MoscowEnergosbytAPI):
+    __slots__ = ("events",)
+
+    def __init__(self):
+        super().__init__("user", "pass")
+        self.attributes_add_account = []
+        self.events = []
+
+    def _prepare_add_account_attributes(self, ls_attributes, nn_ls, *args, **kwargs):
+        self.events.append(("validate", nn_ls))
+        if nn_ls == "invalid":
+            raise ValueError("invalid account number")
+        return [{"nm_attribute": "NN_LS", "vl_attribute": nn_ls}]
+
+    async def _async_perform_add_account(self, request_attributes, ignore_error_codes=None):
+        nn_ls = request_attributes[0]["vl_attribute"]
+        self.events.append(("send", nn_ls))
+        await asyncio.sleep(0)
+        if nn_ls == "rejected":
+            raise EnergosbytException("rejected")
+        return FakeLSAdd(nn_ls)
+
+
+def test_batch_is_validated_before_any_account_is_added():
+    async def _main():
+        api = RecordingAPI()
+        try:
+            outcomes = await api.async_add_accounts(
+                [("first", 1, {}), ("invalid", 1, {}), ("rejected", 1, {}), ("last", 1, {})],
+                update_accounts=False,
+            )
+            return api.events, outcomes
+        finally:
+            await api.async_close()
+
+    events, outcomes = asyncio.run(_main())
+
+    assert [event for event, _ in events[:4]] == ["validate"] * 4
+    assert sorted(nn_ls for event, nn_ls in events if event == "send") == [
+        "first",
+        "last",
+        "rejected",
+    ]
+
+    assert [outcome.request.nn_ls for outcome in outcomes] == [
+        "first",
+        "invalid",
+        "rejected",
+        "last",
+    ]
+    assert isinstance(outcomes[1].error, ValueError) and outcomes[1].response is None
+    assert isinstance(outcomes[2].error, EnergosbytException)
+    assert outcomes[0].response.nn_ls == "first" and outcomes[0].error is None
+    assert outcomes[3].response.nn_ls == "last"
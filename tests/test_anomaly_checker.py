@@ -0,0 +1,128 @@
+import asyncio
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+from inter_rao_energosbyt.actions.sql.abonent import AbonentEquipment, AbonentIndications
+from inter_rao_energosbyt.actions.sql.ls_management import LSList
+from inter_rao_energosbyt.api.moscow import MOEEPDAccount, MOEEPDMeter, MoscowEnergosbytAPI
+from inter_rao_energosbyt.presets.smorodina import SmorodinaIndication
+from inter_rao_energosbyt.submission import (
+    IndicationAnomalyChecker,
+    IndicationAnomalyType,
+    IndicationSubmission,
+)
+from tests.test_accounts_update import LS_ROW
+from tests.test_adapters import InvoicesAccount, _invoice
+
+TODAY = date.today()
+READING_DATES = [TODAY - timedelta(days=30 * x) for x in (4, 3, 2, 1)]
+
+
+def _equipment_row(zone_id, service, last_value):
+    return {
+        "dt_last_indication": READING_DATES[-1].isoformat(),
+        "dt_mpi": "2030-01-01",
+        "id_billing_counter": 1,
+        "id_counter": 5,
+        "id_counter_zn": zone_id,
+        "id_pu": 1,
+        "id_service": 1,
+        "nm_factory": "F-1",
+        "nm_measure_unit": "kWh",
+        "nm_pu": "pu",
+        "nm_service": service,
+        "nn_pu": 1,
+        "vl_last_indication": last_value,
+        "vl_sh_znk": 6,
+    }
+
+
+def _indication_row(index, zone_id, service, value):
+    return {
+        "dt_indication": READING_DATES[index].isoformat() + "T00:00:00",
+        "id_counter": 5,
+        "id_counter_zn": zone_id,
+        "id_indication": zone_id * 100 + index,
+        "id_service": 1,
+        "nm_counter_zn": service,
+        "nm_factory": "F-1",
+        "nm_indication_state": "ok",
+        "nm_pu": "pu",
+        "nm_service": service,
+        "nn_pu": 1,
+        "pr_sign_inclusion": 1,
+        "vl_indication": value,
+    }
+
+
+class SmorodinaHistoryAccount(MOEEPDAccount):
+    __slots__ = ()
+
+    async def async_get_meters(self):
+        meters = (
+            MOEEPDMeter.from_response(self, AbonentEquipment.from_response(row))
+            for row in (
+                _equipment_row(1, "Day", 1300.0),
+                _equipment_row(2, "Night", 800.0),
+            )
+        )
+        return {meter.id: meter for meter in meters}
+
+    async def async_get_indications(self, start=None, end=None):
+        rows = [_indication_row(i, 1, "Day", 1000.0 + 100 * i) for i in range(4)]
+        rows += [_indication_row(i, 2, "Night", 500.0 + 100 * i) for i in range(4)]
+        return [SmorodinaIndication(self, AbonentIndications.from_response(x)) for x in rows]
+
+
+def _check_smorodina(values_by_meter):
+    async def _main():
+        api = MoscowEnergosbytAPI("user", "pass")
+        try:
+            account = SmorodinaHistoryAccount(api, LSList.from_response(LS_ROW))
+            return await IndicationAnomalyChecker().async_check_submissions(
+                IndicationSubmission(account=account, meter_id=meter_id, values=values)
+                for meter_id, values in values_by_meter
+            )
+        finally:
+            await api.async_close()
+
+    return asyncio.run(_main())
+
+
+def test_smorodina_history_is_matched_to_zone_meters():
+    day, night = _check_smorodina([("5_1", {"t1": 5000}), ("5_2", {"t1": 850})])
+
+    assert [x.type for x in day] == [IndicationAnomalyType.EXCEEDS_AVERAGE]
+    assert day[0].previous == 1300.0
+    assert night == []
+
+
+def test_smorodina_decrease_is_flagged_against_own_zone():
+    (day,) = _check_smorodina([("5_1", {"t1": 1250})])
+    assert [x.type for x in day] == [IndicationAnomalyType.DECREASE]
+
+
+def test_invoice_indications_contribute_rates_only():
+    account = InvoicesAccount(
+        [_invoice(date(2020, m, 1), str(m), {"t1": 100.0}, None) for m in range(1, 7)]
+    )
+    history = asyncio.run(
+        account.async_get_indications(datetime(2020, 1, 1), datetime(2020, 7, 1))
+    )
+    meter = SimpleNamespace(
+        id="meter",
+        code="meter",
+        zones={"t1": SimpleNamespace(name="Электроэнергия день", last_indication=5000.0)},
+        last_indications_date=date(2020, 6, 15),
+    )
+
+    checker = IndicationAnomalyChecker()
+    profile = checker.build_profiles(
+        {id(account): history},
+        {id(account): {"meter": meter}},
+        [IndicationSubmission(account=account, meter_id="meter", values={"t1": 0})],
+    )[(id(account), "meter")]
+
+    assert checker.check(profile, {"t1": 5100}, date(2020, 7, 15)) == []
+    (anomaly,) = checker.check(profile, {"t1": 9000}, date(2020, 7, 15))
+    assert anomaly.type is IndicationAnomalyType.EXCEEDS_AVERAGE
@@ -0,0 +1,39 @@
+import importlib
+
+import pytest
+
+from inter_rao_energosbyt.api import API_CLASSES_BY_PROVIDER, _SUBMODULES, get_api_class
+from inter_rao_energosbyt.interfaces import BaseEnergosbytAPI
+
+
+def _get_registered_providers():
+    registered = {}
+    for module_name in sorted(_SUBMODULES):
+        module = importlib.import_module("inter_rao_energosbyt.api." + module_name)
+        for name, value in vars(module).items():
+            if not (
+                isinstance(value, type)
+                and issubclass(value, BaseEnergosbytAPI)
+                and value.__module__ == module.__name__
+                and value.__name__ == name
+            ):
+                continue
+            for provider_type, _ in value.SUPPORTED_ACCOUNTS:
+                if provider_type is not None:
+                    registered.setdefault(int(provider_type), set()).add(value)
+    return registered
+
+
+def test_provider_map_matches_supported_accounts():
+    registered = _get_registered_providers()
+
+    assert set(map(int, API_CLASSES_BY_PROVIDER)) == set(registered)
+
+    for provider_type, api_classes in registered.items():
+        assert len(api_classes) == 1, (provider_type, api_classes)
+        assert get_api_class(provider_type) is next(iter(api_classes)), provider_type
+
+
+def test_unknown_provider_raises_lookup_error():
+    with pytest.raises(LookupError):
+        get_api_class(99999)
@@ -0,0 +1,80 @@
+import pytest
+
+from inter_rao_energosbyt.actions.sql.attributes import (
+    Attribute,
+    _compile_attribute_regexp,
+    validate_many,
+)
+
+ATTRIBUTE_ROW = {
+    "kd_attribute": 1,
+    "kd_entity": 1,
+    "nm_attr_data_type": "TEXT",
+    "nm_attribute": "attribute",
+    "nm_entity": "entity",
+    "nm_table": "table",
+    "nn_order": 1,
+    "pr_autocomplete": 0,
+    "pr_base": 1,
+    "pr_required": 0,
+    "pr_required_edit": 0,
+    "pr_visible": 1,
+}
+
+
+def _attribute(**kwargs):
+    return Attribute.from_response(dict(ATTRIBUTE_ROW, **kwargs))
+
+
+def test_regexp_is_compiled_once():
+    _compile_attribute_regexp.cache_clear()
+    attribute = _attribute(nm_column="NN_LS", nm_regexp=r"^\d{5}$", nm_regexp_error="bad")
+
+    assert attribute.validate("12345") == "12345"
+    assert attribute.validate(54321) == "54321"
+    with pytest.raises(ValueError, match="bad"):
+        attribute.validate("1234")
+
+    cache_info = _compile_attribute_regexp.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (2, 1)
+
+
+def test_enum_values_resolve_codes_and_labels():
+    attribute = _attribute(
+        nm_column="KD_TYPE",
+        vl_dict=[
+            {"nn_code": 1, "nm_value": "Owner"},
+            {"nn_code": 2, "nm_value": "Tenant"},
+            {"nn_code": 3, "nm_value": "1"},
+        ],
+    )
+
+    assert attribute.validate("Tenant") == "2"
+    assert attribute.validate(2) == "2"
+    # Earlier values take precedence over labels of later ones
+    assert attribute.validate("1") == "1"
+    with pytest.raises(ValueError, match="value must match enum"):
+        attribute.validate("Guest")
+
+    # Lookups follow the value set of the attribute
+    changed = _attribute(nm_column="KD_TYPE", vl_dict=[{"nn_code": 4, "nm_value": "Guest"}])
+    assert changed.validate("Guest") == "4"
+
+
+def test_validate_many_applies_defaults_and_requirements():
+    attributes = [
+        _attribute(nm_column="NN_LS", pr_required=1),
+        _attribute(nm_column="NM_NOTE"),
+        _attribute(nm_column="KD_OWNER", vl_default="1"),
+        _attribute(nm_column="NM_EMPTY", vl_default="null"),
+    ]
+
+    validated = validate_many(attributes, {"nn_ls": 123})
+    assert [(x.nm_column, value) for x, value in validated] == [
+        ("NN_LS", "123"),
+        ("KD_OWNER", "1"),
+        ("NM_EMPTY", ""),
+    ]
+
+    with pytest.raises(ValueError, match="value is required"):
+        validate_many(attributes, {})
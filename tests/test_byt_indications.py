@@ -0,0 +1,81 @@
+import asyncio
+import collections
+
+from inter_rao_energosbyt.actions.sql.ls_management import LSList
+from inter_rao_energosbyt.api.altai import ALTEletricityAccount, AltaiEnergosbytAPI
+from tests.test_accounts_update import LS_ROW
+from tests.test_byt_zones import LS_INFO_ROW
+
+INDICATION_ROW = {
+    "dt_indication": "2023-01-10T00:00:00",
+    "dt_meter_installation": "2020-01-01T00:00:00",
+    "kd_indication_take": 1,
+    "nm_t1": "Электроэнергия день",
+    "pr_zone_t1": 1,
+    "rn": 1,
+    "tp_uchet": 1,
+    "vl_t1": 1000,
+}
+
+
+class ConcurrencyTrackingAPI(AltaiEnergosbytAPI):
+    __slots__ = ("in_flight", "max_in_flight", "requests", "meter_code")
+
+    def __init__(self):
+        super().__init__("user", "pass")
+        self.in_flight = self.max_in_flight = 0
+        self.requests = collections.Counter()
+        self.meter_code = "A"
+
+    async def _async_action_with_exceptions(self, action, query, data):
+        query = data.get("proxyquery", query)
+        self.requests[query] += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+
+        if query == "LSInfo":
+            row = dict(
+                LS_INFO_ROW,
+                nn_meter=self.meter_code,
+                dt_meter_installation="2020-01-01T00:00:00",
+            )
+            return {"success": True, "data": [row]}
+        return {"success": True, "data": [INDICATION_ROW]}
+
+
+class SingleWindowAccount(ALTEletricityAccount):
+    __slots__ = ()
+
+    dated_chunk_months = None
+
+
+def test_indications_and_info_are_fetched_concurrently():
+    async def _main():
+        api = ConcurrencyTrackingAPI()
+        try:
+            account = SingleWindowAccount(api, LSList.from_response(LS_ROW))
+
+            indications = await account.async_get_byt_indications()
+            assert api.max_in_flight == 2
+            assert [x.meter_code for x in indications] == ["A"]
+
+            # Info is requested once, and reused until it is updated
+            api.max_in_flight = 0
+            indications = await account.async_get_byt_indications()
+            assert api.max_in_flight == 1
+            assert [x.meter_code for x in indications] == ["A"]
+
+            api.meter_code = "B"
+            await account.async_update_info()
+            indications = await account.async_get_byt_indications()
+            assert [x.meter_code for x in indications] == ["B"]
+
+            return api.requests
+        finally:
+            await api.async_close()
+
+    assert asyncio.run(_main()) == {"Indications": 3, "LSInfo": 2}
@@ -0,0 +1,55 @@
+from inter_rao_energosbyt.actions.sql.byt import LSInfo, Meters
+from inter_rao_energosbyt.presets.byt import (
+    BytInfoSingle,
+    BytMeter,
+    _extract_numerical_zone_ids,
+    _extract_zone_values,
+)
+from tests.test_charge_estimate import METER_ROW
+
+LS_INFO_ROW = {
+    "nm_addr": "address",
+    "nm_askue": "askue",
+    "nm_fio": "name",
+    "nm_hou": "house",
+    "nm_pstove": "stove",
+    "nm_t1": "Электроэнергия день",
+    "nm_t1_description": "day",
+    "pr_communal": 0,
+    "tp_hou": 1,
+    "vl_person": 1,
+    "vl_t1_tariff": 5.0,
+}
+
+
+def test_zone_layouts_follow_zone_count():
+    double = BytMeter.from_response(None, Meters.from_response(METER_ROW))
+    single_row = dict(METER_ROW, nm_t2=None, vl_t2_last_ind=None)
+    single = BytMeter.from_response(None, Meters.from_response(single_row))
+    double_again = BytMeter.from_response(None, Meters.from_response(METER_ROW))
+
+    assert list(double.zones) == list(double_again.zones) == ["t1", "t2"]
+    assert list(single.zones) == ["t1"]
+    assert double.zones["t2"].last_indication == 500
+
+
+def test_zone_values_of_plain_objects():
+    class Row:
+        nm_t1 = "day"
+        nm_t2 = "night"
+        vl_t1 = 1
+
+    assert _extract_numerical_zone_ids(Row()) == ("t1", "t2")
+    assert _extract_zone_values(Row(), "vl_%s") == (("t1", (1,)), ("t2", (None,)))
+
+
+def test_info_zones_are_memoized_per_info_object():
+    info = BytInfoSingle(LSInfo.from_response(LS_INFO_ROW))
+    assert info.zones is info.zones
+    assert info.zones["t1"].tariff == 5.0
+
+    updated_row = dict(LS_INFO_ROW, nm_t2="Электроэнергия ночь", nm_t2_description="night")
+    updated_row["vl_t2_tariff"] = 2.5
+    updated = BytInfoSingle(LSInfo.from_response(updated_row))
+    assert list(updated.zones) == ["t1", "t2"]
+    assert list(info.zones) == ["t1"]
@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+from inter_rao_energosbyt.cache import AsyncTTLCache
+
+
+def test_cancelled_initiator_does_not_cancel_waiters():
+    async def _main():
+        cache = AsyncTTLCache()
+        release = asyncio.Event()
+        calls = []
+
+        async def _factory():
+            calls.append(None)
+            await release.wait()
+            return "value"
+
+        initiator = asyncio.ensure_future(cache.async_get("key", _factory))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(cache.async_get("key", _factory))
+        await asyncio.sleep(0)
+
+        initiator.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        with pytest.raises(asyncio.CancelledError):
+            await initiator
+        return await waiter, cache.get("key"), len(calls)
+
+    assert asyncio.run(_main()) == ("value", "value", 1)
+
+
+def test_failed_calls_are_shared_and_not_cached():
+    async def _main():
+        cache = AsyncTTLCache()
+        calls = []
+
+        async def _factory():
+            calls.append(None)
+            await asyncio.sleep(0)
+            raise ValueError("failure")
+
+        results = await asyncio.gather(
+            cache.async_get("key", _factory),
+            cache.async_get("key", _factory),
+            return_exceptions=True,
+        )
+        return results, "key" in cache, len(calls)
+
+    results, is_cached, call_count = asyncio.run(_main())
+    assert [type(x) for x in results] == [ValueError, ValueError]
+    assert not is_cached
+    assert call_count == 1
+
+
+def test_invalidation_during_fetch_discards_value():
+    async def _main():
+        cache = AsyncTTLCache()
+
+        async def _factory():
+            await asyncio.sleep(0)
+            return "stale"
+
+        task = asyncio.ensure_future(cache.async_get("key", _factory))
+        await asyncio.sleep(0)
+        cache.invalidate("key")
+        return await task, "key" in cache
+
+    assert asyncio.run(_main()) == ("stale", False)
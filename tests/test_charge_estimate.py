@@ -0,0 +1,123 @@
+import asyncio
+import collections
+from datetime import date, timedelta
+
+from inter_rao_energosbyt.actions.sql.byt import Meters
+from inter_rao_energosbyt.actions.sql.ls_management import LSList
+from inter_rao_energosbyt.api.altai import (
+    ALTElectricityMeter,
+    ALTEletricityAccount,
+    AltaiEnergosbytAPI,
+)
+from tests.test_accounts_update import LS_ROW
+
+METER_ROW = {
+    "dt_ind_inv": "2020-01-01T00:00:00",
+    "dt_meter_install": "2020-01-01T00:00:00",
+    "dt_mpi": "2030-01-01T00:00:00",
+    "kd_result": 0,
+    "kd_tp_uchet_last_ind": 1,
+    "nm_meter": "meter",
+    "nm_meter_num": "m1",
+    "nm_mrk": "model",
+    "nm_result": "ok",
+    "nm_t1": "Электроэнергия день",
+    "nm_t2": "Электроэнергия ночь",
+    "nm_tp_calc_inv": "calc",
+    "nn_mpi_year": 2030,
+    "nn_period_end": 31,
+    "nn_period_start": 1,
+    "pok_param": 1,
+    "pr_flat_meter": 0,
+    "vl_t1_last_ind": 1000,
+    "vl_t2_last_ind": 500,
+}
+
+TARIFF_ROW = {
+    "dt_st": "2000-01-01T00:00:00",
+    "nm_t1": "Электроэнергия день",
+    "nm_t1_within": "Электроэнергия день в пределах нормы",
+    "nm_t2": "Электроэнергия ночь",
+    "nm_t2_within": "Электроэнергия ночь в пределах нормы",
+    "vl_t1_tariff": 5.0,
+    "vl_t1_tariff_within": 4.0,
+    "vl_t2_tariff": 2.5,
+    "vl_t2_tariff_within": 2.0,
+}
+
+# Charge calculated by the portal for t1=1150, t2=550 with social norm of 100 kWh:
+# norm is split proportionally to consumption (75 kWh day, 25 kWh night), so
+# 75 * 4.0 + 75 * 5.0 + 25 * 2.0 + 25 * 2.5
+PORTAL_CHARGE = 787.5
+
+
+class CalcChargeAPI(AltaiEnergosbytAPI):
+    __slots__ = ("requests",)
+
+    def __init__(self):
+        super().__init__("user", "pass")
+        self.requests = collections.Counter()
+
+    async def _async_action_with_exceptions(self, action, query, data):
+        await asyncio.sleep(0)
+        query = data.get("proxyquery", query)
+        self.requests[query] += 1
+        if query == "TariffHistory":
+            return {"success": True, "data": [TARIFF_ROW]}
+        if query == "GetContactPhone":
+            return {"success": True, "data": [{"nn_contact_phone": "+70000000000"}]}
+        if query == "CalcCharge":
+            return {
+                "success": True,
+                "data": [{"kd_result": 1000, "pr_correct": 1, "sm_charge": PORTAL_CHARGE}],
+            }
+        return {"success": True, "data": []}
+
+
+class OutdatedTariffsAccount(ALTEletricityAccount):
+    __slots__ = ()
+
+    @property
+    def tariff_history_snapshot_time(self):
+        retrieved_at = super().tariff_history_snapshot_time
+        if retrieved_at is not None:
+            retrieved_at -= timedelta(days=date.today().day + 1)
+        return retrieved_at
+
+
+def _estimate(account_cls=ALTEletricityAccount, confirm=False):
+    async def _main():
+        api = CalcChargeAPI()
+        try:
+            account = account_cls(api, LSList.from_response(LS_ROW))
+            meter = ALTElectricityMeter.from_response(account, Meters.from_response(METER_ROW))
+            estimate = await meter.async_estimate_indications_charge(
+                t1=1150,
+                t2=550,
+                social_norm=100,
+                confirm=confirm,
+            )
+            return estimate, api.requests
+        finally:
+            await api.async_close()
+
+    return asyncio.run(_main())
+
+
+def test_local_estimate_matches_portal_calculation():
+    confirmed, _ = _estimate(confirm=True)
+    estimate, requests = _estimate()
+
+    assert confirmed.is_confirmed
+    assert not estimate.is_confirmed
+    assert estimate.charge == confirmed.charge == PORTAL_CHARGE
+    assert dict(estimate.consumption) == {"t1": 150.0, "t2": 50.0}
+    assert requests["CalcCharge"] == 0
+
+
+def test_outdated_tariffs_fall_back_to_portal():
+    estimate, requests = _estimate(OutdatedTariffsAccount)
+
+    assert estimate.is_confirmed
+    assert estimate.charge == PORTAL_CHARGE
+    assert requests["CalcCharge"] == 1
@@ -0,0 +1,106 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from inter_rao_energosbyt.actions.sql.byt import Pays
+from inter_rao_energosbyt.exceptions import RequestTimeoutException
+from inter_rao_energosbyt.history import HistoryKind
+from inter_rao_energosbyt.interfaces import WithDatedRequests
+
+PAYMENTS = HistoryKind(
+    name="payments",
+    data_cls=Pays,
+    get_id=lambda x: x.dt_pay + "_" + str(x.sm_pay),
+    get_time=lambda x: x.dt_pay,
+)
+
+PORTAL_PAYMENTS = [
+    Pays.from_response(
+        {"dt_pay": "%d-%02d-01T00:00:00" % (year, month), "nm_status": "ok", "sm_pay": month}
+    )
+    for year in range(2015, 2022)
+    for month in range(1, 13)
+]
+
+
+class ChunkedSource(WithDatedRequests):
+    timezone = None
+    dated_chunk_months = 12
+
+    def __init__(self):
+        self.api = type("API", (), {"history_store": None})()
+        self.requests = []
+
+    async def async_fetch(self, start, end):
+        self.requests.append((start, end))
+        # Portal returns newest items first
+        return [
+            x for x in reversed(PORTAL_PAYMENTS) if start <= datetime.fromisoformat(x.dt_pay) <= end
+        ]
+
+
+def test_chunking_is_opt_in():
+    assert WithDatedRequests.dated_chunk_months is None
+
+
+def test_chunked_fetch_merges_windows_in_portal_order():
+    source = ChunkedSource()
+    result = asyncio.run(
+        source._internal_async_fetch_dated(
+            PAYMENTS, datetime(2015, 1, 1), datetime(2021, 12, 31), source.async_fetch
+        )
+    )
+
+    assert len(source.requests) > 1
+    assert result == list(reversed(PORTAL_PAYMENTS))
+
+
+def test_byt_fetchers_are_chunked_by_default():
+    from inter_rao_energosbyt.presets.byt import (
+        AccountWithBytIndications,
+        AccountWithBytInvoices,
+        AccountWithBytPayments,
+    )
+
+    for account_cls in (AccountWithBytIndications, AccountWithBytInvoices, AccountWithBytPayments):
+        assert account_cls.dated_chunk_months == 12
+
+
+class TimingOutSource(ChunkedSource):
+    async def async_fetch(self, start, end):
+        if end - start > timedelta(days=200):
+            self.requests.append((start, end))
+            raise RequestTimeoutException("Timeout error")
+        return await super().async_fetch(start, end)
+
+
+def test_timed_out_windows_are_split():
+    source = TimingOutSource()
+    result = asyncio.run(
+        source._internal_async_fetch_dated(
+            PAYMENTS, datetime(2019, 1, 1), datetime(2020, 12, 31), source.async_fetch
+        )
+    )
+
+    # Each yearly window times out once and is fetched in two halves
+    assert len(source.requests) == 2 + 4
+    assert result == [x for x in reversed(PORTAL_PAYMENTS) if "2019" <= x.dt_pay < "2021"]
+
+
+def test_windows_time_out_after_max_splits():
+    class AlwaysTimingOutSource(ChunkedSource):
+        async def async_fetch(self, start, end):
+            self.requests.append((start, end))
+            raise RequestTimeoutException("Timeout error")
+
+    source = AlwaysTimingOutSource()
+    with pytest.raises(RequestTimeoutException):
+        asyncio.run(
+            source._internal_async_fetch_dated(
+                PAYMENTS, datetime(2020, 1, 1), datetime(2020, 12, 31), source.async_fetch
+            )
+        )
+
+    # Single window split three times over
+    assert len(source.requests) == 1 + 2 + 4 + 8
@@ -0,0 +1,76 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from inter_rao_energosbyt.interfaces import WithDatedRequests
+
+NOW = datetime.now(timezone.utc)
+
+
+class DatedSource(WithDatedRequests):
+    timezone = timezone.utc
+
+    def __init__(self, items):
+        self.items = items
+        self.requests = []
+        self._dated_last_hints = {}
+
+    async def async_get_items(self, start, end):
+        self.requests.append((start, end))
+        return [item for item in self.items if start <= item <= end]
+
+    def find_last(self, **kwargs):
+        return asyncio.run(self._internal_async_find_dated_last(self.async_get_items, **kwargs))
+
+
+def test_dated_last_dormant_account_request_count():
+    source = DatedSource([])
+    assert source.find_last() is None
+    # Three probe windows and five walk pages, no unbounded request
+    assert len(source.requests) == 8
+    assert all(start.year > 1 for start, _ in source.requests)
+
+
+def test_dated_last_walk_finds_old_item():
+    item = NOW - timedelta(days=365 * 5)
+    source = DatedSource([item])
+    assert source.find_last() == item
+    # Probes span 13 months, the item is within the fourth walk page
+    assert len(source.requests) == 7
+
+
+def test_dated_last_unbounded_request_is_opt_in():
+    item = NOW - timedelta(days=365 * 20)
+    source = DatedSource([item])
+    assert source.find_last() is None
+    assert source.find_last(with_min_date=True) == item
+
+
+def test_dated_last_hints_are_keyed_explicitly_for_plain_callables():
+    source = DatedSource([NOW - timedelta(days=60)])
+    other = DatedSource([])
+
+    async def _find(getter, **kwargs):
+        return await source._internal_async_find_dated_last(getter, end=NOW, **kwargs)
+
+    asyncio.run(_find(lambda start, end: source.async_get_items(start, end)))
+    asyncio.run(_find(lambda start, end: other.async_get_items(start, end)))
+    # Lambdas do not share a hint
+    assert source._dated_last_hints == {}
+
+    asyncio.run(_find(source.async_get_items, hint_key="items"))
+    assert set(source._dated_last_hints) == {"items"}
+
+
+def test_dated_last_hint_keeps_window_size():
+    item = NOW - timedelta(days=60)
+    source = DatedSource([item])
+    assert source.find_last(end=NOW) == item
+    assert len(source.requests) == 2
+    hint_size = NOW - source.requests[-1][0]
+
+    # Later searches start with a window of the same size instead of a growing one
+    later = NOW + timedelta(days=30)
+    source.requests.clear()
+    assert source.find_last(end=later) == item
+    assert source.requests[0] == (later - hint_size, later)
+    assert len(source.requests) == 1
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+from inter_rao_energosbyt.api.moscow import MoscowEnergosbytAPI
+
+
+class CountingAPI(MoscowEnergosbytAPI):
+    __slots__ = ("updates",)
+
+    def __init__(self):
+        super().__init__("user", "pass")
+        self.updates = 0
+
+    async def async_update_accounts(self, *args, **kwargs):
+        self.updates += 1
+        return {}
+
+
+def _run(coro_factory):
+    async def _main():
+        api = CountingAPI()
+        try:
+            return await coro_factory(api)
+        finally:
+            await api.async_close()
+
+    return asyncio.run(_main())
+
+
+def test_deferred_updates_are_coalesced():
+    async def _scenario(api):
+        async with api.deferred_account_updates():
+            async with api.deferred_account_updates():
+                await api._async_request_accounts_update()
+            await api._async_request_accounts_update()
+            assert api.updates == 0
+        return api.updates
+
+    assert _run(_scenario) == 1
+
+
+def test_deferral_does_not_affect_other_tasks():
+    async def _scenario(api):
+        release = asyncio.Event()
+
+        async def _deferring():
+            async with api.deferred_account_updates():
+                await release.wait()
+
+        task = asyncio.ensure_future(_deferring())
+        await asyncio.sleep(0)
+
+        await api._async_request_accounts_update()
+        assert api.updates == 1
+
+        release.set()
+        await task
+        return api.updates
+
+    assert _run(_scenario) == 1
+
+
+def test_deferred_update_is_skipped_on_error():
+    async def _scenario(api):
+        with pytest.raises(ValueError):
+            async with api.deferred_account_updates():
+                await api._async_request_accounts_update()
+                raise ValueError
+        return api.updates
+
+    assert _run(_scenario) == 0
@@ -0,0 +1,104 @@
+import asyncio
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytz
+
+from inter_rao_energosbyt.actions.sql.byt import Pays
+from inter_rao_energosbyt.history import HistoryKind, MemoryHistoryStore, SQLiteHistoryStore
+
+PAYMENTS = HistoryKind(
+    name="payments",
+    data_cls=Pays,
+    get_id=lambda x: x.dt_pay + "_" + str(x.sm_pay),
+    get_time=lambda x: x.dt_pay,
+)
+
+PORTAL_PAYMENTS = [
+    {"dt_pay": "2021-%02d-15T00:00:00" % month, "nm_status": "ok", "sm_pay": float(month)}
+    for month in range(1, 8)
+]
+
+
+class FakePortal:
+    def __init__(self, rows=PORTAL_PAYMENTS):
+        self.rows = rows
+        self.requests = []
+
+    async def async_fetch(self, start, end):
+        self.requests.append((start, end))
+        return [
+            Pays.from_response(row)
+            for row in self.rows
+            if start <= datetime.fromisoformat(row["dt_pay"]) <= end
+        ]
+
+
+def _make_account():
+    return SimpleNamespace(api=SimpleNamespace(username="user"), id=1, timezone=None)
+
+
+def _fetch(store, account, portal, start, end):
+    return asyncio.run(store.async_fetch(account, PAYMENTS, start, end, portal.async_fetch))
+
+
+def test_history_store_fetches_missing_range_only_once():
+    store, account, portal = MemoryHistoryStore(), _make_account(), FakePortal()
+
+    result = _fetch(store, account, portal, datetime(2021, 1, 1), datetime(2021, 7, 31))
+    assert len(result) == 7
+    assert len(portal.requests) == 1
+
+    result = _fetch(store, account, portal, datetime(2021, 2, 1), datetime(2021, 3, 31))
+    assert [x.sm_pay for x in result] == [2.0, 3.0]
+
+
+def test_history_store_does_not_cover_unfetched_gap():
+    store, account, portal = MemoryHistoryStore(), _make_account(), FakePortal()
+
+    _fetch(store, account, portal, datetime(2021, 1, 1), datetime(2021, 3, 31))
+    _fetch(store, account, portal, datetime(2021, 6, 1), datetime(2021, 7, 31))
+
+    result = _fetch(store, account, portal, datetime(2021, 4, 1), datetime(2021, 5, 31))
+    assert [x.sm_pay for x in result] == [4.0, 5.0]
+
+
+def test_history_store_keeps_indistinguishable_records():
+    store, account = MemoryHistoryStore(), _make_account()
+    portal = FakePortal(PORTAL_PAYMENTS + [PORTAL_PAYMENTS[0]])
+
+    _fetch(store, account, portal, datetime(2021, 1, 1), datetime(2021, 2, 28))
+    result = _fetch(store, account, portal, datetime(2021, 1, 1), datetime(2021, 3, 31))
+
+    assert [x.sm_pay for x in result] == [1.0, 1.0, 2.0, 3.0]
+
+
+def test_history_record_time_is_localized_with_pytz_zone():
+    tz = pytz.timezone("Europe/Moscow")
+    pays = Pays.from_response(PORTAL_PAYMENTS[0])
+
+    _, record_ts, _ = PAYMENTS.make_record(pays, tz)
+
+    assert record_ts == tz.localize(datetime(2021, 1, 15)).timestamp()
+    assert datetime.fromtimestamp(record_ts, pytz.utc).hour == 21
+
+
+def test_sqlite_history_store_operates_off_event_loop(tmp_path):
+    threads = set()
+
+    class ThreadRecordingStore(SQLiteHistoryStore):
+        def get_records(self, *args):
+            threads.add(threading.get_ident())
+            return super().get_records(*args)
+
+    store = ThreadRecordingStore(str(tmp_path / "history.db"))
+    account, portal = _make_account(), FakePortal()
+    try:
+        _fetch(store, account, portal, datetime(2021, 1, 1), datetime(2021, 3, 31))
+        result = _fetch(store, account, portal, datetime(2021, 2, 1), datetime(2021, 3, 31))
+    finally:
+        store.close()
+
+    assert [x.sm_pay for x in result] == [2.0, 3.0]
+    assert threading.get_ident() not in threads
@@ -0,0 +1,107 @@
+import asyncio
+from datetime import date
+from types import SimpleNamespace
+
+from inter_rao_energosbyt.actions.sql.ls_management import LSList
+from inter_rao_energosbyt.api.moscow import MoscowEnergosbytAPI
+from inter_rao_energosbyt.interfaces import (
+    AbstractAccountWithMeters,
+    AbstractCalculatableMeter,
+    AbstractSubmittableMeter,
+)
+from tests.test_accounts_update import LS_ROW
+
+
+class FakeMeter(AbstractSubmittableMeter, AbstractCalculatableMeter):
+    __slots__ = ("_account", "_id", "_zones")
+
+    def __init__(self, account, meter_id, zone_ids):
+        self._account = account
+        self._id = meter_id
+        self._zones = {
+            zone_id: SimpleNamespace(last_indication=account.last_indication)
+            for zone_id in zone_ids
+        }
+
+    @property
+    def account(self):
+        return self._account
+
+    @property
+    def id(self):
+        return self._id
+
+    @property
+    def zones(self):
+        return self._zones
+
+    @property
+    def submission_period(self):
+        return date.min, date.max
+
+    async def _internal_async_calculate_indications(self, **kwargs):
+        return float(sum(kwargs.values()))
+
+    async def _internal_async_submit_indications(self, **kwargs):
+        self._account.last_indication = max(kwargs.values())
+        return kwargs
+
+
+class FakeMetersAccount(AbstractAccountWithMeters):
+    __slots__ = ("retrievals", "last_indication")
+
+    def __init__(self, api, data):
+        super().__init__(api, data)
+        self.retrievals = 0
+        self.last_indication = 10
+
+    async def async_get_meters(self):
+        await asyncio.sleep(0)
+        self.retrievals += 1
+        return {
+            "m1": FakeMeter(self, "m1", ("t1", "t2")),
+            "m2": FakeMeter(self, "m2", ("t3",)),
+        }
+
+
+def _run(scenario):
+    async def _main():
+        api = MoscowEnergosbytAPI("user", "pass")
+        try:
+            account = FakeMetersAccount(api, LSList.from_response(LS_ROW))
+            await scenario(account)
+            return account
+        finally:
+            await api.async_close()
+
+    return asyncio.run(_main())
+
+
+def test_meters_calculate_submit_retrieve_meters_once():
+    async def _scenario(account):
+        meters = await account.async_get_meters()
+        assert set(meters) == {"m1", "m2"}
+
+        charges = await account.async_calculate_indications(t1=11, t3=12)
+        assert charges == {"m1": 11.0, "m2": 12.0}
+
+        await account.async_submit_indications(t1=11, t3=12)
+
+    assert _run(_scenario).retrievals == 1
+
+
+def test_concurrent_snapshot_readers_share_retrieval():
+    async def _scenario(account):
+        results = await asyncio.gather(*(account.async_get_meters_snapshot() for _ in range(5)))
+        assert all(result is results[0] for result in results)
+
+    assert _run(_scenario).retrievals == 1
+
+
+def test_submission_invalidates_snapshot():
+    async def _scenario(account):
+        await account.async_submit_indications(t1=11)
+        meters = await account.async_get_meters_snapshot()
+        assert meters["m1"].zones["t1"].last_indication == 11
+
+    assert _run(_scenario).retrievals == 2
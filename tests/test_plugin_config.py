@@ -0,0 +1,64 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from inter_rao_energosbyt.plugin_config import JSONPluginConfigStore
+
+
+def _make_account(account_id):
+    api = SimpleNamespace(username="user", APP_VERSION="1.0")
+    return SimpleNamespace(api=api, id=account_id)
+
+
+def _read(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_json_store_batches_writes_within_event_loop(tmp_path):
+    path = str(tmp_path / "plugin_config.json")
+    accounts = [_make_account(account_id) for account_id in range(50)]
+
+    async def _main():
+        store = JSONPluginConfigStore(path, write_delay=60)
+        for account in accounts:
+            store.save(account, "byt", ("proxy", str(account.id)))
+        assert not (tmp_path / "plugin_config.json").exists()
+
+        await store.async_flush()
+        return store
+
+    asyncio.run(_main())
+
+    assert sum(len(presets) for presets in _read(path).values()) == len(accounts)
+
+    store = JSONPluginConfigStore(path)
+    assert store.load(accounts[7], "byt").provider == "7"
+
+
+def test_json_store_writes_in_background_after_delay(tmp_path):
+    path = str(tmp_path / "plugin_config.json")
+    account = _make_account(1)
+
+    async def _main():
+        store = JSONPluginConfigStore(path, write_delay=0)
+        store.save(account, "byt", ("proxy", "provider"))
+        store.discard(account, "smorodina")
+        while store._written_changes < 2:
+            await asyncio.sleep(0.01)
+
+    asyncio.run(asyncio.wait_for(_main(), 5))
+
+    assert JSONPluginConfigStore(path).load(account, "byt").provider == "provider"
+
+
+def test_json_store_writes_immediately_without_event_loop(tmp_path):
+    path = str(tmp_path / "plugin_config.json")
+    account = _make_account(1)
+
+    store = JSONPluginConfigStore(path)
+    store.save(account, "byt", ("proxy", "provider"))
+    assert JSONPluginConfigStore(path).load(account, "byt") is not None
+
+    store.discard(account)
+    assert _read(path) == {}
@@ -0,0 +1,95 @@
+import asyncio
+import collections
+
+from inter_rao_energosbyt.actions.sql.ls_management import LSList
+from inter_rao_energosbyt.api.tomsk import TMKNRGAccount, TomskEnergosbytAPI
+from inter_rao_energosbyt.plugin_config import MemoryPluginConfigStore
+
+LS_ROW = {
+    "data": {"KD_LS_OWNER_TYPE": 1, "nm_street": "street"},
+    "id_service": 100,
+    "kd_provider": 3,
+    "kd_service_type": 1,
+    "kd_status": 1,
+    "nm_ls_group": "g",
+    "nm_ls_group_full": "g",
+    "nm_provider": "p",
+    "nm_type": "t",
+    "nn_ls": "123",
+    "pr_ls_group_edit": 1,
+    "vl_provider": "{}",
+}
+
+
+class GateCountingAPI(TomskEnergosbytAPI):
+    __slots__ = ("requests",)
+
+    def __init__(self, **kwargs):
+        super().__init__("user", "pass", **kwargs)
+        self.requests = collections.Counter()
+
+    async def _async_action_with_exceptions(self, action, query, data):
+        await asyncio.sleep(0)
+        self.requests[query] += 1
+        if query == "TmkCheckBytLs":
+            return {"success": True, "data": [{"vl_provider": "{}", "byt_only": 1}]}
+        return {"success": True, "data": []}
+
+
+def _run(scenario, **kwargs):
+    async def _main():
+        api = GateCountingAPI(**kwargs)
+        try:
+            account = TMKNRGAccount(api, LSList.from_response(LS_ROW))
+            await scenario(api, account)
+            return api.requests
+        finally:
+            await api.async_close()
+
+    return asyncio.run(_main())
+
+
+def test_concurrent_preparations_share_single_request():
+    async def _scenario(api, account):
+        results = await asyncio.gather(
+            *(account._internal_async_prepare_byt_preset_parameters() for _ in range(5))
+        )
+        assert set(results) == {("bytTmkProxy", "{}")}
+
+    assert _run(_scenario)["TmkCheckBytLs"] == 1
+
+
+def test_repeat_fetches_do_not_resolve_parameters_again():
+    async def _scenario(api, account):
+        for _ in range(3):
+            await account.async_get_payments()
+
+    requests = _run(_scenario)
+    assert requests["TmkCheckBytLs"] == 1
+    assert sum(requests.values()) > 1
+
+
+def test_invalidation_resolves_parameters_again():
+    async def _scenario(api, account):
+        await account._internal_async_prepare_byt_preset_parameters()
+        account.invalidate_byt_preset_parameters()
+        await account._internal_async_prepare_byt_preset_parameters()
+        await account._internal_async_prepare_byt_preset_parameters()
+
+    assert _run(_scenario)["TmkCheckBytLs"] == 2
+
+
+def test_invalidation_discards_stored_parameters():
+    store = MemoryPluginConfigStore()
+
+    async def _scenario(api, account):
+        await account._internal_async_prepare_byt_preset_parameters()
+        assert store.load(account, "byt") is not None
+
+        account.invalidate_byt_preset_parameters()
+        assert store.load(account, "byt") is None
+
+        await account._internal_async_prepare_byt_preset_parameters()
+        assert store.load(account, "byt") is not None
+
+    assert _run(_scenario, plugin_config_store=store)["TmkCheckBytLs"] == 2
@@ -0,0 +1,96 @@
+import asyncio
+import collections
+
+from inter_rao_energosbyt.api.moscow import MoscowEnergosbytAPI
+
+
+class ProviderDataAPI(MoscowEnergosbytAPI):
+    __slots__ = ("requests",)
+
+    def __init__(self):
+        super().__init__("user", "pass")
+        self.requests = collections.Counter()
+
+    async def _async_action_with_exceptions(self, action, query, data):
+        await asyncio.sleep(0)
+        provider_id = data["kd_provider"]
+        self.requests[(query, provider_id)] += 1
+        if query == "GetContactPhone":
+            return {"success": True, "data": [{"nn_contact_phone": "+7%010d" % provider_id}]}
+        return {
+            "success": True,
+            "data": [{"pay_avail": 1, "ind_avail": provider_id == 1, "balance_avail": 1}],
+        }
+
+
+class UncachedAvailabilityAPI(ProviderDataAPI):
+    __slots__ = ()
+
+    availability_cache_ttl = 0
+
+
+def _run(scenario, api_cls=ProviderDataAPI):
+    async def _main():
+        api = api_cls()
+        try:
+            await scenario(api)
+            return api.requests
+        finally:
+            await api.async_close()
+
+    return asyncio.run(_main())
+
+
+def test_provider_data_is_cached_per_provider():
+    async def _scenario(api):
+        phones = await asyncio.gather(
+            api.async_get_contact_phone(1),
+            api.async_get_contact_phone("1"),
+            api.async_get_contact_phone(2),
+        )
+        assert phones == ["+70000000001", "+70000000001", "+70000000002"]
+        assert await api.async_get_contact_phone(1) == "+70000000001"
+
+        assert (await api.async_get_availability(1)).ind_avail
+        assert not (await api.async_get_availability(2)).ind_avail
+        await api.async_get_availability(1)
+
+    assert _run(_scenario) == {
+        ("GetContactPhone", 1): 1,
+        ("GetContactPhone", 2): 1,
+        ("IndicationAndPayAvail", 1): 1,
+        ("IndicationAndPayAvail", 2): 1,
+    }
+
+
+def test_provider_caches_invalidation():
+    async def _scenario(api):
+        for provider_id in (1, 2):
+            await api.async_get_contact_phone(provider_id)
+            await api.async_get_availability(provider_id)
+
+        await api.async_get_contact_phone(1, use_cache=False)
+
+        api.invalidate_provider_caches(2)
+        for provider_id in (1, 2):
+            await api.async_get_contact_phone(provider_id)
+            await api.async_get_availability(provider_id)
+
+        api.invalidate_provider_caches()
+        await api.async_get_availability(1)
+
+    assert _run(_scenario) == {
+        ("GetContactPhone", 1): 2,
+        ("GetContactPhone", 2): 2,
+        ("IndicationAndPayAvail", 1): 2,
+        ("IndicationAndPayAvail", 2): 2,
+    }
+
+
+def test_expired_provider_data_is_refetched():
+    async def _scenario(api):
+        await api.async_get_availability(1)
+        await asyncio.sleep(0.01)
+        await api.async_get_availability(1)
+
+    assert _run(_scenario, UncachedAvailabilityAPI)[("IndicationAndPayAvail", 1)] == 2
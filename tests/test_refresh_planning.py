@@ -0,0 +1,96 @@
+import asyncio
+from datetime import timedelta
+
+from inter_rao_energosbyt.exceptions import EnergosbytException
+from inter_rao_energosbyt.interfaces import AccountRefreshReason
+from tests.test_accounts_update import LS_ROW, FakeAccountsAPI
+
+
+class NoticesAPI(FakeAccountsAPI):
+    __slots__ = ("notices",)
+
+    def __init__(self, rows):
+        super().__init__(rows)
+        self.notices = [
+            {"id_service": 100, "cnt_notice": 0, "is_critical": 0},
+            {"id_service": 101, "cnt_notice": 0, "is_critical": 0},
+        ]
+
+    async def _async_action_with_exceptions(self, action, query, data):
+        if query == "GetLSListNoticeStatus":
+            if self.notices is None:
+                raise EnergosbytException("Notices unavailable")
+            return {"success": True, "data": [dict(row) for row in self.notices]}
+        if query == "NoticeRoutine":
+            return {"success": True, "data": []}
+        return await super()._async_action_with_exceptions(action, query, data)
+
+
+def _run(scenario):
+    async def _main():
+        api = NoticesAPI([LS_ROW, dict(LS_ROW, id_service=101)])
+        try:
+            return await scenario(api)
+        finally:
+            await api.async_close()
+
+    return asyncio.run(_main())
+
+
+def test_refresh_is_planned_from_notices_and_staleness():
+    async def _scenario(api):
+        plan = await api.async_plan_accounts_refresh()
+        assert plan.due == {
+            100: AccountRefreshReason.NEW,
+            101: AccountRefreshReason.NEW,
+        }
+        for account_id in plan.due:
+            api.mark_account_refreshed(account_id, plan)
+
+        assert (await api.async_plan_accounts_refresh()).due == {}
+
+        api.notices[1]["cnt_notice"] = 1
+        assert (await api.async_plan_accounts_refresh()).due == {
+            101: AccountRefreshReason.NOTICE
+        }
+
+        plan = await api.async_plan_accounts_refresh(max_staleness=timedelta(0))
+        assert plan.due == {
+            100: AccountRefreshReason.STALE,
+            101: AccountRefreshReason.NOTICE,
+        }
+
+        api.notices = None
+        assert set((await api.async_plan_accounts_refresh()).due.values()) == {
+            AccountRefreshReason.UNKNOWN
+        }
+
+    _run(_scenario)
+
+
+def test_failed_and_changed_accounts_are_refreshed_again():
+    async def _scenario(api):
+        refreshed = []
+
+        async def _refresher(account):
+            refreshed.append(account.id)
+            if account.id == 101 and refreshed.count(101) == 1:
+                raise EnergosbytException("refresh failed")
+
+        results = await api.async_refresh_accounts(_refresher)
+        assert results[100] is None
+        assert isinstance(results[101], EnergosbytException)
+
+        await api.async_refresh_accounts(_refresher)
+        assert sorted(refreshed) == [100, 101, 101]
+
+        # Changed account data invalidates refresh state
+        api.rows = [dict(LS_ROW, nn_ls="456"), dict(LS_ROW, id_service=101)]
+        await api.async_refresh_accounts(_refresher)
+        assert sorted(refreshed) == [100, 100, 101, 101]
+
+        api.invalidate_account_refresh()
+        await api.async_refresh_accounts(_refresher)
+        assert sorted(refreshed) == [100, 100, 100, 101, 101, 101]
+
+    _run(_scenario)
@@ -0,0 +1,114 @@
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from inter_rao_energosbyt.submission import SubmissionEventType, SubmissionScheduler
+from inter_rao_energosbyt.util import get_submission_period
+
+TZ = timezone(timedelta(hours=3))
+
+
+class FakeAccount:
+    timezone = TZ
+
+    def __init__(self, account_id=1):
+        self.id = account_id
+
+
+class FakeMeter:
+    def __init__(self, meter_id, start_day, end_day, account=None):
+        self.id = meter_id
+        self.account = FakeAccount() if account is None else account
+        self.start_day = start_day
+        self.end_day = end_day
+
+    def get_submission_period(self, on_date):
+        return get_submission_period(on_date, self.start_day, self.end_day)
+
+
+@pytest.mark.parametrize(
+    "on_date, start_day, end_day, expected",
+    [
+        # Days beyond month length are clamped
+        (date(2023, 2, 10), 15, 31, (date(2023, 2, 15), date(2023, 2, 28))),
+        (date(2024, 2, 10), 15, 31, (date(2024, 2, 15), date(2024, 2, 29))),
+        (date(2023, 4, 30), 31, 31, (date(2023, 4, 30), date(2023, 4, 30))),
+        (date(2023, 6, 1), None, None, (date(2023, 6, 1), date(2023, 6, 30))),
+        # Periods spanning month boundary
+        (date(2023, 3, 3), 25, 5, (date(2023, 2, 25), date(2023, 3, 5))),
+        (date(2023, 3, 20), 25, 5, (date(2023, 3, 25), date(2023, 4, 5))),
+        (date(2023, 3, 2), 30, 5, (date(2023, 2, 28), date(2023, 3, 5))),
+        # Year rollover
+        (date(2023, 12, 30), 25, 5, (date(2023, 12, 25), date(2024, 1, 5))),
+        (date(2024, 1, 3), 25, 5, (date(2023, 12, 25), date(2024, 1, 5))),
+    ],
+)
+def test_submission_period_edge_cases(on_date, start_day, end_day, expected):
+    assert get_submission_period(on_date, start_day, end_day) == expected
+
+
+def _take_all(scheduler, count):
+    events = []
+    for _ in range(count):
+        events.extend(scheduler.pop_due(scheduler.next_wakeup))
+    return events
+
+
+def test_scheduler_rolls_over_to_next_year():
+    scheduler = SubmissionScheduler()
+    scheduler.add_meter(FakeMeter("m", 25, 5), datetime(2023, 12, 26, tzinfo=TZ))
+
+    events = _take_all(scheduler, 3)
+    assert [(x.type, x.period) for x in events] == [
+        (SubmissionEventType.OPENED, (date(2023, 12, 25), date(2024, 1, 5))),
+        (SubmissionEventType.CLOSING, (date(2023, 12, 25), date(2024, 1, 5))),
+        (SubmissionEventType.OPENED, (date(2024, 1, 25), date(2024, 2, 5))),
+    ]
+
+
+def test_scheduler_readding_meter_discards_previous_events():
+    now = datetime(2023, 2, 10, 12, tzinfo=TZ)
+    scheduler = SubmissionScheduler()
+    scheduler.add_meter(FakeMeter("m", 15, 25), now)
+    scheduler.add_meter(FakeMeter("m", 20, 25), now)
+
+    events = _take_all(scheduler, 2)
+    assert len(scheduler) == 1
+    assert [(x.type, x.period[0]) for x in events] == [
+        (SubmissionEventType.OPENED, date(2023, 2, 20)),
+        (SubmissionEventType.CLOSING, date(2023, 2, 20)),
+    ]
+
+
+def test_scheduler_removed_meter_has_no_events():
+    now = datetime(2023, 2, 10, 12, tzinfo=TZ)
+    scheduler = SubmissionScheduler()
+    meter = FakeMeter("m", 15, 25)
+    scheduler.add_meter(meter, now)
+    scheduler.remove_meter(meter)
+
+    assert scheduler.next_wakeup is None
+
+
+def test_scheduler_callback_failure_does_not_stop_loop():
+    scheduler = SubmissionScheduler(retry_delay=timedelta(milliseconds=10))
+    failing, working = FakeAccount(1), FakeAccount(2)
+    scheduler.add_meter(FakeMeter("a", 1, 31, failing))
+    scheduler.add_meter(FakeMeter("b", 1, 31, working))
+
+    calls = []
+    stop_event = asyncio.Event()
+
+    def _callback(account, events):
+        calls.append((account.id, [x.attempt for x in events]))
+        if account is failing and len(calls) < 3:
+            raise RuntimeError("callback failure")
+        if len(calls) >= 3:
+            stop_event.set()
+
+    asyncio.run(asyncio.wait_for(scheduler.async_run(_callback, stop_event), 5))
+
+    failing_attempts = [set(attempts) for account_id, attempts in calls if account_id == 1]
+    assert failing_attempts == [{0}, {1}]
+    assert [account_id for account_id, _ in calls].count(2) == 1
@@ -0,0 +1,66 @@
+import asyncio
+
+from inter_rao_energosbyt.actions.sql.ls_management import LSList
+from inter_rao_energosbyt.api.moscow import MoscowEnergosbytAPI
+from inter_rao_energosbyt.submission import (
+    BulkIndicationSubmitter,
+    IndicationSubmission,
+    SubmissionStatus,
+)
+from tests.test_accounts_update import LS_ROW
+from tests.test_meters_snapshot import FakeMeter, FakeMetersAccount
+
+
+class CheckCountingMeter(FakeMeter):
+    __slots__ = ()
+
+    checks = []
+
+    async def _internal_async_perform_pre_transmission_checks(self, **kwargs):
+        if not (kwargs.get("ignore_periods") and kwargs.get("ignore_values")):
+            self.checks.append(self.id)
+        return await super()._internal_async_perform_pre_transmission_checks(**kwargs)
+
+
+class CheckCountingAccount(FakeMetersAccount):
+    __slots__ = ()
+
+    async def async_get_meters(self):
+        self.retrievals += 1
+        return {"m1": CheckCountingMeter(self, "m1", ("t1",))}
+
+
+def _run(submitter, make_submissions):
+    async def _main():
+        api = MoscowEnergosbytAPI("user", "pass")
+        try:
+            account = CheckCountingAccount(api, LSList.from_response(LS_ROW))
+            return await submitter.async_submit(make_submissions(account))
+        finally:
+            await api.async_close()
+
+    CheckCountingMeter.checks.clear()
+    return asyncio.run(_main())
+
+
+def test_pre_transmission_checks_run_once_per_submission():
+    outcomes = _run(
+        BulkIndicationSubmitter(calculate=True),
+        lambda account: [IndicationSubmission(account=account, meter_id="m1", values={"t1": 11})],
+    )
+
+    assert [outcome.status for outcome in outcomes] == [SubmissionStatus.SUBMITTED]
+    assert outcomes[0].charge == 11.0
+    assert CheckCountingMeter.checks == ["m1"]
+
+
+def test_failed_local_checks_reject_submission():
+    outcomes = _run(
+        BulkIndicationSubmitter(),
+        lambda account: [
+            IndicationSubmission(account=account, meter_id="m1", values={"t1": 9}),
+            IndicationSubmission(account=account, meter_id="m2", values={"t1": 12}),
+        ],
+    )
+
+    assert [outcome.status for outcome in outcomes] == [SubmissionStatus.REJECTED] * 2
@@ -0,0 +1,104 @@
+import importlib
+import itertools
+import pkgutil
+
+import pytest
+
+import inter_rao_energosbyt.api
+from inter_rao_energosbyt.api.moscow import MoscowEnergosbytAPI
+from inter_rao_energosbyt.enums import ProviderType, ServiceType
+from inter_rao_energosbyt.interfaces import Account, BaseEnergosbytAPI
+
+for _module_info in pkgutil.iter_modules(inter_rao_energosbyt.api.__path__):
+    importlib.import_module("inter_rao_energosbyt.api." + _module_info.name)
+
+
+def _iter_subclasses(cls):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _iter_subclasses(subclass)
+
+
+API_CLASSES = [BaseEnergosbytAPI, *_iter_subclasses(BaseEnergosbytAPI)]
+
+
+def _resolve_reference(api_cls, provider_type, service_type, with_fallbacks):
+    """Registry lookup order, as documented by `get_supported_account`"""
+    supported_accounts = api_cls.SUPPORTED_ACCOUNTS
+    candidates = [(provider_type, service_type)]
+    if with_fallbacks:
+        candidates += [(provider_type, None), (None, service_type), (None, None)]
+    for key in candidates:
+        if key in supported_accounts:
+            return supported_accounts[key]
+    return None
+
+
+def _get_type_values(api_cls):
+    values = {None, 0, 99999, *map(int, ProviderType), *map(int, ServiceType)}
+    for key in api_cls.SUPPORTED_ACCOUNTS:
+        values.update(key)
+    return values
+
+
+@pytest.mark.parametrize("api_cls", API_CLASSES, ids=lambda x: x.__name__)
+def test_supported_account_resolution_matrix(api_cls):
+    values = _get_type_values(api_cls)
+    for provider_type, service_type, with_fallbacks in itertools.product(
+        values, values, (True, False)
+    ):
+        assert api_cls.get_supported_account(
+            provider_type, service_type, with_fallbacks
+        ) is _resolve_reference(api_cls, provider_type, service_type, with_fallbacks), (
+            provider_type,
+            service_type,
+            with_fallbacks,
+        )
+
+
+def test_supported_account_service_fallback_and_registration():
+    class TestAPI(MoscowEnergosbytAPI):
+        pass
+
+    class ServiceAccount(Account):
+        pass
+
+    assert TestAPI.get_supported_account(12345, 77) is Account
+
+    # Registration on a base class is visible through subclasses
+    MoscowEnergosbytAPI.register_supported_account(ServiceAccount, service_type=77)
+    try:
+        assert TestAPI.get_supported_account(12345, 77) is ServiceAccount
+        assert TestAPI.get_supported_account(None, 77) is ServiceAccount
+        assert TestAPI.get_supported_account(12345, 77, with_fallbacks=False) is None
+    finally:
+        assert MoscowEnergosbytAPI.unregister_supported_account(service_type=77) is ServiceAccount
+
+    assert TestAPI.get_supported_account(12345, 77) is Account
+
+
+def test_direct_registry_changes_are_detected():
+    class TestAPI(MoscowEnergosbytAPI):
+        pass
+
+    class ServiceAccount(Account):
+        pass
+
+    assert TestAPI.get_supported_account(12345, 78) is Account
+
+    MoscowEnergosbytAPI.SUPPORTED_ACCOUNTS[(None, 78)] = ServiceAccount
+    try:
+        assert TestAPI.get_supported_account(12345, 78) is ServiceAccount
+    finally:
+        del MoscowEnergosbytAPI.SUPPORTED_ACCOUNTS[(None, 78)]
+
+    assert TestAPI.get_supported_account(12345, 78) is Account
+
+    original_accounts = TestAPI.SUPPORTED_ACCOUNTS
+    TestAPI.SUPPORTED_ACCOUNTS = {(None, None): ServiceAccount}
+    try:
+        assert TestAPI.get_supported_account(12345, 78) is ServiceAccount
+    finally:
+        TestAPI.SUPPORTED_ACCOUNTS = original_accounts
+
+    assert TestAPI.get_supported_account(12345, 78) is Account
@@ -0,0 +1,107 @@
+import pytest
+
+from inter_rao_energosbyt import util
+from inter_rao_energosbyt.actions.sql.abonent import (
+    AbonentChargeDetail,
+    AbonentChargeDetailInvoice,
+    AbonentChargeDetailService,
+)
+from inter_rao_energosbyt.util import (
+    extrapolate_zone_id,
+    register_zone_id_synonyms,
+    resolve_zone_id,
+)
+
+
+@pytest.fixture
+def zone_id_index(monkeypatch):
+    # Synonyms registered by tests must not leak into other tests
+    index_copy = [(zone_id, list(options)) for zone_id, options in util._zone_id_search_index]
+    monkeypatch.setattr(util, "_zone_id_search_index", index_copy)
+    monkeypatch.setattr(util, "_zone_id_matcher", None)
+    resolve_zone_id.cache_clear()
+    yield
+    resolve_zone_id.cache_clear()
+
+
+def _service(name, volume):
+    return {"nm_service": name, "nm_measure_unit": "kWh", "vl_charged_volume": volume}
+
+
+def test_charge_detail_tree_is_walked_in_pre_order():
+    details = AbonentChargeDetail.from_response(
+        {
+            "dt_create": "2023-01-01T00:00:00",
+            "dt_period": "2023-01-01T00:00:00",
+            "kd_child_type": 1,
+            "child": [
+                {
+                    "kd_child_type": 3,
+                    "vl_report_uuid": "first",
+                    "child": [_service("День", 10), _service("Ночь", 5)],
+                },
+                {"vl_report_uuid": "second"},
+            ],
+        }
+    )
+
+    nodes = list(details.iter_tree())
+    assert [(len(path), type(node)) for path, node in nodes] == [
+        (0, AbonentChargeDetail),
+        (1, AbonentChargeDetailInvoice),
+        (2, AbonentChargeDetailService),
+        (2, AbonentChargeDetailService),
+        (1, AbonentChargeDetailInvoice),
+    ]
+    assert [node.nm_service for _, node in nodes[2:4]] == ["День", "Ночь"]
+    assert nodes[2][0] == (details, details.child[0])
+    # Siblings share their ancestors path
+    assert nodes[2][0] is nodes[3][0]
+
+
+def test_zone_id_resolution_is_memoized(zone_id_index):
+    assert resolve_zone_id("Электроэнергия ночь") == "t2"
+    assert resolve_zone_id("Электроэнергия ночь") == "t2"
+
+    cache_info = resolve_zone_id.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (1, 1)
+
+
+def test_synonyms_registration_invalidates_resolution(zone_id_index):
+    assert resolve_zone_id("Вывоз отходов") == "vyvoz_otkhodov"
+
+    register_zone_id_synonyms("garbage", "отход")
+
+    assert resolve_zone_id("Вывоз отходов") == "garbage"
+    assert extrapolate_zone_id("Вывоз отходов") == "garbage"
+
+
+@pytest.mark.parametrize(
+    "service_name, zone_id",
+    [
+        ("Электроэнергия полупик", "t3"),
+        ("Электроэнергия пик", "t1"),
+        ("Электроэнергия ночь", "t2"),
+        ("Электроэнергия однотарифный", "t1"),
+        ("Горячее водоснабжение", "water_hot"),
+        ("Электроэнергия", "electricity"),
+    ],
+)
+def test_zone_id_priorities(zone_id_index, service_name, zone_id):
+    assert extrapolate_zone_id(service_name) == zone_id
+
+
+def test_unknown_service_names_use_default(zone_id_index):
+    assert extrapolate_zone_id("Домофон", "other") == "other"
+
+
+def test_new_zone_ids_are_matched_after_existing_ones(zone_id_index):
+    register_zone_id_synonyms("heating", "Отопл")
+    assert util._zone_id_matcher is None
+
+    assert extrapolate_zone_id("Отопление") == "heating"
+    assert extrapolate_zone_id("Отопление горячей водой") == "water_hot"
+
+    # Synonyms of known zone IDs keep their priority
+    register_zone_id_synonyms("t2", "льготн")
+    assert extrapolate_zone_id("Электроэнергия льготная") == "t2"